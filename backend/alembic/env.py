@@ -22,6 +22,10 @@ from app.models import user
 from app.models import grant
 from app.models import profile
 from app.models import project
+from app.models import talent_pool
+from app.models import change_tombstone
+from app.models import admin_job
+from app.models import audit_log
 
 target_metadata = Base.metadata
 
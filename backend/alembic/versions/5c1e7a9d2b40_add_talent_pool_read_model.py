@@ -0,0 +1,76 @@
+"""add_talent_pool_read_model
+
+Revision ID: 5c1e7a9d2b40
+Revises: de939ccf01ad
+Create Date: 2026-10-19 09:12:03.418220
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5c1e7a9d2b40'
+down_revision: Union[str, None] = 'de939ccf01ad'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# The 'userrole' type already exists (created with the users table).
+user_role_enum = postgresql.ENUM(name='userrole', create_type=False)
+
+
+def upgrade() -> None:
+    """Create the denormalized talent-pool table and backfill it."""
+    op.create_table('talent_pool_entries',
+        sa.Column('profile_id', sa.Integer(), nullable=False),
+        sa.Column('user_id', sa.Integer(), nullable=False),
+        sa.Column('wallet_address', sa.String(length=42), nullable=False),
+        sa.Column('full_name', sa.String(), nullable=True),
+        sa.Column('role', user_role_enum, nullable=False),
+        sa.Column('is_active', sa.Boolean(), nullable=False),
+        sa.Column('user_created_at', sa.DateTime(timezone=True), nullable=True),
+        sa.Column('avatar_url', sa.String(), nullable=True),
+        sa.Column('current_role', sa.String(), nullable=True),
+        sa.Column('headline', sa.String(), nullable=True),
+        sa.Column('skills', postgresql.ARRAY(sa.String()), nullable=True),
+        sa.Column('research_interests', postgresql.ARRAY(sa.String()), nullable=True),
+        sa.Column('experience_count', sa.Integer(), nullable=False),
+        sa.Column('education_count', sa.Integer(), nullable=False),
+        sa.Column('publication_count', sa.Integer(), nullable=False),
+        sa.Column('refreshed_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+        sa.ForeignKeyConstraint(['profile_id'], ['profiles.id'], ondelete='CASCADE'),
+        sa.ForeignKeyConstraint(['user_id'], ['users.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('profile_id'),
+        sa.UniqueConstraint('user_id'),
+    )
+    op.create_index(op.f('ix_talent_pool_entries_user_id'), 'talent_pool_entries', ['user_id'], unique=False)
+    op.create_index(op.f('ix_talent_pool_entries_refreshed_at'), 'talent_pool_entries', ['refreshed_at'], unique=False)
+
+    # Backfill from the existing visible profiles (same projection as crud.talent_pool).
+    op.execute("""
+    INSERT INTO talent_pool_entries (
+        profile_id, user_id, wallet_address, full_name, role, is_active, user_created_at,
+        avatar_url, "current_role", headline, skills, research_interests,
+        experience_count, education_count, publication_count, refreshed_at
+    )
+    SELECT
+        p.id, p.user_id, u.wallet_address, u.full_name, u.role, COALESCE(u.is_active, TRUE), u.created_at,
+        p.avatar_url, p."current_role", p.headline, p.skills, p.research_interests,
+        (SELECT count(*) FROM experiences e WHERE e.profile_id = p.id),
+        (SELECT count(*) FROM educations ed WHERE ed.profile_id = p.id),
+        (SELECT count(*) FROM publications pub WHERE pub.profile_id = p.id),
+        clock_timestamp()
+    FROM profiles p
+    JOIN users u ON u.id = p.user_id
+    WHERE p.is_visible_in_talent_pool = TRUE
+    """)
+
+
+def downgrade() -> None:
+    """Drop the talent-pool read model."""
+    op.drop_index(op.f('ix_talent_pool_entries_refreshed_at'), table_name='talent_pool_entries')
+    op.drop_index(op.f('ix_talent_pool_entries_user_id'), table_name='talent_pool_entries')
+    op.drop_table('talent_pool_entries')
@@ -0,0 +1,62 @@
+"""add_full_text_search_vectors
+
+Revision ID: 8e3f0b6a1c27
+Revises: 5c1e7a9d2b40
+Create Date: 2026-10-19 11:40:27.905113
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = '8e3f0b6a1c27'
+down_revision: Union[str, None] = '5c1e7a9d2b40'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Same expressions as the *_SEARCH_VECTOR_SQL constants on the models at this revision.
+SEARCH_VECTORS = (
+    ('grants', (
+        "setweight(to_tsvector('english', coalesce(title, '')), 'A') || "
+        "setweight(to_tsvector('english', coalesce(description, '')), 'B') || "
+        "setweight(to_tsvector('english', coalesce(eligibility_criteria, '')), 'C')"
+    )),
+    ('projects', (
+        "setweight(to_tsvector('english', coalesce(title, '')), 'A') || "
+        "setweight(to_tsvector('english', coalesce(immutable_array_to_string(required_skills::text[], ' '), '')), 'B') || "
+        "setweight(to_tsvector('english', coalesce(description, '')), 'C')"
+    )),
+    ('profiles', (
+        "setweight(to_tsvector('english', coalesce(headline, '')), 'A') || "
+        "setweight(to_tsvector('english', coalesce(immutable_array_to_string(skills::text[], ' '), '')), 'B') || "
+        "setweight(to_tsvector('english', coalesce(immutable_array_to_string(research_interests::text[], ' '), '')), 'B') || "
+        "setweight(to_tsvector('english', coalesce(about, '')), 'C')"
+    )),
+)
+
+
+def upgrade() -> None:
+    """Add weighted tsvector generated columns with GIN indexes for full-text search."""
+    # Generated columns only accept IMMUTABLE expressions; array_to_string() is STABLE.
+    op.execute(
+        "CREATE OR REPLACE FUNCTION immutable_array_to_string(text[], text) "
+        "RETURNS text LANGUAGE sql IMMUTABLE PARALLEL SAFE "
+        "AS $$ SELECT array_to_string($1, $2) $$"
+    )
+    for table, expression in SEARCH_VECTORS:
+        op.add_column(table, sa.Column(
+            'search_vector', postgresql.TSVECTOR(), sa.Computed(expression, persisted=True), nullable=True,
+        ))
+        op.create_index(f'ix_{table}_search_vector', table, ['search_vector'], unique=False, postgresql_using='gin')
+
+
+def downgrade() -> None:
+    """Drop the full-text search columns, indexes and helper function."""
+    for table, _ in reversed(SEARCH_VECTORS):
+        op.drop_index(f'ix_{table}_search_vector', table_name=table)
+        op.drop_column(table, 'search_vector')
+    op.execute("DROP FUNCTION IF EXISTS immutable_array_to_string(text[], text)")
@@ -0,0 +1,46 @@
+"""add_audit_log
+
+Revision ID: a7e1d5c3b962
+Revises: f4a9c2e7b158
+Create Date: 2026-10-19 23:41:37.508214
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a7e1d5c3b962'
+down_revision: Union[str, None] = 'f4a9c2e7b158'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Add the audit_log table written by the batched audit log writer."""
+    op.create_table('audit_log',
+        sa.Column('id', sa.BigInteger(), nullable=False),
+        sa.Column('occurred_at', sa.DateTime(timezone=True), nullable=False),
+        sa.Column('actor_id', sa.Integer(), nullable=True),
+        sa.Column('source', sa.String(length=16), nullable=False),
+        sa.Column('action', sa.String(length=16), nullable=False),
+        sa.Column('table_name', sa.String(length=64), nullable=False),
+        sa.Column('row_id', sa.String(length=64), nullable=True),
+        sa.Column('before', sa.JSON(), nullable=True),
+        sa.Column('after', sa.JSON(), nullable=True),
+        sa.Column('details', sa.JSON(), nullable=True),
+        sa.PrimaryKeyConstraint('id'),
+    )
+    op.create_index(op.f('ix_audit_log_occurred_at'), 'audit_log', ['occurred_at'], unique=False)
+    op.create_index(op.f('ix_audit_log_actor_id'), 'audit_log', ['actor_id'], unique=False)
+    op.create_index('ix_audit_log_table_row', 'audit_log', ['table_name', 'row_id', 'id'], unique=False)
+
+
+def downgrade() -> None:
+    """Drop the audit_log table."""
+    op.drop_index('ix_audit_log_table_row', table_name='audit_log')
+    op.drop_index(op.f('ix_audit_log_actor_id'), table_name='audit_log')
+    op.drop_index(op.f('ix_audit_log_occurred_at'), table_name='audit_log')
+    op.drop_table('audit_log')
@@ -0,0 +1,37 @@
+"""add_trigram_autocomplete_indexes
+
+Revision ID: b47d2e9c0f13
+Revises: 8e3f0b6a1c27
+Create Date: 2026-10-19 13:05:51.274630
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b47d2e9c0f13'
+down_revision: Union[str, None] = '8e3f0b6a1c27'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+TRIGRAM_INDEXES = (
+    ('ix_experiences_institution_trgm', 'experiences', 'institution'),
+    ('ix_educations_institution_trgm', 'educations', 'institution'),
+    ('ix_grants_title_trgm', 'grants', 'title'),
+)
+
+
+def upgrade() -> None:
+    """Enable pg_trgm and add trigram GIN indexes for fuzzy autocomplete."""
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    for name, table, column in TRIGRAM_INDEXES:
+        op.create_index(name, table, [column], unique=False,
+                        postgresql_using='gin', postgresql_ops={column: 'gin_trgm_ops'})
+
+
+def downgrade() -> None:
+    """Drop the trigram indexes (the pg_trgm extension is left installed)."""
+    for name, table, _ in reversed(TRIGRAM_INDEXES):
+        op.drop_index(name, table_name=table)
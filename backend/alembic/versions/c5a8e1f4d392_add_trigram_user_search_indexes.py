@@ -0,0 +1,33 @@
+"""add_trigram_user_search_indexes
+
+Revision ID: c5a8e1f4d392
+Revises: b47d2e9c0f13
+Create Date: 2026-10-19 14:21:09.553812
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c5a8e1f4d392'
+down_revision: Union[str, None] = 'b47d2e9c0f13'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+USER_SEARCH_COLUMNS = ('full_name', 'email', 'wallet_address')
+
+
+def upgrade() -> None:
+    """Add trigram GIN indexes backing /users/search."""
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    for column in USER_SEARCH_COLUMNS:
+        op.create_index(f'ix_users_{column}_trgm', 'users', [column], unique=False,
+                        postgresql_using='gin', postgresql_ops={column: 'gin_trgm_ops'})
+
+
+def downgrade() -> None:
+    """Drop the user search trigram indexes."""
+    for column in reversed(USER_SEARCH_COLUMNS):
+        op.drop_index(f'ix_users_{column}_trgm', table_name='users')
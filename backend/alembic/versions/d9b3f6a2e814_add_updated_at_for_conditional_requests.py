@@ -0,0 +1,42 @@
+"""add_updated_at_for_conditional_requests
+
+Revision ID: d9b3f6a2e814
+Revises: c5a8e1f4d392
+Create Date: 2026-10-19 15:47:33.160294
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd9b3f6a2e814'
+down_revision: Union[str, None] = 'c5a8e1f4d392'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Tables nested into grant/project/user/profile responses that had no modification stamp.
+NEW_UPDATED_AT_TABLES = (
+    'profiles', 'experiences', 'educations', 'publications',
+    'grant_milestones', 'grant_applications', 'project_team_members',
+)
+# Tables whose table-wide max(updated_at) is part of the list validators.
+INDEXED_UPDATED_AT_TABLES = ('grants', 'projects', 'users')
+
+
+def upgrade() -> None:
+    """Add updated_at to nested tables and index updated_at on the listed tables."""
+    for table in NEW_UPDATED_AT_TABLES:
+        op.add_column(table, sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=True))
+    for table in INDEXED_UPDATED_AT_TABLES:
+        op.create_index(op.f(f'ix_{table}_updated_at'), table, ['updated_at'], unique=False)
+
+
+def downgrade() -> None:
+    """Drop the updated_at indexes and columns."""
+    for table in reversed(INDEXED_UPDATED_AT_TABLES):
+        op.drop_index(op.f(f'ix_{table}_updated_at'), table_name=table)
+    for table in reversed(NEW_UPDATED_AT_TABLES):
+        op.drop_column(table, 'updated_at')
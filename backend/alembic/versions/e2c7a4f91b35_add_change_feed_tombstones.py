@@ -0,0 +1,78 @@
+"""add_change_feed_tombstones
+
+Revision ID: e2c7a4f91b35
+Revises: d9b3f6a2e814
+Create Date: 2026-10-19 18:21:40.517903
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e2c7a4f91b35'
+down_revision: Union[str, None] = 'd9b3f6a2e814'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# (table, feed entity) pairs whose deletes are recorded as tombstones.
+TOMBSTONE_TABLES = (
+    ('grants', 'grant'),
+    ('projects', 'project'),
+    ('grant_applications', 'grant_application'),
+    ('project_applications', 'project_application'),
+    ('profiles', 'profile'),
+)
+# Fed tables whose updated_at was not indexed yet.
+NEW_UPDATED_AT_INDEXES = ('grant_applications', 'project_applications', 'profiles')
+
+
+def upgrade() -> None:
+    """Add the tombstone table and delete triggers, and the columns/indexes the feed scans."""
+    op.add_column('project_applications', sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=True))
+    op.add_column('project_applications', sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=True))
+    op.add_column('profiles', sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=True))
+    for table in NEW_UPDATED_AT_INDEXES:
+        op.create_index(op.f(f'ix_{table}_updated_at'), table, ['updated_at'], unique=False)
+
+    op.create_table('change_tombstones',
+        sa.Column('id', sa.BigInteger(), nullable=False),
+        sa.Column('entity', sa.String(length=32), nullable=False),
+        sa.Column('entity_id', sa.Integer(), nullable=False),
+        sa.Column('deleted_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+        sa.PrimaryKeyConstraint('id'),
+    )
+    op.create_index('ix_change_tombstones_deleted_at_id', 'change_tombstones', ['deleted_at', 'id'], unique=False)
+
+    op.execute("""
+    CREATE OR REPLACE FUNCTION record_change_tombstone() RETURNS trigger
+    LANGUAGE plpgsql AS $$
+    BEGIN
+        INSERT INTO change_tombstones (entity, entity_id) VALUES (TG_ARGV[0], OLD.id);
+        RETURN OLD;
+    END
+    $$
+    """)
+    for table, entity in TOMBSTONE_TABLES:
+        op.execute(
+            f"CREATE TRIGGER trg_{table}_change_tombstone AFTER DELETE ON {table} "
+            f"FOR EACH ROW EXECUTE FUNCTION record_change_tombstone('{entity}')"
+        )
+
+
+def downgrade() -> None:
+    """Drop the triggers, tombstone table, indexes and columns."""
+    for table, _ in reversed(TOMBSTONE_TABLES):
+        op.execute(f"DROP TRIGGER IF EXISTS trg_{table}_change_tombstone ON {table}")
+    op.execute("DROP FUNCTION IF EXISTS record_change_tombstone()")
+
+    op.drop_index('ix_change_tombstones_deleted_at_id', table_name='change_tombstones')
+    op.drop_table('change_tombstones')
+
+    for table in reversed(NEW_UPDATED_AT_INDEXES):
+        op.drop_index(op.f(f'ix_{table}_updated_at'), table_name=table)
+    op.drop_column('profiles', 'created_at')
+    op.drop_column('project_applications', 'updated_at')
+    op.drop_column('project_applications', 'created_at')
@@ -0,0 +1,55 @@
+"""add_admin_jobs
+
+Revision ID: f4a9c2e7b158
+Revises: e2c7a4f91b35
+Create Date: 2026-10-19 21:04:12.381926
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f4a9c2e7b158'
+down_revision: Union[str, None] = 'e2c7a4f91b35'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+ADMIN_JOB_STATUSES = ('QUEUED', 'RUNNING', 'SUCCEEDED', 'FAILED', 'CANCELLED')
+
+
+def upgrade() -> None:
+    """Add the admin_jobs table backing the background job runner."""
+    op.create_table('admin_jobs',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('kind', sa.String(length=64), nullable=False),
+        sa.Column('status', sa.Enum(*ADMIN_JOB_STATUSES, name='adminjobstatus'), nullable=False),
+        sa.Column('params', sa.JSON(), nullable=True),
+        sa.Column('progress_current', sa.Integer(), nullable=False),
+        sa.Column('progress_total', sa.Integer(), nullable=True),
+        sa.Column('message', sa.String(length=255), nullable=True),
+        sa.Column('result', sa.JSON(), nullable=True),
+        sa.Column('error', sa.Text(), nullable=True),
+        sa.Column('cancel_requested', sa.Boolean(), nullable=False),
+        sa.Column('created_by_id', sa.Integer(), nullable=True),
+        sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=True),
+        sa.Column('started_at', sa.DateTime(timezone=True), nullable=True),
+        sa.Column('finished_at', sa.DateTime(timezone=True), nullable=True),
+        sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=True),
+        sa.ForeignKeyConstraint(['created_by_id'], ['users.id'], ondelete='SET NULL'),
+        sa.PrimaryKeyConstraint('id'),
+    )
+    op.create_index(op.f('ix_admin_jobs_id'), 'admin_jobs', ['id'], unique=False)
+    op.create_index(op.f('ix_admin_jobs_status'), 'admin_jobs', ['status'], unique=False)
+    op.create_index(op.f('ix_admin_jobs_created_by_id'), 'admin_jobs', ['created_by_id'], unique=False)
+
+
+def downgrade() -> None:
+    """Drop the admin_jobs table and its status type."""
+    op.drop_index(op.f('ix_admin_jobs_created_by_id'), table_name='admin_jobs')
+    op.drop_index(op.f('ix_admin_jobs_status'), table_name='admin_jobs')
+    op.drop_index(op.f('ix_admin_jobs_id'), table_name='admin_jobs')
+    op.drop_table('admin_jobs')
+    sa.Enum(name='adminjobstatus').drop(op.get_bind(), checkfirst=True)
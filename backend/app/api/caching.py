@@ -0,0 +1,47 @@
+# backend/app/api/caching.py
+from email.utils import parsedate_to_datetime
+from typing import Callable, Dict, Sequence
+
+from fastapi import Request, Response
+
+from app.api.conditional import not_modified
+from app.services.response_cache import cache_key, response_cache
+from app.services.single_flight import single_flight
+
+def _not_modified(request: Request, headers: Dict[str, str]) -> bool:
+    last_modified = headers.get("Last-Modified")
+    return not_modified(request, headers.get("ETag"), parsedate_to_datetime(last_modified) if last_modified else None)
+
+def serve_cached(
+    request: Request,
+    tags: Sequence[str],
+    validators: Callable[[], Dict[str, str]],
+    render: Callable[[], bytes],
+) -> Response:
+    """
+    Serve a public GET from the response cache.
+
+    On a miss, `validators` runs first (the cheap freshness query; it may raise, e.g. a 404)
+    and a matching If-None-Match/If-Modified-Since gets a 304 without rendering the body.
+    Otherwise `render` produces the JSON body, which is cached with the validator headers.
+    Concurrent renders for the same URL (and tag versions) are coalesced: one request runs
+    `render`, the others wait for it and share the bytes, or its exception.
+    """
+    key = cache_key(request.method, request.url.path, request.query_params.multi_items())
+    entry, versions = response_cache.lookup(key, tags)
+    if entry is not None:
+        body, headers = entry.body, entry.headers
+    else:
+        headers = validators()
+
+    if _not_modified(request, headers):
+        return Response(status_code=304, headers=headers)
+    if entry is None:
+        def compute() -> bytes:
+            body = render()
+            response_cache.store(key, versions, body, headers)
+            return body
+
+        # Requests that saw newer tag versions must not share a body computed before the write.
+        body, _ = single_flight.do((key, versions), compute)
+    return Response(content=body, media_type="application/json", headers=headers)
@@ -0,0 +1,94 @@
+# backend/app/api/conditional.py
+import hashlib
+from datetime import datetime, timezone
+from email.utils import format_datetime, parsedate_to_datetime
+from typing import Any, Dict, Optional
+
+from fastapi import Request, Response
+
+from app.crud.crud_freshness import Freshness
+
+# Bump when a response schema changes shape, so clients drop bodies cached under old ETags.
+SCHEMA_VERSION = 1
+
+def make_etag(freshness: Freshness, *scope: Any) -> str:
+    """Weak ETag over the validator and anything else the body depends on (query params, viewer)."""
+    last_modified = freshness.last_modified.isoformat() if freshness.last_modified else ""
+    raw = repr((SCHEMA_VERSION, last_modified, freshness.row_count, scope)).encode()
+    return f'W/"{hashlib.blake2b(raw, digest_size=16).hexdigest()}"'
+
+def body_etag(body: bytes) -> str:
+    """Weak ETag over a fixed, pre-serialized body."""
+    return f'W/"{hashlib.blake2b(bytes([SCHEMA_VERSION]) + body, digest_size=16).hexdigest()}"'
+
+def _etag_matches(header: str, etag: str) -> bool:
+    if header.strip() == "*":
+        return True
+    opaque = etag.removeprefix("W/")
+    return any(candidate.strip().removeprefix("W/") == opaque for candidate in header.split(","))
+
+def _not_modified_since(header: str, last_modified: datetime) -> bool:
+    try:
+        since = parsedate_to_datetime(header)
+    except (TypeError, ValueError):
+        return False
+    if since.tzinfo is None:
+        since = since.replace(tzinfo=timezone.utc)
+    return last_modified.replace(microsecond=0) <= since
+
+def not_modified(request: Request, etag: Optional[str], last_modified: Optional[datetime]) -> bool:
+    """Evaluate If-None-Match (preferred, per RFC 9110) or If-Modified-Since against the validators."""
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        return etag is not None and _etag_matches(if_none_match, etag)
+    if_modified_since = request.headers.get("if-modified-since")
+    return (
+        if_modified_since is not None
+        and last_modified is not None
+        and _not_modified_since(if_modified_since, last_modified)
+    )
+
+def validator_headers(freshness: Freshness, *scope: Any, private: bool = False) -> Dict[str, str]:
+    """ETag/Last-Modified/Cache-Control (and Vary, for per-user bodies) for a response."""
+    headers = {
+        "ETag": make_etag(freshness, *scope),
+        # Always revalidate; a matching revalidation costs one aggregate query and no body.
+        "Cache-Control": "private, no-cache" if private else "no-cache",
+    }
+    if freshness.last_modified is not None:
+        headers["Last-Modified"] = format_datetime(freshness.last_modified.astimezone(timezone.utc), usegmt=True)
+    if private:
+        headers["Vary"] = "Authorization"
+    return headers
+
+def conditional_response(
+    request: Request,
+    response: Response,
+    freshness: Freshness,
+    *scope: Any,
+    private: bool = False,
+) -> Optional[Response]:
+    """
+    Set ETag/Last-Modified/Cache-Control on `response` and, if the request's validators
+    still match, return a bodiless 304 for the endpoint to return instead of loading and
+    serializing anything. If-None-Match takes precedence over If-Modified-Since (RFC 9110);
+    deletes only show in the ETag, since they don't move `max(updated_at)`.
+    """
+    headers = validator_headers(freshness, *scope, private=private)
+    response.headers.update(headers)
+
+    if not_modified(request, headers["ETag"], freshness.last_modified):
+        return Response(status_code=304, headers=headers)
+    return None
+
+def static_response(request: Request, body: bytes, etag: str, *, private: bool = False) -> Response:
+    """
+    Serve a pre-serialized JSON body whose ETag was computed once (`body_etag`): a bodiless
+    304 when If-None-Match matches, else the body itself. Nothing is rendered per request.
+    """
+    headers = {"ETag": etag, "Cache-Control": "private, no-cache" if private else "no-cache"}
+    if private:
+        headers["Vary"] = "Authorization"
+    if not_modified(request, etag, None):
+        return Response(status_code=304, headers=headers)
+    return Response(content=body, media_type="application/json", headers=headers)
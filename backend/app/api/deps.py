@@ -8,6 +8,7 @@ from sqlalchemy.orm import Session
 
 from app.core.config import settings
 from app.db.session import get_db
+from app.services.audit import audit_log
 # ALGORITHM is used via settings.ALGORITHM
 
 import logging
@@ -69,6 +70,8 @@ def get_current_user(
     if user is None:
         logger.warning(f"User not found in DB for wallet_address from token: {wallet_address_from_token}")
         raise credentials_exception
+
+    audit_log.set_actor(db, user.id) # Audited writes in this request are attributed to the user
     
     # logger.info(f"User {user.wallet_address} authenticated via token.") # Optional info log
     return user
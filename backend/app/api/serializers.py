@@ -0,0 +1,47 @@
+# backend/app/api/serializers.py
+from typing import Any, List, Optional
+
+from fastapi import Response
+from pydantic import TypeAdapter
+
+from app import schemas
+from app.schemas.deferred import LIST_VIEW
+
+# Built once at import; pydantic compiles the validator and serializer for each schema here
+# rather than per request.
+grant = TypeAdapter(schemas.Grant)
+grant_list = TypeAdapter(List[schemas.Grant])
+project = TypeAdapter(schemas.Project)
+project_list = TypeAdapter(List[schemas.Project])
+user = TypeAdapter(schemas.User)
+user_page = TypeAdapter(schemas.UserList) # {"users": [...], "total": n}
+user_list = TypeAdapter(List[schemas.User])
+talent_pool_list = TypeAdapter(List[schemas.TalentPoolUser])
+
+
+def dump_json(adapter: TypeAdapter, content: Any, *, list_view: bool = False) -> bytes:
+    """
+    ORM rows (or dicts) to JSON bytes: one validation against the schema, then pydantic's
+    native serializer. Replaces the response_model round trip (validate, jsonable_encoder,
+    json.dumps) for large responses. With `list_view`, deferred text columns the list
+    query didn't load come out as null (see `schemas.deferred`).
+    """
+    context = {LIST_VIEW: True} if list_view else None
+    return adapter.dump_json(adapter.validate_python(content, from_attributes=True, context=context))
+
+def json_response(
+    adapter: TypeAdapter,
+    content: Any,
+    *,
+    status_code: int = 200,
+    response: Optional[Response] = None,
+    list_view: bool = False,
+) -> Response:
+    """
+    Serialized `content` as a ready Response. Pass the endpoint's injected `response` to keep
+    headers set on it (FastAPI only merges those into bodies it serializes itself).
+    """
+    out = Response(content=dump_json(adapter, content, list_view=list_view), status_code=status_code, media_type="application/json")
+    if response is not None:
+        out.headers.update({k: v for k, v in response.headers.items() if k != "content-length"})
+    return out
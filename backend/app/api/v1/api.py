@@ -1,6 +1,6 @@
 from fastapi import APIRouter
 
-from app.api.v1.endpoints import users, auth, admin, grant, project, profiles
+from app.api.v1.endpoints import users, auth, admin, grant, project, profiles, search, autocomplete, changes, jobs
 
 api_router = APIRouter()
 api_router.include_router(auth.router, prefix="/auth", tags=["auth"])
@@ -9,3 +9,7 @@ api_router.include_router(grant.router, prefix="/grants", tags=["grants"])
 api_router.include_router(project.router, prefix="/projects", tags=["projects"])
 api_router.include_router(admin.router, prefix="/admin-data", tags=["admin-data"])
 api_router.include_router(profiles.router, prefix="/profiles", tags=["profiles"])
+api_router.include_router(search.router, prefix="/search", tags=["search"])
+api_router.include_router(autocomplete.router, prefix="/autocomplete", tags=["autocomplete"])
+api_router.include_router(changes.router, prefix="/changes", tags=["changes"])
+api_router.include_router(jobs.router, prefix="/jobs", tags=["jobs"])
@@ -1,81 +1,143 @@
-from fastapi import APIRouter, Depends, HTTPException, status, Body, Query
+import itertools
+import json
+import tempfile
+from fastapi import APIRouter, Depends, HTTPException, Request, status, Body, Query
+from fastapi.responses import ORJSONResponse, StreamingResponse
+from starlette.concurrency import run_in_threadpool
 from pydantic import BaseModel, Field
 import sqlalchemy
 from sqlalchemy.orm import Session
-from sqlalchemy import func, text, inspect # For dynamic queries and inspection
-from typing import List, Dict, Any, Optional
+from sqlalchemy import func, text # For dynamic queries
+from typing import Callable, List, Dict, Any, Optional, Union
 
 from app.db.session import get_db
 from app.api import deps
+from app.api.conditional import static_response
 from app.models import User # Import one of your models to get Base.metadata for table listing
 from app.db.base_class import Base
 from app import models, schemas, crud
 from app.utils import seeding
+from app.services.response_cache import ALL as ALL_CACHE_TAGS, response_cache
+from app.services.single_flight import single_flight
+from app.services.export import MEDIA_TYPES, ExportFormat, iter_export
+from app.services.table_import import ImportFormat, ImportMode, iter_import, read_import_columns
+from app.services.table_registry import TableInfo, table_registry
+from app.services.table_stats import table_stats
+from app.services.sql_console import explain, iter_query
+from app.services.jobs import JobContext, JobQueueFull, job_runner
+from app.services.audit import audit_log, row_image
+from app.core.config import settings
+from app.utils.bulk_rows import bulk_delete, bulk_insert, bulk_update
+from app.utils.cascade import run_delete
+from app.utils.counting import CountMode, count_rows
+from app.utils.cursor import decode_cursor, encode_cursor
+from app.utils.filters import compile_filter
 
 router = APIRouter()
 
 # --- Helper Functions (can be moved to a utility module) ---
 
-def get_table_metadata(table_name: str):
-    # The calling function (get_table_schema) already ensures that 
-    # table_name is a valid key in Base.metadata.tables.
-    
-    # inspect(TableObject) returns the TableObject itself.
-    table_object = inspect(Base.metadata.tables.get(table_name))
-    
-    # The 'if not table_object:' check is removed as it caused the TypeError
-    # and is redundant here because table_object is guaranteed to be a Table instance.
+def get_table_info(table_name: str) -> TableInfo:
+    """Registry entry for a managed table, or a 404."""
+    info = table_registry.get(table_name)
+    if info is None:
+        raise HTTPException(status_code=404, detail=f"Table '{table_name}' not found.")
+    return info
 
-    # Directly use the table_object to get columns and primary keys.
-    # SQLAlchemy Table objects have .columns and .primary_key attributes.
-    return {
-        "name": table_name,
-        "columns": [{"name": col.name, "type": str(col.type)} for col in table_object.columns],
-        "primary_keys": [pk.name for pk in table_object.primary_key]
-    }
+def parse_row_id(info: TableInfo, row_id_str: str, action: str) -> Any:
+    """A row id from the path, converted by the table's precomputed primary-key parser, or a 400."""
+    if info.primary_key is None:
+        raise HTTPException(status_code=400, detail=f"Table '{info.name}' has no primary key defined for {action}.")
+    try:
+        return info.parse_pk(row_id_str)
+    except ValueError:
+        raise HTTPException(status_code=400, detail=f"Invalid ID format for primary key '{info.primary_key.name}'. Expected type compatible with {info.primary_key.type}.")
+
+def _table_filter(table: sqlalchemy.Table, raw_filter: str):
+    """Parse and compile the `filter` query parameter, as a 400 when it is invalid."""
+    try:
+        return compile_filter(table, json.loads(raw_filter))
+    except ValueError as e: # Includes malformed JSON
+        raise HTTPException(status_code=400, detail=f"Invalid filter: {e}")
+
+def audit_row_delete(db: Session, info: TableInfo, row_id: Any, cascade: bool, report: List[Dict[str, Any]], *, before: Any, actor_id: Optional[int] = None) -> None:
+    """Log a (possibly cascading) row delete: the row's before image, plus the statements run for a cascade."""
+    audit_log.record(
+        db, source="admin", action="delete", table_name=info.name, row_id=row_id,
+        before=row_image(before, info.table), details={"steps": report} if cascade else None, actor_id=actor_id,
+    )
+
+def submit_job(db: Session, current_admin: models.User, kind: str, fn: Callable[[JobContext], Any], params: Dict[str, Any]) -> ORJSONResponse:
+    """Queue `fn` as a background job and answer 202 with where to poll it (503 if the queue is full)."""
+    try:
+        job = job_runner.submit(db, kind, fn, params=params, created_by_id=current_admin.id)
+    except JobQueueFull as e:
+        raise HTTPException(status_code=503, detail=str(e), headers={"Retry-After": "30"})
+    status_url = f"{settings.API_V1_STR}/jobs/{job.id}"
+    return ORJSONResponse(
+        status_code=status.HTTP_202_ACCEPTED,
+        content=schemas.AdminJobAccepted(job_id=job.id, status=job.status, status_url=status_url).model_dump(mode="json"),
+        headers={"Location": status_url},
+    )
 
 # --- Admin Endpoints ---
 
 @router.get("/tables", response_model=List[str])
 async def list_manageable_tables(
-    db: Session = Depends(get_db),
+    request: Request,
     current_admin: models.User = Depends(deps.get_current_active_superuser)
 ):
     """
-    List all table names manageable by the admin panel.
-    For security, you might want to return a predefined list rather than all tables.
+    List all table names manageable by the admin panel (all of Base.metadata), from the
+    table registry, with an ETag.
     """
-    # Option 1: List all tables known to SQLAlchemy Base.metadata
-    # Be cautious with this in production; expose only what's necessary.
-    table_names = list(Base.metadata.tables.keys())
-    
-    # Option 2: Define a list of explicitly allowed tables for admin editing
-    # allowed_tables = ["users", "profiles", "grants", "projects"]
-    # table_names = [tbl for tbl in Base.metadata.tables.keys() if tbl in allowed_tables]
-    
-    return sorted(table_names)
+    return static_response(request, table_registry.names_body, table_registry.names_etag, private=True)
 
 
-@router.get("/tables/{table_name}/schema", response_model=Optional[Dict[str, Any]])
-async def get_table_schema(
+@router.get("/tables/stats", response_model=Dict[str, Any])
+def get_table_statistics(
+    db: Session = Depends(get_db),
+    current_admin: models.User = Depends(deps.get_current_active_superuser)
+):
+    """
+    Row estimates, table/index sizes, dead tuples, vacuum/analyze times, sequential vs
+    index scans and per-index usage (`unused`: never scanned and not unique) for every
+    managed table. Cached for a short TTL; see app/services/table_stats.py.
+    """
+    return table_stats.get(db)
+
+@router.get("/tables/{table_name}/stats", response_model=Dict[str, Any])
+def get_single_table_statistics(
     table_name: str,
     db: Session = Depends(get_db),
     current_admin: models.User = Depends(deps.get_current_active_superuser)
 ):
     """
-    Get the schema (columns, types, primary keys) of a specific table.
+    The `/tables/stats` entry for one table.
     """
     if table_name not in Base.metadata.tables:
         raise HTTPException(status_code=404, detail=f"Table '{table_name}' not found.")
-    
-    schema_info = get_table_metadata(table_name)
-    if not schema_info: # Should not happen if previous check passed, but good for safety
-        raise HTTPException(status_code=404, detail=f"Could not inspect schema for table '{table_name}'.")
-    return schema_info
+    snapshot = table_stats.get(db)
+    if table_name not in snapshot["tables"]:
+        raise HTTPException(status_code=404, detail=f"No statistics for table '{table_name}' (does it exist in the database?).")
+    return {"generated_at": snapshot["generated_at"], "stats_since": snapshot["stats_since"], **snapshot["tables"][table_name]}
 
+@router.get("/tables/{table_name}/schema", response_model=Optional[Dict[str, Any]])
+async def get_table_schema(
+    table_name: str,
+    request: Request,
+    current_admin: models.User = Depends(deps.get_current_active_superuser)
+):
+    """
+    Get the schema of a specific table: columns (type, nullability, primary key, computed),
+    primary keys, foreign keys and the foreign keys referencing it. Precomputed at startup
+    and served with an ETag.
+    """
+    info = get_table_info(table_name)
+    return static_response(request, info.schema_body, info.schema_etag, private=True)
 
 @router.get("/tables/{table_name}/data", response_model=Dict[str, Any])
-async def get_table_data(
+def get_table_data(
     table_name: str,
     db: Session = Depends(get_db),
     current_admin: models.User = Depends(deps.get_current_active_superuser),
@@ -83,19 +145,29 @@ async def get_table_data(
     page_size: int = 20,
     sort_by: Optional[str] = None,
     sort_desc: bool = False,
-    # TODO: Add filtering capabilities based on query parameters
-    # For example: filter_column: Optional[str] = None, filter_value: Optional[str] = None
+    filter: Optional[str] = Query(None, description="JSON filter, e.g. {\"column\": \"status\", \"op\": \"eq\", \"value\": \"OPEN\"}; see app/utils/filters.py"),
+    count: CountMode = Query("auto", description="auto, exact, estimated or none; see app/utils/counting.py"),
+    after: Optional[str] = Query(None, description="Keyset cursor (next_after of the previous page); replaces page"),
 ):
     """
-    Fetch paginated and sorted data from a specific table.
+    Fetch paginated and sorted data from a specific table, optionally filtered.
+
+    `has_more` comes from fetching one row past the page, so paging works without a
+    count. When rows are ordered by a single-column primary key (the default), each page
+    also returns `next_after`; passing it back as `after` seeks on the primary key
+    instead of skipping `offset` rows, so deep pages cost the same as the first.
     """
     if table_name not in Base.metadata.tables:
         raise HTTPException(status_code=404, detail=f"Table '{table_name}' not found.")
 
     table = Base.metadata.tables[table_name]
     
-    query = db.query(table) # Query the raw table object
+    query = sqlalchemy.select(table)
+    if filter:
+        query = query.where(_table_filter(table, filter))
 
+    pk_columns = [pk for pk in table.primary_key.columns]
+    keyset_column = pk_columns[0] if len(pk_columns) == 1 else None
     # Sorting (basic example, ensure sort_by is a valid column name to prevent SQL injection)
     if sort_by:
         if sort_by not in table.columns:
@@ -105,31 +177,112 @@ async def get_table_data(
             query = query.order_by(column_to_sort.desc())
         else:
             query = query.order_by(column_to_sort.asc())
+        if keyset_column is not None and column_to_sort is not keyset_column:
+            keyset_column = None
     else: # Default sort by primary key if available and single
-        pk_columns = [pk for pk in table.primary_key.columns]
-        if pk_columns and len(pk_columns) == 1:
-             query = query.order_by(pk_columns[0].asc())
+        sort_desc = False
+        if keyset_column is not None:
+             query = query.order_by(keyset_column.asc())
 
+    total_count, count_exact = count_rows(db, query, table, mode=count, filtered=bool(filter))
 
-    total_count = query.count() # Get total count before pagination for accurate total
-    
     # Pagination
-    offset = (page - 1) * page_size
-    rows_sqlalchemy_proxy = query.offset(offset).limit(page_size).all()
+    if after:
+        if keyset_column is None:
+            raise HTTPException(status_code=400, detail="'after' needs rows ordered by a single-column primary key.")
+        try:
+            (after_value,) = decode_cursor(after, length=1)
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+        if not isinstance(after_value, keyset_column.type.python_type):
+            raise HTTPException(status_code=400, detail="Malformed cursor.")
+        query = query.where(keyset_column < after_value if sort_desc else keyset_column > after_value)
+    else:
+        query = query.offset((page - 1) * page_size)
+    rows_sqlalchemy_proxy = db.execute(query.limit(page_size + 1)).all()
+    has_more = len(rows_sqlalchemy_proxy) > page_size
     
     # Convert SQLAlchemy RowProxy objects to dictionaries
     # This is important because RowProxy objects aren't directly JSON serializable by default in all contexts
     # although FastAPI can often handle them. Being explicit is safer.
-    rows = [dict(row._mapping) for row in rows_sqlalchemy_proxy] # _mapping gives a dict-like view
+    rows = [dict(row._mapping) for row in rows_sqlalchemy_proxy[:page_size]] # _mapping gives a dict-like view
+    next_after = None
+    if has_more and keyset_column is not None:
+        next_after = encode_cursor([rows[-1][keyset_column.name]])
 
     return {
         "table_name": table_name,
         "total_rows": total_count,
+        "total_rows_exact": count_exact,
         "page": page,
         "page_size": page_size,
+        "has_more": has_more,
+        "next_after": next_after,
         "data": rows
     }
 
+@router.get("/tables/{table_name}/export")
+def export_table_data(
+    table_name: str,
+    format: ExportFormat = Query("ndjson", description="ndjson (one JSON object per line) or csv"),
+    filter: Optional[str] = Query(None, description="JSON filter, as for the table data endpoint"),
+    current_admin: models.User = Depends(deps.get_current_active_superuser),
+):
+    """
+    Stream a dump of a table (e.g. grant_applications, project_applications) in
+    primary-key order, optionally filtered. Generated search columns are left out.
+    """
+    if table_name not in Base.metadata.tables:
+        raise HTTPException(status_code=404, detail=f"Table '{table_name}' not found.")
+
+    table = Base.metadata.tables[table_name]
+    stmt = sqlalchemy.select(*[col for col in table.columns if col.computed is None]).order_by(*table.primary_key.columns)
+    if filter:
+        stmt = stmt.where(_table_filter(table, filter))
+    return StreamingResponse(
+        iter_export(stmt, format),
+        media_type=MEDIA_TYPES[format],
+        headers={"Content-Disposition": f'attachment; filename="{table_name}.{format}"'},
+    )
+
+@router.post("/tables/{table_name}/import")
+async def import_table_data(
+    table_name: str,
+    request: Request,
+    format: ImportFormat = Query("csv", description="csv (with a header row) or ndjson (one JSON object per line)"),
+    mode: ImportMode = Query("insert", description="insert, or upsert to update rows whose primary key exists"),
+    current_admin: models.User = Depends(deps.get_current_active_superuser),
+):
+    """
+    Bulk-load the request body (the raw file, e.g. `curl --data-binary @catalogue.csv`)
+    into a table with COPY, in one transaction. Columns come from the CSV header or the
+    first NDJSON object and are checked before loading. The response streams NDJSON
+    progress lines and ends with {"stage": "done", ...} or {"stage": "error", ...}.
+    """
+    if table_name not in Base.metadata.tables:
+        raise HTTPException(status_code=404, detail=f"Table '{table_name}' not found.")
+    table = Base.metadata.tables[table_name]
+    actor_id = current_admin.id # Read now: the import runs in its own session
+
+    # Spool the upload (to disk past a few MB) so COPY can read it at its own pace.
+    upload = tempfile.SpooledTemporaryFile(max_size=8 * 1024 * 1024)
+    size = 0
+    async for chunk in request.stream():
+        await run_in_threadpool(upload.write, chunk)
+        size += len(chunk)
+    upload.seek(0)
+    try:
+        if not size:
+            raise ValueError("The upload is empty.")
+        columns = read_import_columns(table, upload, format, mode)
+    except ValueError as e:
+        upload.close()
+        raise HTTPException(status_code=400, detail=str(e))
+    return StreamingResponse(
+        iter_import(table, upload, size, columns, format, mode, actor_id=actor_id),
+        media_type="application/x-ndjson",
+    )
+
 @router.post("/tables/{table_name}/data", status_code=status.HTTP_201_CREATED, response_model=Dict[str, Any])
 async def create_table_row(
     table_name: str,
@@ -143,11 +296,9 @@ async def create_table_row(
     Create a new row in the specified table.
     Data validation should occur on the frontend or via dynamically generated Pydantic models.
     """
-    if table_name not in Base.metadata.tables:
-        raise HTTPException(status_code=404, detail=f"Table '{table_name}' not found.")
-    
-    table = Base.metadata.tables[table_name]
-    
+    info = get_table_info(table_name)
+    table = info.table
+
     # Basic validation: Ensure all provided keys are actual columns
     valid_columns = {col.name for col in table.columns}
     for key in row_data.keys():
@@ -155,30 +306,17 @@ async def create_table_row(
             raise HTTPException(status_code=400, detail=f"Invalid column '{key}' for table '{table_name}'.")
 
     try:
-        stmt = table.insert().values(**row_data)
-        result = db.execute(stmt)
+        # RETURNING hands back the new row (with its generated ids) for the response and the audit log.
+        stmt = table.insert().values(**row_data).returning(*table.columns)
+        new_row = db.execute(stmt).one()._mapping
+        audit_log.record(
+            db, source="admin", action="insert", table_name=table_name,
+            row_id=new_row[info.primary_key.name] if info.primary_key is not None else None,
+            after=row_image(new_row, table),
+        )
+        response_cache.invalidate_table(db, table_name)
         db.commit()
-        
-        # Fetch the newly created row (especially to get auto-generated IDs)
-        # This assumes a single primary key. If composite, this needs adjustment.
-        pk_columns = [pk.name for pk in table.primary_key.columns]
-        if result.inserted_primary_key and pk_columns:
-            # Assuming single primary key for simplicity
-            # For composite keys, result.inserted_primary_key will be a tuple
-            pk_values = result.inserted_primary_key
-            
-            # Construct a query to fetch the inserted row
-            # For single PK:
-            if len(pk_columns) == 1 and len(pk_values) == 1:
-                select_stmt = table.select().where(table.columns[pk_columns[0]] == pk_values[0])
-                new_row_proxy = db.execute(select_stmt).first()
-                if new_row_proxy:
-                    return dict(new_row_proxy._mapping)
-            # For composite PKs, you'd need to build the where clause with all parts of the composite key
-            # For now, just return the input data or a success message if fetching is complex
-            return {"detail": "Row created successfully", "inserted_primary_key": pk_values, "data_sent": row_data}
-
-        return {"detail": "Row created successfully, but could not retrieve the full new row.", "data_sent": row_data}
+        return dict(new_row)
 
     except Exception as e:
         db.rollback()
@@ -198,33 +336,10 @@ async def update_table_row(
     Assumes a single primary key for simplicity.
     If composite PK, row_id might need to be a JSON string or multiple path/query params.
     """
-    if table_name not in Base.metadata.tables:
-        raise HTTPException(status_code=404, detail=f"Table '{table_name}' not found.")
-
-    table = Base.metadata.tables[table_name]
-    pk_columns = [pk for pk in table.primary_key.columns]
-
-    if not pk_columns:
-        raise HTTPException(status_code=400, detail=f"Table '{table_name}' has no primary key defined for updates.")
-    
-    # For simplicity, assuming single integer PK. Convert row_id_str to the correct type.
-    # This needs to be more robust for different PK types (string, UUID, composite).
-    # Let's assume the first primary key column is the one we use for `row_id_str`.
-    primary_key_column = pk_columns[0]
-    
-    # Attempt to convert row_id_str to the type of the primary key column
-    # This is a very basic type conversion and might need to be more sophisticated
-    try:
-        if isinstance(primary_key_column.type, (sqlalchemy.sql.sqltypes.Integer, sqlalchemy.sql.sqltypes.BigInteger)):
-            row_id_typed = int(row_id_str)
-        elif isinstance(primary_key_column.type, sqlalchemy.sql.sqltypes.String):
-            row_id_typed = str(row_id_str)
-        # Add more type checks if needed (UUID, etc.)
-        else:
-            row_id_typed = row_id_str # Fallback, might not work for all types
-    except ValueError:
-        raise HTTPException(status_code=400, detail=f"Invalid ID format for primary key '{primary_key_column.name}'. Expected type compatible with {primary_key_column.type}.")
-
+    info = get_table_info(table_name)
+    table = info.table
+    row_id_typed = parse_row_id(info, row_id_str, "updates")
+    primary_key_column = info.primary_key
 
     # Basic validation: Ensure all provided keys are actual columns
     valid_columns = {col.name for col in table.columns}
@@ -236,129 +351,261 @@ async def update_table_row(
 
 
     try:
-        stmt = table.update().where(primary_key_column == row_id_typed).values(**row_data)
-        result = db.execute(stmt)
-        
-        if result.rowcount == 0:
+        # Lock and read the row first: its current values are the audit log's before image.
+        old_row = db.execute(table.select().where(primary_key_column == row_id_typed).with_for_update()).first()
+        if old_row is None:
             db.rollback()
             raise HTTPException(status_code=404, detail=f"Row with ID '{row_id_str}' not found in table '{table_name}'.")
-            
+
+        stmt = table.update().where(primary_key_column == row_id_typed).values(**row_data).returning(*table.columns)
+        updated_row = db.execute(stmt).one()._mapping
+        audit_log.record(
+            db, source="admin", action="update", table_name=table_name, row_id=row_id_typed,
+            before=row_image(old_row._mapping, table), after=row_image(updated_row, table),
+        )
+        response_cache.invalidate_table(db, table_name)
         db.commit()
-        
-        # Fetch the updated row
-        select_stmt = table.select().where(primary_key_column == row_id_typed)
-        updated_row_proxy = db.execute(select_stmt).first()
-        if updated_row_proxy:
-            return dict(updated_row_proxy._mapping)
-        return {"detail": "Row updated successfully, but could not retrieve the full updated row."}
+        return dict(updated_row)
 
+    except HTTPException:
+        raise
     except Exception as e:
         db.rollback()
         raise HTTPException(status_code=400, detail=f"Error updating row: {str(e)}")
 
 
 @router.delete("/tables/{table_name}/data/{row_id_str}", status_code=status.HTTP_204_NO_CONTENT)
-async def delete_table_row(
+def delete_table_row(
     table_name: str,
     row_id_str: str, # Assuming single integer PK
     cascade: bool = Query(False, description="Whether to cascade delete dependent records."),
+    dry_run: bool = Query(False, description="Report the rows each statement would affect, without deleting"),
+    background: bool = Query(False, description="Run the delete as a background job and answer 202 with its id"),
     db: Session = Depends(get_db),
     current_admin: models.User = Depends(deps.get_current_active_superuser)
 ):
     """
     Delete a row from the table by its primary key.
     Assumes a single primary key for simplicity.
-    - When cascade=True, will attempt to delete dependent records first
+    - When cascade=True, dependent records are deleted first (nullable references are
+      cleared instead), one set-based statement per table; see app/utils/cascade.py
+    - When dry_run=True, returns the planned statements with their row counts (200)
+    - When background=True, returns 202 with a job to poll under /jobs; the job's result
+      holds the same steps report
     """
-    if table_name not in Base.metadata.tables:
-        raise HTTPException(status_code=404, detail=f"Table '{table_name}' not found.")
+    info = get_table_info(table_name)
+    table = info.table
+    row_id_typed = parse_row_id(info, row_id_str, "deletion")
 
-    table = Base.metadata.tables[table_name]
-    pk_columns = [pk for pk in table.primary_key.columns]
+    if background and not dry_run:
+        actor_id = current_admin.id # Read now: the request session is closed by the time the job runs
 
-    if not pk_columns:
-        raise HTTPException(status_code=400, detail=f"Table '{table_name}' has no primary key defined for deletion.")
+        def delete_job(ctx: JobContext) -> Dict[str, Any]:
+            old_row = ctx.db.execute(table.select().where(info.primary_key == row_id_typed).with_for_update()).first()
+            if old_row is None:
+                raise ValueError(f"Row with ID '{row_id_str}' not found in table '{table_name}'.")
+            report = run_delete(ctx.db, table, row_id_typed, cascade=cascade, progress=ctx.progress)
+            audit_row_delete(ctx.db, info, row_id_typed, cascade, report, before=old_row._mapping, actor_id=actor_id)
+            response_cache.invalidate(ctx.db, [ALL_CACHE_TAGS]) # Bumped when the runner commits
+            return {"table_name": table_name, "cascade": cascade, "steps": report}
 
-    primary_key_column = pk_columns[0] # Assuming single PK
+        return submit_job(db, current_admin, "delete_row", delete_job, {"table_name": table_name, "row_id": row_id_str, "cascade": cascade})
 
     try:
-        if isinstance(primary_key_column.type, (sqlalchemy.sql.sqltypes.Integer, sqlalchemy.sql.sqltypes.BigInteger)):
-            row_id_typed = int(row_id_str)
-        elif isinstance(primary_key_column.type, sqlalchemy.sql.sqltypes.String):
-            row_id_typed = str(row_id_str)
-        else:
-            row_id_typed = row_id_str
-    except ValueError:
-        raise HTTPException(status_code=400, detail=f"Invalid ID format for primary key '{primary_key_column.name}'.")
+        # Lock and read the row first: its current values are the audit log's before image.
+        old_row = None if dry_run else db.execute(table.select().where(info.primary_key == row_id_typed).with_for_update()).first()
+        report = run_delete(db, table, row_id_typed, cascade=cascade, dry_run=dry_run)
+    except ValueError as e: # Unplannable table
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        db.rollback()
+        raise HTTPException(status_code=400, detail=f"Error deleting row: {str(e)}")
 
-    try:
-        try:
-            # If cascade is enabled and this is the users table, handle dependencies
-            if cascade:
-                if table_name == 'users':
-                    # Example: Delete dependent projects first
-                    projects_table = Base.metadata.tables['projects']
-                    delete_projects = projects_table.delete().where(projects_table.c.creator_id == row_id_typed)
-                    db.execute(delete_projects)
-                
-                if table_name == 'profiles':
-                    # Example: Delete dependent publications first
-                    publications_table = Base.metadata.tables['publications']
-                    delete_publications = publications_table.delete().where(publications_table.c.profile_id == row_id_typed)
-                    db.execute(delete_publications)
-
-                if table_name == 'grants':
-                    # Example: Delete dependent applications first
-                    applications_table = Base.metadata.tables['applications']
-                    delete_applications = applications_table.delete().where(applications_table.c.grant_id == row_id_typed)
-                    db.execute(delete_applications)
-                if table_name == 'projects':
-                    # Example: Delete dependent applications first
-                    applications_table = Base.metadata.tables['applications']
-                    delete_applications = applications_table.delete().where(applications_table.c.project_id == row_id_typed)
-                    db.execute(delete_applications)
-
-        except Exception as e:
-            db.rollback()
-            raise HTTPException(status_code=400, detail=f"Error handling dependencies: {str(e)}")
-                
-        stmt = table.delete().where(primary_key_column == row_id_typed)
-        result = db.execute(stmt)
-        
-        if result.rowcount == 0:
-            db.rollback() # Not strictly necessary for delete if it didn't find anything, but good practice
-            raise HTTPException(status_code=404, detail=f"Row with ID '{row_id_str}' not found in table '{table_name}'.")
-        
-        db.commit()
-        return # Returns 204 No Content automatically by FastAPI if no body is returned
+    if report[-1]["rows"] == 0: # The row itself
+        db.rollback()
+        raise HTTPException(status_code=404, detail=f"Row with ID '{row_id_str}' not found in table '{table_name}'.")
+    if dry_run:
+        db.rollback()
+        return ORJSONResponse({"table_name": table_name, "cascade": cascade, "steps": report})
+
+    audit_row_delete(db, info, row_id_typed, cascade, report, before=old_row._mapping)
+    # ON DELETE CASCADE can reach any table, so drop everything.
+    response_cache.invalidate(db, [ALL_CACHE_TAGS])
+    db.commit()
+    return # Returns 204 No Content automatically by FastAPI if no body is returned
+
+# --- Bulk Row Editing ---
+
+class BulkRowsRequest(BaseModel):
+    rows: List[Dict[str, Any]] = Field(..., min_length=1, max_length=settings.ADMIN_BULK_MAX_ROWS, description="Rows to insert, or to update (each with its primary key).")
+
+class BulkDeleteRequest(BaseModel):
+    ids: List[Union[int, str]] = Field(..., min_length=1, max_length=settings.ADMIN_BULK_MAX_ROWS, description="Primary keys of the rows to delete.")
 
+def _bulk_write(db: Session, table_name: str, action: str, write: Callable[[sqlalchemy.Table], List[Dict[str, Any]]]) -> Dict[str, Any]:
+    """Run a bulk write, audit and commit whatever succeeded; see app/utils/bulk_rows.py."""
+    if table_name not in Base.metadata.tables:
+        raise HTTPException(status_code=404, detail=f"Table '{table_name}' not found.")
+    table = Base.metadata.tables[table_name]
+    try:
+        results = write(table)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         db.rollback()
-        raise HTTPException(status_code=400, detail=f"Error deleting row: {str(e)}")
+        raise HTTPException(status_code=400, detail=f"Error writing rows: {str(e)}")
+
+    pk_names = [col.name for col in table.primary_key.columns]
+    succeeded = 0
+    for result in results:
+        if not result["ok"]:
+            continue
+        succeeded += 1
+        # Inserted and updated rows come back whole (RETURNING); deletes return their key.
+        row = result.get("row")
+        audit_log.record(
+            db, source="admin", action=action, table_name=table_name,
+            row_id=result["id"] if row is None else ",".join(str(row[name]) for name in pk_names) or None,
+            after=None if row is None else row_image(row, table), details={"bulk": True},
+        )
+    if succeeded:
+        response_cache.invalidate_table(db, table_name)
+        db.commit()
+    else:
+        db.rollback()
+    return {"table_name": table_name, "succeeded": succeeded, "failed": len(results) - succeeded, "results": results}
 
-# TODO: Add an endpoint for executing raw SQL (VERY DANGEROUS - use with extreme caution and validation)
-# This should be heavily restricted and ideally not exposed unless absolutely necessary
-# and with input sanitization or specific command whitelisting.
-# For a hackathon, if you need it, be very careful.
-# @router.post("/sql-editor/execute", response_model=Dict[str, Any])
-# async def execute_sql_query(
-#     query: str = Body(..., embed=True),
-#     db: Session = Depends(get_db),
-#     current_admin: models.User = Depends(deps.get_current_active_superuser)
-# ):
-#     if not query.strip().upper().startswith("SELECT"): # Basic safety: only allow SELECTs
-#         raise HTTPException(status_code=400, detail="Only SELECT queries are allowed for now.")
-#     try:
-#         result_proxy = db.execute(text(query))
-#         if result_proxy.returns_rows:
-#             results = [dict(row._mapping) for row in result_proxy.fetchall()]
-#             return {"data": results, "columns": list(result_proxy.keys())}
-#         else:
-#             db.commit() # For DML/DDL that don't return rows but change data (be careful!)
-#             return {"message": "Query executed, no rows returned.", "rowcount": result_proxy.rowcount}
-#     except Exception as e:
-#         db.rollback()
-#         raise HTTPException(status_code=400, detail=f"SQL Error: {str(e)}")
+@router.post("/tables/{table_name}/bulk/insert", response_model=Dict[str, Any])
+def bulk_insert_table_rows(
+    table_name: str,
+    payload: BulkRowsRequest,
+    db: Session = Depends(get_db),
+    current_admin: models.User = Depends(deps.get_current_active_superuser)
+):
+    """
+    Insert many rows in one transaction. Returns one result per row, in order, with the
+    inserted row or the error that rejected it; the other rows are still inserted.
+    """
+    return _bulk_write(db, table_name, "insert", lambda table: bulk_insert(db, table, payload.rows))
+
+@router.post("/tables/{table_name}/bulk/update", response_model=Dict[str, Any])
+def bulk_update_table_rows(
+    table_name: str,
+    payload: BulkRowsRequest,
+    db: Session = Depends(get_db),
+    current_admin: models.User = Depends(deps.get_current_active_superuser)
+):
+    """
+    Update many rows in one transaction. Each row holds its primary key and the columns
+    to set. Returns one result per row with the updated row or its error.
+    """
+    return _bulk_write(db, table_name, "update", lambda table: bulk_update(db, table, payload.rows))
+
+@router.post("/tables/{table_name}/bulk/delete", response_model=Dict[str, Any])
+def bulk_delete_table_rows(
+    table_name: str,
+    payload: BulkDeleteRequest,
+    db: Session = Depends(get_db),
+    current_admin: models.User = Depends(deps.get_current_active_superuser)
+):
+    """
+    Delete many rows by primary key in one transaction, without cascading: rows that are
+    still referenced fail individually. Returns one result per id.
+    """
+    return _bulk_write(db, table_name, "delete", lambda table: bulk_delete(db, table, payload.ids))
+
+# --- Audit Log ---
+
+@router.get("/audit-log", response_model=List[schemas.AuditLogEntry])
+def read_audit_log(
+    table_name: Optional[str] = Query(None),
+    row_id: Optional[str] = Query(None, description="Primary key of the row (needs table_name)"),
+    actor_id: Optional[int] = Query(None),
+    before_id: Optional[int] = Query(None, description="Page cursor: the smallest id of the previous page"),
+    limit: int = Query(100, ge=1, le=500),
+    db: Session = Depends(get_db),
+    current_admin: models.User = Depends(deps.get_current_active_superuser)
+):
+    """
+    Audited row changes, newest first. Entries are written in batches shortly after the
+    change commits (see /audit-log/stats), so the latest few may not be listed yet.
+    """
+    query = db.query(models.AuditLogEntry)
+    if table_name is not None:
+        query = query.filter(models.AuditLogEntry.table_name == table_name)
+        if row_id is not None:
+            query = query.filter(models.AuditLogEntry.row_id == row_id)
+    if actor_id is not None:
+        query = query.filter(models.AuditLogEntry.actor_id == actor_id)
+    if before_id is not None:
+        query = query.filter(models.AuditLogEntry.id < before_id)
+    return query.order_by(models.AuditLogEntry.id.desc()).limit(limit).all()
+
+@router.get("/audit-log/stats", response_model=Dict[str, int])
+async def get_audit_log_stats(
+    current_admin: models.User = Depends(deps.get_current_active_superuser)
+):
+    """
+    Audit log writer counters for this process: entries `queued` in memory, `recorded`,
+    `written`, `dropped` because the queue was full, and `failed` with their batch.
+    """
+    return audit_log.stats()
+
+# --- Read-path Metrics ---
+
+@router.get("/cache/stats", response_model=Dict[str, Dict[str, int]])
+async def get_cache_stats(
+    current_admin: models.User = Depends(deps.get_current_active_superuser)
+):
+    """
+    Response cache hits/misses and single-flight coalescing counters for this process.
+    `collapsed` is the number of requests that shared another request's in-flight result.
+    """
+    return {
+        "response_cache": response_cache.stats(),
+        "single_flight": single_flight.stats(),
+    }
+
+# --- Read-only SQL Console ---
+
+class SqlConsoleRequest(BaseModel):
+    query: str = Field(..., min_length=1, max_length=100_000, description="One SELECT/WITH/VALUES/TABLE/SHOW/EXPLAIN statement.")
+    max_rows: int = Field(default=settings.SQL_CONSOLE_MAX_ROWS, gt=0, le=settings.SQL_CONSOLE_MAX_ROWS)
+
+class SqlExplainRequest(BaseModel):
+    query: str = Field(..., min_length=1, max_length=100_000, description="One SELECT/WITH/VALUES/TABLE statement.")
+    analyze: bool = Field(default=True, description="EXPLAIN ANALYZE, BUFFERS: runs the query for actual times and row counts.")
+
+@router.post("/sql-editor/execute")
+def execute_sql_query(
+    payload: SqlConsoleRequest,
+    current_admin: models.User = Depends(deps.get_current_active_superuser)
+):
+    """
+    Run one read-only statement and stream the result as NDJSON: a {"columns": [...]}
+    line, one JSON array per row (at most `max_rows`), then a summary line. Runs in a READ
+    ONLY transaction with a statement timeout; see app/services/sql_console.py.
+    """
+    lines = iter_query(payload.query, payload.max_rows)
+    try:
+        header = next(lines) # Runs the statement, so errors can still be a 400
+    except (ValueError, sqlalchemy.exc.DBAPIError) as e:
+        raise HTTPException(status_code=400, detail=f"SQL Error: {str(getattr(e, 'orig', None) or e).strip()}")
+    return StreamingResponse(itertools.chain([header], lines), media_type="application/x-ndjson")
+
+@router.post("/sql-editor/explain", response_model=Dict[str, Any])
+def explain_sql_query(
+    payload: SqlExplainRequest,
+    current_admin: models.User = Depends(deps.get_current_active_superuser)
+):
+    """
+    EXPLAIN (ANALYZE, BUFFERS, FORMAT JSON) one read-only statement and summarize the plan:
+    the slowest nodes by their own time, sequential scans, and row-estimate misses.
+    """
+    try:
+        return explain(payload.query, analyze=payload.analyze)
+    except (ValueError, sqlalchemy.exc.DBAPIError) as e:
+        raise HTTPException(status_code=400, detail=f"SQL Error: {str(getattr(e, 'orig', None) or e).strip()}")
 
 
 # --- Pydantic Models for Seeding Request Payloads ---
@@ -401,7 +648,12 @@ class SeedAllRequest(BaseModel):
 
 # --- Seeding Endpoints ---
 
-@router.post("/seed/users", summary="Populate Users with Dummy Data", status_code=201, response_model=Dict[str, Any])
+def invalidate_response_cache_after_seeding():
+    # Seeding writes through the session directly, bypassing the CRUD invalidation hooks.
+    yield
+    response_cache.invalidate_now([ALL_CACHE_TAGS])
+
+@router.post("/seed/users", summary="Populate Users with Dummy Data", status_code=201, response_model=Dict[str, Any], dependencies=[Depends(invalidate_response_cache_after_seeding)])
 def seed_dummy_users_endpoint(
     *,
     db: Session = Depends(deps.get_db),
@@ -415,7 +667,7 @@ def seed_dummy_users_endpoint(
     users = seeding.create_dummy_users(db, count=request_body.count)
     return {"message": f"Successfully created {len(users)} dummy users.", "users_created": len(users)}
 
-@router.post("/seed/profiles-with-details", summary="Populate Profiles with Details", status_code=201, response_model=Dict[str, Any])
+@router.post("/seed/profiles-with-details", summary="Populate Profiles with Details", status_code=201, response_model=Dict[str, Any], dependencies=[Depends(invalidate_response_cache_after_seeding)])
 def seed_dummy_profiles_endpoint(
     *,
     db: Session = Depends(deps.get_db),
@@ -445,7 +697,7 @@ def seed_dummy_profiles_endpoint(
     return {"message": f"Successfully created/processed {len(profiles)} profiles with details.", "profiles_created": len(profiles)}
 
 
-@router.post("/seed/publications", summary="Populate Publications for Profiles", status_code=201, response_model=Dict[str, Any])
+@router.post("/seed/publications", summary="Populate Publications for Profiles", status_code=201, response_model=Dict[str, Any], dependencies=[Depends(invalidate_response_cache_after_seeding)])
 def seed_dummy_publications_endpoint(
     *,
     db: Session = Depends(deps.get_db),
@@ -471,7 +723,7 @@ def seed_dummy_publications_endpoint(
     return {"message": f"Successfully created {len(publications)} publications.", "publications_created": len(publications)}
 
 
-@router.post("/seed/grants", summary="Populate Grants with Dummy Data", status_code=201, response_model=Dict[str, Any])
+@router.post("/seed/grants", summary="Populate Grants with Dummy Data", status_code=201, response_model=Dict[str, Any], dependencies=[Depends(invalidate_response_cache_after_seeding)])
 def seed_dummy_grants_endpoint(
     *,
     db: Session = Depends(deps.get_db),
@@ -495,7 +747,7 @@ def seed_dummy_grants_endpoint(
     return {"message": f"Successfully created {len(grants)} dummy grants.", "grants_created": len(grants)}
 
 
-@router.post("/seed/projects", summary="Populate Projects with Dummy Data", status_code=201, response_model=Dict[str, Any])
+@router.post("/seed/projects", summary="Populate Projects with Dummy Data", status_code=201, response_model=Dict[str, Any], dependencies=[Depends(invalidate_response_cache_after_seeding)])
 def seed_dummy_projects_endpoint(
     *,
     db: Session = Depends(deps.get_db),
@@ -514,7 +766,7 @@ def seed_dummy_projects_endpoint(
     return {"message": f"Successfully created {len(projects)} dummy projects with team members.", "projects_created": len(projects)}
 
 
-@router.post("/seed/grant-applications", summary="Populate Grant Applications", status_code=201, response_model=Dict[str, Any])
+@router.post("/seed/grant-applications", summary="Populate Grant Applications", status_code=201, response_model=Dict[str, Any], dependencies=[Depends(invalidate_response_cache_after_seeding)])
 def seed_dummy_grant_applications_endpoint(
     *,
     db: Session = Depends(deps.get_db),
@@ -538,7 +790,7 @@ def seed_dummy_grant_applications_endpoint(
     return {"message": f"Successfully created {len(applications)} grant applications.", "applications_created": len(applications)}
 
 
-@router.post("/seed/project-applications", summary="Populate Project Applications", status_code=201, response_model=Dict[str, Any])
+@router.post("/seed/project-applications", summary="Populate Project Applications", status_code=201, response_model=Dict[str, Any], dependencies=[Depends(invalidate_response_cache_after_seeding)])
 def seed_dummy_project_applications_endpoint(
     *,
     db: Session = Depends(deps.get_db),
@@ -561,23 +813,28 @@ def seed_dummy_project_applications_endpoint(
     applications = seeding.create_dummy_project_applications(db, projects=target_projects, applicant_users=applicant_users, apps_per_project_avg=request_body.apps_per_target_avg)
     return {"message": f"Successfully created {len(applications)} project applications.", "applications_created": len(applications)}
 
-@router.post("/seed/all-sample-data", summary="Populate All Major Tables with Sample Data", status_code=201, response_model=Dict[str, Any])
+@router.post("/seed/all-sample-data", summary="Populate All Major Tables with Sample Data", status_code=201, response_model=Dict[str, Any], dependencies=[Depends(invalidate_response_cache_after_seeding)])
 def seed_all_sample_data_endpoint(
     *,
     db: Session = Depends(deps.get_db),
     current_admin: models.User = Depends(deps.get_current_active_superuser),
-    request_body: SeedAllRequest
+    request_body: SeedAllRequest,
+    background: bool = Query(False, description="Seed in a background job and answer 202 with its id")
 ):
     """
     Populates all major tables with a configurable amount of interconnected sample data.
+    With background=True, returns 202 with a job to poll under /jobs instead. Each stage
+    commits on its own, so a cancelled or failed job keeps the stages it finished.
     """
-    results = seeding.seed_all_sample_data(
-        db,
-        num_users=request_body.num_users,
-        num_grants=request_body.num_grants,
-        num_projects=request_body.num_projects,
-        pubs_per_profile_avg=request_body.pubs_per_profile_avg,
-        apps_per_grant_avg=request_body.apps_per_grant_avg,
-        apps_per_project_avg=request_body.apps_per_project_avg
-    )
+    options = request_body.model_dump()
+    if background:
+        def seed_job(ctx: JobContext) -> Dict[str, Any]:
+            try:
+                return seeding.seed_all_sample_data(ctx.db, progress=ctx.progress, **options)
+            finally:
+                response_cache.invalidate_now([ALL_CACHE_TAGS])
+
+        return submit_job(db, current_admin, "seed_all", seed_job, options)
+
+    results = seeding.seed_all_sample_data(db, **options)
     return {"message": "Comprehensive sample data seeding completed successfully.", "details": results}
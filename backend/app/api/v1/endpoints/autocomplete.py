@@ -0,0 +1,35 @@
+from typing import Any, List
+from fastapi import APIRouter, Depends, Query
+from sqlalchemy.orm import Session
+
+from app import schemas
+from app.api import deps
+from app.services.autocomplete import FUZZY_FIELDS, FUZZY_MIN_QUERY_LENGTH, autocomplete_index
+
+router = APIRouter()
+
+@router.get("/", response_model=List[schemas.AutocompleteSuggestion])
+def autocomplete(
+    field: schemas.AutocompleteField,
+    q: str = Query(..., min_length=1, max_length=100),
+    limit: int = Query(10, ge=1, le=25),
+    fuzzy: bool = Query(False, description="Fill up with typo-tolerant matches (a database query) when prefix matches run short"),
+    db: Session = Depends(deps.get_db),
+) -> Any:
+    """
+    Suggest existing values for a form field, most used first. Matches any word in the
+    value ("tok" -> "University of Tokyo"). Served from memory; only fuzzy=true queries the
+    database, for typo-tolerant matches when the prefix matches run short.
+    """
+    autocomplete_index.ensure_ready(db) # First requests before the background build finished
+
+    suggestions = autocomplete_index.suggest(field, q, limit=limit)
+    if fuzzy and len(suggestions) < limit and field in FUZZY_FIELDS and len(q.strip()) >= FUZZY_MIN_QUERY_LENGTH:
+        seen = {s.value.casefold() for s in suggestions}
+        for suggestion in autocomplete_index.fuzzy(db, field, q.strip(), limit=limit):
+            if len(suggestions) >= limit:
+                break
+            if suggestion.value.casefold() not in seen:
+                seen.add(suggestion.value.casefold())
+                suggestions.append(suggestion)
+    return suggestions
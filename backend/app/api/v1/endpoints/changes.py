@@ -0,0 +1,30 @@
+from typing import Any, List, Optional
+from fastapi import APIRouter, Depends, HTTPException, Query
+from sqlalchemy.orm import Session
+
+from app import crud, models, schemas
+from app.api import deps
+from app.crud.crud_changes import FEED_ENTITIES
+
+router = APIRouter()
+
+@router.get("/", response_model=schemas.ChangeFeed)
+def read_changes(
+    db: Session = Depends(deps.get_db),
+    since: Optional[str] = Query(None, description="next_cursor from the previous call; omit to start from the beginning"),
+    entities: Optional[List[schemas.ChangeEntityType]] = Query(None, description="Restrict to these entity types"),
+    limit: int = Query(100, ge=1, le=1000),
+    current_user: models.User = Depends(deps.get_current_active_user),
+) -> Any:
+    """
+    Created, updated and deleted grants, projects, applications and profiles since a cursor,
+    oldest first. Fetch the changed rows with the batch endpoints (`/grants?ids=...`);
+    keep calling with `next_cursor` while `has_more`, then poll with the last one.
+    """
+    try:
+        items, next_cursor, has_more = crud.changes.get_page(
+            db, entities=sorted(set(entities or FEED_ENTITIES)), cursor=since, limit=limit
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    return {"items": items, "next_cursor": next_cursor, "has_more": has_more}
@@ -1,40 +1,98 @@
-from typing import List, Any
-from fastapi import APIRouter, Depends, HTTPException, Query
+from typing import Dict, List, Any, Optional
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
+from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
 
 from app import crud, models, schemas
-from app.api import deps
+from app.api import deps, serializers
+from app.api.caching import serve_cached
+from app.api.conditional import validator_headers
+from app.core.config import settings
+from app.services.export import MEDIA_TYPES, ExportFormat, iter_export
+from app.services.grant_recommender import grant_recommender, profile_terms
 
 router = APIRouter()
 
 @router.get("/", response_model=List[schemas.Grant])
 def read_grants(
+    request: Request,
     db: Session = Depends(deps.get_db),
     skip: int = Query(0, ge=0),
     limit: int = Query(100, ge=1, le=200),
+    ids: Optional[List[int]] = Query(
+        None, max_length=settings.BATCH_MAX_IDS,
+        description="Fetch these grants (as on the detail endpoint) in this order instead of a page; unknown ids are skipped.",
+    ),
     # current_user: models.User = Depends(deps.get_current_active_user), # Optional: if listings need auth
 ) -> Any:
         """
-        Retrieve all grants with funder information.
+        Retrieve all grants with funder information, or a batch of grants by id (`?ids=1&ids=2`).
         Publicly accessible or requires standard user authentication.
+        Supports If-None-Match / If-Modified-Since revalidation; served from the response cache, with
+        concurrent identical misses coalesced into one query.
         """
-        grants = crud.grant.get_multi_with_proposer(db, skip=skip, limit=limit)
-        return grants
+        def validators() -> Dict[str, str]:
+            if ids is not None:
+                return validator_headers(crud.freshness.grants_by_ids(db, ids=ids), *ids)
+            return validator_headers(crud.freshness.grants(db, ids=crud.grant.page_ids(skip=skip, limit=limit)), skip, limit)
+
+        def render() -> bytes:
+            if ids is not None:
+                return serializers.dump_json(serializers.grant_list, crud.grant.get_many_with_proposer(db, ids=ids))
+            grants = crud.grant.get_multi_with_proposer(db, skip=skip, limit=limit)
+            return serializers.dump_json(serializers.grant_list, grants, list_view=True)
+
+        return serve_cached(request, ("grants", "users"), validators, render)
+
+@router.get("/recommended", response_model=List[schemas.GrantRecommendation])
+def read_recommended_grants(
+    db: Session = Depends(deps.get_db),
+    limit: int = Query(10, ge=1, le=50),
+    current_user: models.User = Depends(deps.get_current_active_user),
+) -> Any:
+    """
+    Recommend open grants for the current user, scored by TF-IDF cosine similarity between
+    the grant text and the user's research interests, skills and publications.
+    """
+    profile = crud.profile.get_by_user_id_detailed(db, user_id=current_user.id)
+    if not profile:
+        return []
+
+    grant_recommender.sync(db)
+    ranked = grant_recommender.recommend(profile_terms(profile), limit=limit)
+    grants = crud.grant.get_many_with_proposer(db, ids=[grant_id for grant_id, _ in ranked])
+    grants_by_id = {g.id: g for g in grants}
+    return [
+        {"score": score, "grant": grants_by_id[grant_id]}
+        for grant_id, score in ranked if grant_id in grants_by_id
+    ]
 
 @router.get("/{grant_id}", response_model=schemas.Grant)
 def read_grant(
 *,
+request: Request,
 db: Session = Depends(deps.get_db),
 grant_id: int,
 # current_user: models.User = Depends(deps.get_current_active_user), # Optional
 ) -> Any:
         """
         Get a specific grant by ID with funder information.
+        Supports If-None-Match / If-Modified-Since revalidation; served from the response cache,
+        with concurrent identical misses coalesced into one query.
         """
-        grant = crud.grant.get_with_proposer(db, id=grant_id)
-        if not grant:
-            raise HTTPException(status_code=404, detail="Grant not found")
-        return grant
+        def validators() -> Dict[str, str]:
+            freshness = crud.freshness.grant(db, id=grant_id)
+            if not freshness.found:
+                raise HTTPException(status_code=404, detail="Grant not found")
+            return validator_headers(freshness)
+
+        def render() -> bytes:
+            grant = crud.grant.get_with_proposer(db, id=grant_id)
+            if not grant: # Deleted since the freshness check
+                raise HTTPException(status_code=404, detail="Grant not found")
+            return serializers.dump_json(serializers.grant, grant)
+
+        return serve_cached(request, (f"grant:{grant_id}", "grant:*", "users"), validators, render)
 
 # TODO: Add POST, PUT, DELETE endpoints for grants later (will require authentication and authorization)
 @router.post("/", response_model=schemas.Grant, status_code=201)
@@ -116,3 +174,26 @@ def create_grant_application_endpoint( # Renamed for clarity
     # Eager load for response
     db.refresh(application, ["applicant", "grant"])
     return application
+
+
+@router.get("/{grant_id}/applications/export")
+def export_grant_applications(
+    grant_id: int,
+    db: Session = Depends(deps.get_db),
+    format: ExportFormat = Query("ndjson", description="ndjson (one JSON object per line) or csv"),
+    current_user: models.User = Depends(deps.get_current_active_user),
+) -> StreamingResponse:
+    """
+    Stream every application for a grant, with cover letters and applicant names.
+    Only the grant's proposer (funder) and superusers may export.
+    """
+    grant = crud.grant.get(db, id=grant_id)
+    if not grant:
+        raise HTTPException(status_code=404, detail="Grant not found")
+    if grant.proposer_id != current_user.id and not current_user.is_superuser:
+        raise HTTPException(status_code=403, detail="Only the grant's proposer can export its applications")
+    return StreamingResponse(
+        iter_export(crud.grant_application.export_query(grant_id=grant_id), format),
+        media_type=MEDIA_TYPES[format],
+        headers={"Content-Disposition": f'attachment; filename="grant-{grant_id}-applications.{format}"'},
+    )
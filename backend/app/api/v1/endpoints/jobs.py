@@ -0,0 +1,55 @@
+from typing import Any, List, Optional
+from fastapi import APIRouter, Depends, HTTPException, Query
+from sqlalchemy.orm import Session
+
+from app import models, schemas
+from app.api import deps
+from app.services.jobs import job_runner
+
+router = APIRouter()
+
+def get_job_or_404(db: Session, job_id: int) -> models.AdminJob:
+    job = db.get(models.AdminJob, job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="Job not found")
+    return job
+
+@router.get("/", response_model=List[schemas.AdminJob])
+def read_jobs(
+    db: Session = Depends(deps.get_db),
+    status: Optional[models.AdminJobStatus] = Query(None),
+    limit: int = Query(50, ge=1, le=200),
+    current_admin: models.User = Depends(deps.get_current_active_superuser),
+) -> Any:
+    """
+    Most recent background admin jobs first.
+    """
+    query = db.query(models.AdminJob)
+    if status is not None:
+        query = query.filter(models.AdminJob.status == status)
+    return query.order_by(models.AdminJob.id.desc()).limit(limit).all()
+
+@router.get("/{job_id}", response_model=schemas.AdminJob)
+def read_job(
+    job_id: int,
+    db: Session = Depends(deps.get_db),
+    current_admin: models.User = Depends(deps.get_current_active_superuser),
+) -> Any:
+    """
+    Status, progress and (once finished) result or error of a job. Poll this after an
+    endpoint answered 202 with the job id.
+    """
+    return get_job_or_404(db, job_id)
+
+@router.post("/{job_id}/cancel", response_model=schemas.AdminJob)
+def cancel_job(
+    job_id: int,
+    db: Session = Depends(deps.get_db),
+    current_admin: models.User = Depends(deps.get_current_active_superuser),
+) -> Any:
+    """
+    Request cancellation. A queued job is cancelled at once; a running job stops at its
+    next progress report and its uncommitted work is rolled back. Jobs that commit in
+    stages (seed_all) keep the stages they finished. Finished jobs are left as they are.
+    """
+    return job_runner.cancel(db, get_job_or_404(db, job_id))
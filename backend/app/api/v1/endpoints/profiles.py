@@ -1,14 +1,18 @@
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
 from sqlalchemy.orm import Session
 from typing import List, Any
 
 from app import crud, models, schemas
-from app.api import deps
+from app.api import deps, serializers
+from app.api.caching import serve_cached
+from app.api.conditional import conditional_response
+from app.services.talent_facets import talent_facet_index
 
 router = APIRouter()
 
-@router.get("/talent-pool/", response_model=List[schemas.User])
+@router.get("/talent-pool/", response_model=List[schemas.TalentPoolUser])
 def read_talent_pool_profiles(
+    request: Request,
     db: Session = Depends(deps.get_db),
     skip: int = 0,
     limit: int = 100,
@@ -16,33 +20,63 @@ def read_talent_pool_profiles(
 ) -> Any:
     """
     Retrieve users whose profiles are visible in the talent pool.
-    Returns a list of User objects, each containing their profile information.
+    Served from the denormalized talent-pool read model: one indexed scan,
+    no per-user relationship loading, and cached until the next profile write.
     """
-    db_profiles = crud.profile.get_visible_in_talent_pool(db, skip=skip, limit=limit)
-    
-    users_in_talent_pool: List[models.User] = []
-    for profile_obj in db_profiles:
-        if profile_obj.user:
-            # The schemas.User response model will automatically pick up the profile
-            # data due to the relationship and orm_mode/from_attributes.
-            users_in_talent_pool.append(profile_obj.user) 
-            # No need for schemas.User.model_validate here, FastAPI handles it for response_model
-            
-    if not users_in_talent_pool and skip == 0: # Optional: return 404 if pool is empty
-        # raise HTTPException(status_code=404, detail="Talent pool is currently empty.")
-        pass
+    def render() -> bytes:
+        entries = crud.talent_pool.get_multi(db, skip=skip, limit=limit)
+        return serializers.dump_json(serializers.talent_pool_list, entries)
 
-    return users_in_talent_pool
+    return serve_cached(request, ("talent_pool",), dict, render) # No validators: always a 200
+
+
+@router.get("/talent-pool/search", response_model=schemas.TalentPoolSearchResult)
+def search_talent_pool(
+    db: Session = Depends(deps.get_db),
+    skills: List[str] = Query([], description="Match profiles with any of these skills."),
+    research_interests: List[str] = Query([]),
+    current_role: List[str] = Query([], description="Profile role, e.g. 'PhD Candidate'."),
+    role: List[str] = Query([], description="User role, e.g. 'researcher'."),
+    match_all_skills: bool = Query(False, description="Require every listed skill instead of any."),
+    skip: int = Query(0, ge=0),
+    limit: int = Query(50, ge=1, le=200),
+    facet_limit: int = Query(20, ge=1, le=200),
+) -> Any:
+    """
+    Filter the talent pool by skills, research interests, profile role and user role,
+    with per-facet counts over the matching profiles.
+    Evaluated against the in-memory bitmap facet index; only the returned page is read from the DB.
+    """
+    talent_facet_index.sync(db)
+    profile_ids, facets = talent_facet_index.query(
+        {
+            "skills": skills,
+            "research_interests": research_interests,
+            "current_role": current_role,
+            "role": role,
+        },
+        match_all=("skills",) if match_all_skills else (),
+        facet_limit=facet_limit,
+    )
+    page = crud.talent_pool.get_by_profile_ids(db, profile_ids=profile_ids[skip:skip + limit])
+    return {"total": len(profile_ids), "items": page, "facets": facets}
 
 
 @router.get("/me", response_model=schemas.ProfileSchema)
 def read_profile_me(
+    request: Request,
+    response: Response,
     db: Session = Depends(deps.get_db),
     current_user: models.User = Depends(deps.get_current_active_user),
 ) -> Any:
     """
-    Get current user's profile.
+    Get current user's profile. Supports If-None-Match / If-Modified-Since revalidation.
     """
+    freshness = crud.freshness.profile_of_user(db, user_id=current_user.id)
+    if freshness.found:
+        not_modified = conditional_response(request, response, freshness, current_user.id, private=True)
+        if not_modified is not None:
+            return not_modified
     profile = crud.profile.get_by_user_id(db, user_id=current_user.id)
     if not profile:
         # Option 1: Return 404 if profile must exist
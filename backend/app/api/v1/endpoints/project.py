@@ -1,37 +1,107 @@
-from typing import List, Any
-from fastapi import APIRouter, Depends, HTTPException, Query
+from typing import Dict, List, Any, Optional
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
 from sqlalchemy.orm import Session
 
 from app import crud, models, schemas
-from app.api import deps
+from app.api import deps, serializers
+from app.api.caching import serve_cached
+from app.api.conditional import validator_headers
+from app.core.config import settings
+from app.services.skill_matching import skill_matcher, project_skill_weights
 
 router = APIRouter()
 
 @router.get("/", response_model=List[schemas.Project])
 def read_projects(
+    request: Request,
     db: Session = Depends(deps.get_db),
     skip: int = Query(0, ge=0),
     limit: int = Query(100, ge=1, le=200),
+    ids: Optional[List[int]] = Query(
+        None, max_length=settings.BATCH_MAX_IDS,
+        description="Fetch these projects (as on the detail endpoint) in this order instead of a page; unknown ids are skipped.",
+    ),
     # current_user: models.User = Depends(deps.get_current_active_user), # Optional
 ) -> Any:
     """
-    Retrieve all projects with creator and team member information.
+    Retrieve all projects with creator and team member information, or a batch of
+    projects by id (`?ids=1&ids=2`).
+    Supports If-None-Match / If-Modified-Since revalidation; served from the response cache,
+    with concurrent identical misses coalesced into one query.
     """
-    projects = crud.project.get_multi_detailed(db, skip=skip, limit=limit)
-    return projects
+    def validators() -> Dict[str, str]:
+        if ids is not None:
+            return validator_headers(crud.freshness.projects_by_ids(db, ids=ids), *ids)
+        return validator_headers(crud.freshness.projects(db, ids=crud.project.page_ids(skip=skip, limit=limit)), skip, limit)
+
+    def render() -> bytes:
+        if ids is not None:
+            return serializers.dump_json(serializers.project_list, crud.project.get_many_detailed(db, ids=ids))
+        projects = crud.project.get_multi_detailed(db, skip=skip, limit=limit)
+        return serializers.dump_json(serializers.project_list, projects, list_view=True)
+
+    return serve_cached(request, ("projects", "users"), validators, render)
 
 @router.get("/{project_id}", response_model=schemas.Project)
 def read_project_by_id(
     project_id: int,
+    request: Request,
     db: Session = Depends(deps.get_db),
 ) -> Any:
     """
     Get a specific project by its ID.
+    Supports If-None-Match / If-Modified-Since revalidation; served from the response cache,
+    with concurrent identical misses coalesced into one query.
     """
-    project = crud.project.get_detailed(db, id=project_id) # Uses the get_detailed method
+    def validators() -> Dict[str, str]:
+        freshness = crud.freshness.project(db, id=project_id)
+        if not freshness.found:
+            raise HTTPException(status_code=404, detail="Project not found")
+        return validator_headers(freshness)
+
+    def render() -> bytes:
+        project = crud.project.get_detailed(db, id=project_id)
+        if not project: # Deleted since the freshness check
+            raise HTTPException(status_code=404, detail="Project not found")
+        return serializers.dump_json(serializers.project, project)
+
+    return serve_cached(request, (f"project:{project_id}", "project:*", "users"), validators, render)
+
+@router.get("/{project_id}/candidates", response_model=List[schemas.ProjectCandidate])
+def read_project_candidates(
+    project_id: int,
+    db: Session = Depends(deps.get_db),
+    top_k: int = Query(20, ge=1, le=100),
+    min_score: float = Query(0.0, ge=0.0, le=1.0),
+) -> Any:
+    """
+    Rank talent-pool profiles against the project's required skills (and any skills
+    listed under roles_available). The creator and existing team members are excluded.
+    """
+    project = crud.project.get(db, id=project_id)
     if not project:
         raise HTTPException(status_code=404, detail="Project not found")
-    return project
+
+    skill_weights = project_skill_weights(project.required_skills, project.roles_available)
+    if not skill_weights:
+        return []
+
+    skill_matcher.sync(db)
+    exclude_user_ids = {project.creator_id, *(member.user_id for member in project.team_members)}
+    matches = skill_matcher.rank(skill_weights, top_k=top_k, exclude_user_ids=exclude_user_ids, min_score=min_score)
+
+    entries = crud.talent_pool.get_by_profile_ids(db, profile_ids=[m.profile_id for m in matches])
+    entries_by_profile = {entry.profile_id: entry for entry in entries}
+    return [
+        {
+            "score": m.score,
+            "overlap": m.overlap,
+            "similarity": m.similarity,
+            "matched_skills": m.matched_skills,
+            "candidate": entries_by_profile[m.profile_id],
+        }
+        for m in matches if m.profile_id in entries_by_profile
+    ]
 
 # TODO: Add POST, PUT, DELETE endpoints for projects, team members, applications later
 # Example:
@@ -0,0 +1,29 @@
+from typing import Any, List, Optional
+from fastapi import APIRouter, Depends, HTTPException, Query
+from sqlalchemy.orm import Session
+
+from app import schemas
+from app.api import deps
+from app.services import search as search_service
+
+router = APIRouter()
+
+@router.get("/", response_model=schemas.SearchResults)
+def search(
+    db: Session = Depends(deps.get_db),
+    q: str = Query(..., min_length=1, max_length=256, description="Search terms; supports \"quoted phrases\", OR and -exclusions"),
+    types: Optional[List[schemas.SearchEntityType]] = Query(None, description="Restrict to these result types"),
+    limit: int = Query(20, ge=1, le=100),
+    cursor: Optional[str] = Query(None, description="next_cursor from the previous page"),
+) -> Any:
+    """
+    Full-text search across grants, projects and talent-pool profiles, best matches first.
+    Profile hits carry the profile owner's user id.
+    """
+    try:
+        items, next_cursor = search_service.search(
+            db, q, types=types or search_service.SEARCH_TYPES, limit=limit, cursor=cursor
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    return {"items": items, "next_cursor": next_cursor}
@@ -1,10 +1,13 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
 from sqlalchemy.orm import Session
-from typing import Any, List, Optional
+from typing import Any, Dict, List, Optional
 from pydantic import ValidationError # For explicit validation catch
 
 from app import crud, models, schemas
-from app.api import deps
+from app.api import deps, serializers
+from app.api.caching import serve_cached
+from app.api.conditional import conditional_response, validator_headers
+from app.core.config import settings
 from app.db.session import get_db
 
 import logging
@@ -39,35 +42,40 @@ def create_user_endpoint( # Keep synchronous if CRUD ops are sync
             )
     created_user_model = crud.user.create_user(db=db, user_in=user_in)
     logger.info(f"User created successfully: {created_user_model.wallet_address}")
-    # Explicitly validate and return the Pydantic schema instance
-    return schemas.User.model_validate(created_user_model)
+    return serializers.json_response(serializers.user, created_user_model, status_code=status.HTTP_201_CREATED)
 
 
 @router.get("/", response_model=schemas.UserList)
 def read_users_endpoint( # Keep synchronous
+    request: Request,
+    response: Response,
     db: Session = Depends(get_db),
     skip: int = 0,
     limit: int = 100,
     # current_user: models.User = Depends(deps.get_current_active_user), # Protect if needed
 ) -> Any: # Or schemas.UserList directly
+    # Revalidation is answered before the page is loaded or serialized.
+    freshness = crud.freshness.users(db, ids=crud.user.page_ids(skip=skip, limit=limit))
+    not_modified = conditional_response(request, response, freshness, skip, limit)
+    if not_modified is not None:
+        return not_modified
     # logger.info(f"Fetching users - Skip: {skip}, Limit: {limit}")
     users_db = crud.user.get_users(db, skip=skip, limit=limit)
     total_users = db.query(models.User).count()
-    # Explicitly convert each user model to the Pydantic schema for the list
-    users_schema = [schemas.User.model_validate(user) for user in users_db]
-    return {"users": users_schema, "total": total_users}
+    # ORM rows straight to bytes; validated once, not again against response_model
+    return serializers.json_response(
+        serializers.user_page, {"users": users_db, "total": total_users}, response=response, list_view=True
+    )
 
 
 @router.get("/me", response_model=schemas.User)
 async def read_users_me( # Kept async to match your original, though could be sync
     current_user_model: models.User = Depends(deps.get_current_active_user),
-) -> schemas.User: # Explicitly return the Pydantic schema type
+) -> Any:
     logger.info(f"Fetching details for current user: {current_user_model.wallet_address}")
     try:
-        # Validate the SQLAlchemy model instance against the Pydantic response model
-        # This ensures the data structure is correct before FastAPI does it implicitly.
-        user_response_schema = schemas.User.model_validate(current_user_model)
-        return user_response_schema
+        # Serialize here (once) so validation errors are logged with the wallet address.
+        return serializers.json_response(serializers.user, current_user_model)
     except ValidationError as e_val:
         logger.error(f"Pydantic ValidationError during /users/me response serialization for {current_user_model.wallet_address}: {e_val.errors()}")
         # This error should ideally be caught by FastAPI and returned as 422,
@@ -78,15 +86,68 @@ async def read_users_me( # Kept async to match your original, though could be sy
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Server error processing user data.")
 
 
+@router.get("/search", response_model=List[schemas.UserSearchResult])
+def search_users_endpoint(
+    q: str = Query(..., min_length=3, max_length=100, description="Partial name, email (admins only) or wallet prefix"),
+    limit: int = Query(20, ge=1, le=50),
+    db: Session = Depends(get_db),
+    current_user: models.User = Depends(deps.get_current_active_user),
+) -> Any:
+    """
+    Fuzzy user lookup ranked by trigram similarity. Email addresses are only searched
+    and returned for superusers.
+    """
+    is_admin = bool(current_user.is_superuser)
+    matches = crud.user.search_users(db, query=q.strip(), limit=limit, include_email=is_admin)
+    return [
+        {
+            "id": user.id,
+            "wallet_address": user.wallet_address,
+            "full_name": user.full_name,
+            "email": user.email if is_admin else None,
+            "role": user.role,
+            "score": score,
+        }
+        for user, score in matches
+    ]
+
+
+@router.get("/batch", response_model=List[schemas.User])
+def read_users_batch_endpoint(
+    request: Request,
+    ids: List[int] = Query(..., min_length=1, max_length=settings.BATCH_MAX_IDS),
+    db: Session = Depends(get_db),
+) -> Any:
+    """
+    Users by id (`?ids=1&ids=2`) with their profiles, in the requested order; unknown ids
+    are skipped. One IN query per nesting level instead of a request per user.
+    """
+    def validators() -> Dict[str, str]:
+        return validator_headers(crud.freshness.users_by_ids(db, ids=ids), *ids)
+
+    def render() -> bytes:
+        return serializers.dump_json(serializers.user_list, crud.user.get_many_detailed(db, ids=ids))
+
+    return serve_cached(request, ("users",), validators, render)
+
+
 @router.get("/{user_id}", response_model=schemas.User)
 def read_user_by_id_endpoint( # Keep synchronous
     user_id: int,
+    request: Request,
+    response: Response,
     db: Session = Depends(get_db),
     # current_user: models.User = Depends(deps.get_current_active_user), # Protect
-) -> schemas.User:
+) -> Any:
     # logger.info(f"Fetching user by ID: {user_id}")
+    freshness = crud.freshness.user(db, id=user_id)
+    if not freshness.found:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="User not found")
+    not_modified = conditional_response(request, response, freshness)
+    if not_modified is not None:
+        return not_modified
     db_user = crud.user.get_user(db, user_id=user_id)
     if not db_user:
         logger.warning(f"User with ID {user_id} not found.")
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="User not found")
-    return schemas.User.model_validate(db_user)
\ No newline at end of file
+    return serializers.json_response(serializers.user, db_user, response=response)
\ No newline at end of file
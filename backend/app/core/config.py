@@ -22,6 +22,43 @@ class Settings(BaseSettings):
     # For Sign-In with Ethereum (SIWE)
     SIWE_NONCE_EXPIRY_SECONDS: int = 5 * 60 # 5 minutes
 
+    # In-memory talent-pool indexes (facets, matching) poll the read model at most this often
+    TALENT_INDEX_SYNC_INTERVAL_SECONDS: float = 2.0
+    # ...and the grant recommendation index polls the grants table at most this often
+    GRANT_INDEX_SYNC_INTERVAL_SECONDS: float = 5.0
+    # Autocomplete checks for changed source data this often, and rebuilds at least this often
+    AUTOCOMPLETE_REFRESH_INTERVAL_SECONDS: float = 5.0
+    AUTOCOMPLETE_MAX_AGE_SECONDS: float = 300.0
+
+    # Response cache for public GETs: "memory" (per process) or "redis" (shared; needs the redis package)
+    RESPONSE_CACHE_BACKEND: str = "memory"
+    RESPONSE_CACHE_REDIS_URL: str = "redis://localhost:6379/0"
+    RESPONSE_CACHE_TTL_SECONDS: float = 300.0 # Safety net; entries are invalidated on write
+    RESPONSE_CACHE_MAX_ENTRIES: int = 2048
+    # Concurrent identical cache misses wait this long for the in-flight request before computing their own
+    SINGLE_FLIGHT_TIMEOUT_SECONDS: float = 10.0
+    # Most ids accepted by the batch lookups (?ids=...) in one request
+    BATCH_MAX_IDS: int = 250
+    # Rows fetched per server-side cursor round trip by the streaming exports
+    EXPORT_BATCH_SIZE: int = 1000
+    # Admin table browser: estimated row counts at or below this are replaced by an exact count(*)
+    ADMIN_EXACT_COUNT_THRESHOLD: int = 50000
+    # Most rows or ids accepted by one admin bulk insert/update/delete request
+    ADMIN_BULK_MAX_ROWS: int = 1000
+    # How long the admin table statistics snapshot (pg_stat_* views) is reused
+    ADMIN_TABLE_STATS_TTL_SECONDS: float = 30.0
+    # Admin SQL console: per-statement timeout and the most rows one query streams back
+    SQL_CONSOLE_STATEMENT_TIMEOUT_MS: int = 15000
+    SQL_CONSOLE_MAX_ROWS: int = 10000
+    # Background admin jobs: worker threads, and the most jobs queued or running at once
+    ADMIN_JOB_WORKERS: int = 2
+    ADMIN_JOB_MAX_QUEUED: int = 20
+    # Audit log: entries are buffered in memory and written in batches this often; past the
+    # queue limit new entries are dropped (and counted) rather than slowing writes down
+    AUDIT_LOG_FLUSH_INTERVAL_MS: int = 500
+    AUDIT_LOG_BATCH_SIZE: int = 500
+    AUDIT_LOG_MAX_QUEUED: int = 10000
+
     model_config = SettingsConfigDict(env_file=".env", extra='ignore')
 
 
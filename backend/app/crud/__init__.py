@@ -3,6 +3,9 @@ from .crud_user import user  # Keep existing
 from .crud_grant import grant, grant_application
 from .crud_project import project, project_team_member, project_application
 from .crud_profile import profile, experience, education, publication # Assuming these exist for profile updates
+from .crud_talent_pool import talent_pool
+from .crud_freshness import freshness
+from .crud_changes import changes
 
 # noinspection PyUnresolvedReferences
 # For a convenient access point, you can list them here,
@@ -11,5 +14,8 @@ __all__ = [
     "user", 
     "grant", "grant_application",
     "project", "project_team_member", "project_application",
-    "profile", "experience", "education", "publication"
+    "profile", "experience", "education", "publication",
+    "talent_pool",
+    "freshness",
+    "changes",
 ]
\ No newline at end of file
@@ -1,11 +1,12 @@
 # backend/app/crud/base.py
-from typing import Any, Dict, Generic, List, Optional, Type, TypeVar, Union
+from typing import Any, Dict, Generic, List, Optional, Sequence, Type, TypeVar, Union
 
 from fastapi.encoders import jsonable_encoder
 from pydantic import BaseModel
 from sqlalchemy.orm import Session
 
 from app.db.base_class import Base # Your SQLAlchemy Base model
+from app.services.audit import audit_log, object_image
 
 ModelType = TypeVar("ModelType", bound=Base)
 CreateSchemaType = TypeVar("CreateSchemaType", bound=BaseModel)
@@ -22,6 +23,27 @@ class CRUDBase(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
         """
         self.model = model
 
+    def _on_write(self, db: Session, db_obj: ModelType) -> None:
+        """
+        Hook called after a write to `db_obj` has been flushed, before it is committed.
+        Override it to keep derived data (read models, caches) in step with the write.
+        """
+        pass
+
+    def _audit(self, db: Session, action: str, db_obj: ModelType, before: Optional[Dict[str, Any]] = None) -> None:
+        """
+        Record a flushed write to `db_obj` ("insert", "update" or "delete") in the audit log
+        when the transaction commits. For updates and deletes, pass the `object_image` taken
+        before the change as `before`.
+        """
+        audit_log.record_object(db, action, db_obj, before=before)
+
+    @staticmethod
+    def _in_order(rows: List[ModelType], ids: Sequence[Any]) -> List[ModelType]:
+        """`rows` fetched with `id IN (ids)`, in the order of `ids`; unknown ids are skipped."""
+        by_id = {row.id: row for row in rows}
+        return [by_id[i] for i in dict.fromkeys(ids) if i in by_id]
+
     def get(self, db: Session, id: Any) -> Optional[ModelType]:
         return db.query(self.model).filter(self.model.id == id).first()
 
@@ -34,6 +56,9 @@ class CRUDBase(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
         obj_in_data = jsonable_encoder(obj_in)
         db_obj = self.model(**obj_in_data)  # type: ignore
         db.add(db_obj)
+        db.flush()
+        self._on_write(db, db_obj)
+        self._audit(db, "insert", db_obj)
         db.commit()
         db.refresh(db_obj)
         return db_obj
@@ -46,6 +71,7 @@ class CRUDBase(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
         obj_in: Union[UpdateSchemaType, Dict[str, Any]]
     ) -> ModelType:
         obj_data = jsonable_encoder(db_obj)
+        before = object_image(db_obj)
         if isinstance(obj_in, dict):
             update_data = obj_in
         else:
@@ -55,6 +81,9 @@ class CRUDBase(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
             if field in update_data:
                 setattr(db_obj, field, update_data[field])
         db.add(db_obj)
+        db.flush()
+        self._on_write(db, db_obj)
+        self._audit(db, "update", db_obj, before=before)
         db.commit()
         db.refresh(db_obj)
         return db_obj
@@ -62,6 +91,10 @@ class CRUDBase(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
     def remove(self, db: Session, *, id: int) -> Optional[ModelType]:
         obj = db.query(self.model).get(id)
         if obj:
+            before = object_image(obj)
             db.delete(obj)
+            db.flush()
+            self._on_write(db, obj)
+            self._audit(db, "delete", obj, before=before)
             db.commit()
         return obj # Return the deleted object or None if not found
\ No newline at end of file
@@ -0,0 +1,138 @@
+# backend/app/crud/crud_changes.py
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from sqlalchemy import Select, false, literal, null, select, text, true, tuple_, union_all
+from sqlalchemy.orm import Session
+
+from app.models.change_tombstone import ChangeTombstone
+from app.models.grant import Grant, GrantApplication
+from app.models.profile import Profile
+from app.models.project import Project, ProjectApplication
+from app.utils.cursor import decode_cursor, encode_cursor
+
+# Feed entity -> (model, creation timestamp column)
+FEED_ENTITIES = {
+    "grant": (Grant, Grant.created_at),
+    "grant_application": (GrantApplication, GrantApplication.submitted_at),
+    "profile": (Profile, Profile.created_at),
+    "project": (Project, Project.created_at),
+    "project_application": (ProjectApplication, ProjectApplication.created_at),
+}
+
+# Start of the oldest transaction still open on this database (other than ours), capped at
+# our own start. Rows stamped with now() below this cannot still be uncommitted. Sessions of
+# other roles are only visible with pg_read_all_stats; the app uses a single role.
+_HORIZON_SQL = text(
+    "SELECT least(now(), min(xact_start)) FROM pg_stat_activity "
+    "WHERE datname = current_database() AND pid <> pg_backend_pid() AND xact_start IS NOT NULL"
+)
+
+class CRUDChanges:
+    """
+    Change feed over the `updated_at` indexes plus `change_tombstones` for deletes.
+
+    Changes are ordered by (changed_at, entity, id) and paged with an opaque keyset cursor.
+    `updated_at` is the writing transaction's start time, so a transaction that commits
+    late can stamp rows below a cursor a reader already holds; each page therefore only
+    reaches up to the start of the oldest transaction still open, and the cursor of a
+    caught-up feed is that horizon. A row changed several times since the cursor appears
+    once, at its latest change.
+    """
+
+    def _horizon(self, db: Session) -> datetime:
+        # Its own statement, before the feed query: anything committing after this read
+        # is visible to the feed query's (later) snapshot.
+        return db.execute(_HORIZON_SQL).scalar_one()
+
+    @staticmethod
+    def _after(ts_column, entity_column, id_column, entity: Optional[str], after: Optional[Tuple]) -> List[Any]:
+        if after is None:
+            return []
+        ts, after_entity, after_id = after
+        if entity is None: # Mixed entities (tombstones)
+            return [tuple_(ts_column, entity_column, id_column) > tuple_(ts, after_entity, after_id)]
+        # Constant entity per branch: reduce the row comparison to an index range.
+        if entity > after_entity:
+            return [ts_column >= ts]
+        if entity < after_entity:
+            return [ts_column > ts]
+        return [tuple_(ts_column, id_column) > tuple_(ts, after_id)]
+
+    def _branches(self, entities: Sequence[str], after: Optional[Tuple], horizon: datetime, limit: int) -> List[Select]:
+        branches = []
+        for entity in entities:
+            model, created_at = FEED_ENTITIES[entity]
+            branches.append(
+                select(
+                    literal(entity).label("entity"),
+                    model.id.label("id"),
+                    model.updated_at.label("changed_at"),
+                    created_at.label("created_at"),
+                    false().label("deleted"),
+                )
+                .where(model.updated_at < horizon, *self._after(model.updated_at, literal(entity), model.id, entity, after))
+                .order_by(model.updated_at, model.id)
+                .limit(limit)
+            )
+        t = ChangeTombstone
+        branches.append(
+            select(
+                t.entity.label("entity"),
+                t.entity_id.label("id"),
+                t.deleted_at.label("changed_at"),
+                null().label("created_at"),
+                true().label("deleted"),
+            )
+            .where(t.entity.in_(entities), t.deleted_at < horizon, *self._after(t.deleted_at, t.entity, t.entity_id, None, after))
+            .order_by(t.deleted_at, t.entity, t.entity_id)
+            .limit(limit)
+        )
+        return branches
+
+    def get_page(
+        self, db: Session, *, entities: Sequence[str], cursor: Optional[str] = None, limit: int = 100
+    ) -> Tuple[List[Dict[str, Any]], str, bool]:
+        """
+        Return `(changes, next_cursor, has_more)`. Pass `next_cursor` back to continue; it is
+        always set, so a caught-up consumer polls with it. Raises ValueError for a malformed
+        cursor.
+        """
+        after = None
+        if cursor:
+            ts, entity, id_ = decode_cursor(cursor, length=3)
+            try:
+                after = (datetime.fromisoformat(ts), str(entity), int(id_))
+            except (TypeError, ValueError) as e:
+                raise ValueError("Malformed cursor.") from e
+
+        horizon = self._horizon(db)
+        feed = union_all(*self._branches(entities, after, horizon, limit + 1)).subquery()
+        rows = db.execute(
+            select(feed).order_by(feed.c.changed_at, feed.c.entity, feed.c.id).limit(limit + 1)
+        ).all()
+
+        has_more = len(rows) > limit
+        rows = rows[:limit]
+        since = after[0] if after else None
+        changes = [
+            {
+                "entity": row.entity,
+                "id": row.id,
+                "op": "deleted" if row.deleted else (
+                    "created" if row.created_at is not None and (since is None or row.created_at > since) else "updated"
+                ),
+                "changed_at": row.changed_at,
+            }
+            for row in rows
+        ]
+        if has_more:
+            last = rows[-1]
+            next_cursor = encode_cursor([last.changed_at.isoformat(), last.entity, last.id])
+        else:
+            # Caught up: everything before the horizon has been returned.
+            next_cursor = encode_cursor([horizon.isoformat(), "", 0])
+        return changes, next_cursor, has_more
+
+
+changes = CRUDChanges()
@@ -0,0 +1,129 @@
+# backend/app/crud/crud_freshness.py
+from datetime import datetime
+from typing import List, NamedTuple, Optional, Sequence
+
+from sqlalchemy import Select, func, literal, select, union_all
+from sqlalchemy.orm import Session
+
+from app.models.grant import Grant, GrantApplication, GrantMilestone
+from app.models.profile import Education, Experience, Profile, Publication
+from app.models.project import Project, ProjectTeamMember
+from app.models.user import User
+
+class Freshness(NamedTuple):
+    last_modified: Optional[datetime] # Newest updated_at among the rows
+    row_count: int # Rows the response is built from; changes when any of them is deleted
+    found: bool # Whether the root entity exists (any root row, for lists)
+
+
+class CRUDFreshness:
+    """
+    Cheap validators for conditional GETs.
+
+    Each method aggregates `max(updated_at)` and `count(*)` over every row a response is
+    serialized from (the root rows plus the nested users, profiles, milestones, ...), in one
+    index-driven query that loads no ORM objects. Any insert or update moves the max; a
+    delete changes the count. The `ids` arguments are SELECTs of root ids, so list pages
+    pass the same ordered/offset query the listing uses.
+    """
+
+    @staticmethod
+    def _rows(timestamp, *criteria, root: bool = False) -> Select:
+        return select(timestamp.label("ts"), literal(1 if root else 0).label("root")).where(*criteria)
+
+    def _user_parts(self, user_ids: Select) -> List[Select]:
+        # schemas.User nests the profile with its experiences, educations and publications.
+        profile_ids = select(Profile.id).where(Profile.user_id.in_(user_ids))
+        return [
+            self._rows(User.updated_at, User.id.in_(user_ids)),
+            self._rows(Profile.updated_at, Profile.user_id.in_(user_ids)),
+            self._rows(Experience.updated_at, Experience.profile_id.in_(profile_ids)),
+            self._rows(Education.updated_at, Education.profile_id.in_(profile_ids)),
+            self._rows(Publication.updated_at, Publication.profile_id.in_(profile_ids)),
+        ]
+
+    @staticmethod
+    def _page(ids: Select) -> Select:
+        # Evaluate a page query once as a CTE rather than once per UNION branch.
+        page = ids.cte("page_ids")
+        return select(*page.c)
+
+    def _aggregate(self, db: Session, parts: List[Select], *, extra: Optional[Select] = None) -> Freshness:
+        rows = union_all(*parts).subquery()
+        stmt = select(func.max(rows.c.ts), func.count(), func.coalesce(func.sum(rows.c.root), 0))
+        last_modified, row_count, roots = db.execute(stmt).one()
+        if extra is not None:
+            # Table-wide state, so rows entering or leaving a page also change the validator.
+            extra_last_modified, extra_count = db.execute(extra).one()
+            row_count += extra_count
+            if extra_last_modified is not None and (last_modified is None or extra_last_modified > last_modified):
+                last_modified = extra_last_modified
+        return Freshness(last_modified, row_count, roots > 0)
+
+    # --- Grants ---
+
+    def _grant_parts(self, grant_ids: Select) -> List[Select]:
+        return [
+            self._rows(Grant.updated_at, Grant.id.in_(grant_ids), root=True),
+            self._rows(GrantMilestone.updated_at, GrantMilestone.grant_id.in_(grant_ids)),
+            self._rows(GrantApplication.updated_at, GrantApplication.grant_id.in_(grant_ids)),
+            *self._user_parts(select(Grant.proposer_id).where(Grant.id.in_(grant_ids))),
+            *self._user_parts(select(GrantApplication.applicant_id).where(GrantApplication.grant_id.in_(grant_ids))),
+        ]
+
+    def grant(self, db: Session, *, id: int) -> Freshness:
+        return self._aggregate(db, self._grant_parts(select(literal(id))))
+
+    def grants(self, db: Session, *, ids: Select) -> Freshness:
+        return self._aggregate(
+            db, self._grant_parts(self._page(ids)), extra=select(func.max(Grant.updated_at), func.count(Grant.id))
+        )
+
+    def grants_by_ids(self, db: Session, *, ids: Sequence[int]) -> Freshness:
+        return self._aggregate(db, self._grant_parts(select(Grant.id).where(Grant.id.in_(ids))))
+
+    # --- Projects ---
+
+    def _project_parts(self, project_ids: Select) -> List[Select]:
+        return [
+            self._rows(Project.updated_at, Project.id.in_(project_ids), root=True),
+            self._rows(ProjectTeamMember.updated_at, ProjectTeamMember.project_id.in_(project_ids)),
+            *self._user_parts(select(Project.creator_id).where(Project.id.in_(project_ids))),
+            *self._user_parts(select(ProjectTeamMember.user_id).where(ProjectTeamMember.project_id.in_(project_ids))),
+        ]
+
+    def project(self, db: Session, *, id: int) -> Freshness:
+        return self._aggregate(db, self._project_parts(select(literal(id))))
+
+    def projects(self, db: Session, *, ids: Select) -> Freshness:
+        return self._aggregate(
+            db, self._project_parts(self._page(ids)), extra=select(func.max(Project.updated_at), func.count(Project.id))
+        )
+
+    def projects_by_ids(self, db: Session, *, ids: Sequence[int]) -> Freshness:
+        return self._aggregate(db, self._project_parts(select(Project.id).where(Project.id.in_(ids))))
+
+    # --- Users and profiles ---
+
+    def user(self, db: Session, *, id: int) -> Freshness:
+        parts = self._user_parts(select(literal(id)))
+        parts[0] = self._rows(User.updated_at, User.id == id, root=True)
+        return self._aggregate(db, parts)
+
+    def users(self, db: Session, *, ids: Select) -> Freshness:
+        return self._aggregate(
+            db, self._user_parts(self._page(ids)), extra=select(func.max(User.updated_at), func.count(User.id))
+        )
+
+    def users_by_ids(self, db: Session, *, ids: Sequence[int]) -> Freshness:
+        parts = self._user_parts(select(User.id).where(User.id.in_(ids)))
+        parts[0] = self._rows(User.updated_at, User.id.in_(ids), root=True)
+        return self._aggregate(db, parts)
+
+    def profile_of_user(self, db: Session, *, user_id: int) -> Freshness:
+        parts = self._user_parts(select(literal(user_id)))[1:] # The profile, not the user row
+        parts[0] = self._rows(Profile.updated_at, Profile.user_id == user_id, root=True)
+        return self._aggregate(db, parts)
+
+
+freshness = CRUDFreshness()
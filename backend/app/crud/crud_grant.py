@@ -1,39 +1,106 @@
-from typing import List, Optional
-from sqlalchemy.orm import Session, joinedload, selectinload
+from datetime import datetime
+from typing import List, Optional, Sequence, Tuple
+from sqlalchemy import Select, func, select
+from sqlalchemy.orm import Session, joinedload, selectinload, undefer_group
 from .base import CRUDBase
+from app.db.base_class import DETAIL_TEXT
 from app.models.grant import Grant, GrantApplication
 from app.models.user import User # For funder type hint
 from app.schemas.grant import GrantCreate, GrantUpdate, GrantApplicationCreate, GrantApplicationUpdate
+from app.services.response_cache import response_cache
+from .crud_user import user_detail_options
 
 class CRUDGrant(CRUDBase[Grant, GrantCreate, GrantUpdate]):
+    def _on_write(self, db: Session, db_obj: Grant) -> None:
+        response_cache.invalidate(db, ("grants", f"grant:{db_obj.id}"))
+
+    def _page_order(self) -> tuple:
+        # Newest deadlines first (no deadline first, as DESC places NULLs); id breaks ties so
+        # `page_ids` and `get_multi_with_proposer` always select the same rows.
+        return (self.model.application_deadline.desc().nulls_first(), self.model.id)
+
     def get_multi_with_proposer(self, db: Session, *, skip: int = 0, limit: int = 100) -> List[Grant]:
         return (
             db.query(self.model)
             .options(joinedload(self.model.proposer)) # Eager load Funder
-            .order_by(self.model.application_deadline.desc()) # Example: newest deadlines first
+            .order_by(*self._page_order())
             .offset(skip)
             .limit(limit)
             .all()
         )
 
+    def page_ids(self, *, skip: int = 0, limit: int = 100) -> Select:
+        """SELECT of the grant ids on a `get_multi_with_proposer` page, for validators."""
+        return select(self.model.id).order_by(*self._page_order()).offset(skip).limit(limit)
+
+    def _detail_options(self) -> list:
+        # Everything schemas.Grant nests: proposer, milestones, applications and their users,
+        # plus the deferred text columns list queries skip.
+        proposer = joinedload(self.model.proposer) # Eager load Funder
+        applications = selectinload(self.model.applications)
+        applicant = applications.joinedload(GrantApplication.applicant)
+        return [
+            undefer_group(DETAIL_TEXT),
+            proposer, *user_detail_options(proposer),
+            selectinload(self.model.milestones),
+            applications.undefer_group(DETAIL_TEXT),
+            applicant, *user_detail_options(applicant),
+        ]
+
     def get_with_proposer(self, db: Session, *, id: int) -> Optional[Grant]:
         return (
             db.query(self.model)
-            .options(joinedload(self.model.proposer)) # Eager load Funder
+            .options(*self._detail_options())
             .filter(self.model.id == id)
             .first()
         )
     
+    def get_many_with_proposer(self, db: Session, *, ids: Sequence[int]) -> List[Grant]:
+        """Fetch grants by id with the same eager loads as `get_with_proposer`, in the order of `ids`."""
+        if not ids:
+            return []
+        grants = (
+            db.query(self.model)
+            .options(*self._detail_options())
+            .filter(self.model.id.in_(ids))
+            .all()
+        )
+        return self._in_order(grants, ids)
+
+    def get_sync_state(self, db: Session) -> Tuple[Optional[datetime], int]:
+        """Return `(max(updated_at), row count)` for in-memory indexes to poll."""
+        max_updated_at, count = db.query(func.max(self.model.updated_at), func.count(self.model.id)).one()
+        return max_updated_at, count
+
+    def get_text_rows_since(self, db: Session, *, since: Optional[datetime]) -> List[Tuple]:
+        """
+        Lightweight rows for text indexing: (id, title, description, eligibility_criteria,
+        status, application_deadline), for grants updated at or after `since` (all if None).
+        """
+        query = db.query(
+            self.model.id, self.model.title, self.model.description, self.model.eligibility_criteria,
+            self.model.status, self.model.application_deadline,
+        )
+        if since is not None:
+            query = query.filter(self.model.updated_at >= since)
+        return query.all()
+
     def create_with_proposer(self, db: Session, *, obj_in: GrantCreate, proposer_id: int) -> Grant:
         db_obj = self.model(**obj_in.model_dump(), proposer_id=proposer_id) # Pydantic v2
         # db_obj = self.model(**obj_in.dict(), funder_id=funder_id) # Pydantic v1
         db.add(db_obj)
+        db.flush()
+        self._on_write(db, db_obj)
+        self._audit(db, "insert", db_obj)
         db.commit()
         db.refresh(db_obj)
         return db_obj
 
 # --- CRUD FOR GRANT APPLICATIONS ---
 class CRUDGrantApplication(CRUDBase[GrantApplication, GrantApplicationCreate, GrantApplicationUpdate]):
+    def _on_write(self, db: Session, db_obj: GrantApplication) -> None:
+        response_cache.invalidate(db, ("grants", f"grant:{db_obj.grant_id}"))
+
     def create_with_applicant(
         self, db: Session, *, obj_in: GrantApplicationCreate, applicant_id: int
     ) -> GrantApplication:
@@ -41,6 +108,9 @@ class CRUDGrantApplication(CRUDBase[GrantApplication, GrantApplicationCreate, Gr
         # db_obj_data = obj_in.dict() # Pydantic v1
         db_obj = self.model(**db_obj_data, applicant_id=applicant_id, grant_id=obj_in.grant_id) # applicant_id from param, grant_id from schema
         db.add(db_obj)
+        db.flush()
+        self._on_write(db, db_obj)
+        self._audit(db, "insert", db_obj)
         db.commit()
         db.refresh(db_obj)
         return db_obj
@@ -73,5 +143,23 @@ class CRUDGrantApplication(CRUDBase[GrantApplication, GrantApplicationCreate, Gr
             .all()
         )
 
+    def export_query(self, *, grant_id: Optional[int] = None) -> Select:
+        """
+        Core SELECT of applications (all columns, including the cover letter) with the
+        applicant's name and wallet, in id order, for the streaming exports.
+        """
+        stmt = (
+            select(
+                *self.model.__table__.columns,
+                User.full_name.label("applicant_name"),
+                User.wallet_address.label("applicant_wallet_address"),
+            )
+            .join(User, User.id == self.model.applicant_id)
+            .order_by(self.model.id)
+        )
+        if grant_id is not None:
+            stmt = stmt.where(self.model.grant_id == grant_id)
+        return stmt
+
 grant = CRUDGrant(Grant)
 grant_application = CRUDGrantApplication(GrantApplication)
\ No newline at end of file
@@ -1,10 +1,14 @@
 # backend/app/crud/crud_profile.py
 from typing import Any, Dict, List, Optional, Union
 from pydantic import HttpUrl
-from sqlalchemy.orm import Session, joinedload, selectinload
+from sqlalchemy.orm import Session, joinedload, selectinload, undefer_group
 
 from app.crud.base import CRUDBase
+from app.db.base_class import DETAIL_TEXT
+from app.crud.crud_talent_pool import talent_pool
 from app.models.profile import Profile, Experience, Education, Publication
+from app.services.audit import audit_log, object_image
+from app.services.response_cache import response_cache
 from app.schemas.profile import (
     ProfileCreate, ProfileUpdate,
     ExperienceCreate, ExperienceUpdate,
@@ -12,19 +16,38 @@ from app.schemas.profile import (
     PublicationCreate, PublicationUpdate
 )
 
+# Profiles are nested into every user in grant/project responses, and feed the talent pool.
+PROFILE_CACHE_TAGS = ("users", "talent_pool")
+
 class CRUDExperience(CRUDBase[Experience, ExperienceCreate, ExperienceUpdate]):
+    def _on_write(self, db: Session, db_obj: Experience) -> None:
+        talent_pool.refresh_profiles(db, profile_ids=[db_obj.profile_id])
+        response_cache.invalidate(db, PROFILE_CACHE_TAGS)
+
     def get_multi_by_profile(self, db: Session, *, profile_id: int, skip: int = 0, limit: int = 100) -> List[Experience]:
         return db.query(self.model).filter(self.model.profile_id == profile_id).offset(skip).limit(limit).all()
 
 class CRUDEducation(CRUDBase[Education, EducationCreate, EducationUpdate]):
+    def _on_write(self, db: Session, db_obj: Education) -> None:
+        talent_pool.refresh_profiles(db, profile_ids=[db_obj.profile_id])
+        response_cache.invalidate(db, PROFILE_CACHE_TAGS)
+
     def get_multi_by_profile(self, db: Session, *, profile_id: int, skip: int = 0, limit: int = 100) -> List[Education]:
         return db.query(self.model).filter(self.model.profile_id == profile_id).offset(skip).limit(limit).all()
 
 class CRUDPublication(CRUDBase[Publication, PublicationCreate, PublicationUpdate]):
+    def _on_write(self, db: Session, db_obj: Publication) -> None:
+        talent_pool.refresh_profiles(db, profile_ids=[db_obj.profile_id])
+        response_cache.invalidate(db, PROFILE_CACHE_TAGS)
+
     def get_multi_by_profile(self, db: Session, *, profile_id: int, skip: int = 0, limit: int = 100) -> List[Publication]:
         return db.query(self.model).filter(self.model.profile_id == profile_id).offset(skip).limit(limit).all()
 
 class CRUDProfile(CRUDBase[Profile, ProfileCreate, ProfileUpdate]):
+    def _on_write(self, db: Session, db_obj: Profile) -> None:
+        talent_pool.refresh_profiles(db, profile_ids=[db_obj.id])
+        response_cache.invalidate(db, PROFILE_CACHE_TAGS)
+
     def get_by_user_id(self, db: Session, *, user_id: int) -> Optional[Profile]:
         return db.query(self.model).filter(self.model.user_id == user_id).first()
     
@@ -37,9 +60,10 @@ class CRUDProfile(CRUDBase[Profile, ProfileCreate, ProfileUpdate]):
             db.query(self.model)
             .filter(self.model.user_id == user_id)
             .options(
+                undefer_group(DETAIL_TEXT),
                 selectinload(self.model.experiences),
                 selectinload(self.model.educations), # MODIFIED: was education_entries, model uses 'educations'
-                selectinload(self.model.publications)
+                selectinload(self.model.publications).undefer_group(DETAIL_TEXT)
             )
             .first()
         )
@@ -48,6 +72,8 @@ class CRUDProfile(CRUDBase[Profile, ProfileCreate, ProfileUpdate]):
         """
         Retrieves profiles that are marked as visible in the talent pool,
         eagerly loading the associated user.
+        The public talent-pool page reads `crud.talent_pool` instead; this stays for
+        callers that need the full ORM objects.
         """
         return (
             db.query(self.model)
@@ -71,6 +97,9 @@ class CRUDProfile(CRUDBase[Profile, ProfileCreate, ProfileUpdate]):
         profile_data = obj_in.model_dump()
         db_obj = Profile(**profile_data, user_id=user_id)
         db.add(db_obj)
+        db.flush()
+        self._on_write(db, db_obj)
+        self._audit(db, "insert", db_obj)
         db.commit()
         db.refresh(db_obj)
         return db_obj
@@ -84,6 +113,7 @@ class CRUDProfile(CRUDBase[Profile, ProfileCreate, ProfileUpdate]):
     ) -> Optional[Profile]:
         db_obj = self.get_by_user_id(db, user_id=user_id)
         if db_obj:
+            before = object_image(db_obj)
             update_data = obj_in if isinstance(obj_in, dict) else obj_in.model_dump(exclude_unset=True)
             for field, value in update_data.items():
                 # Convert HttpUrl to string before setting attribute
@@ -92,6 +122,9 @@ class CRUDProfile(CRUDBase[Profile, ProfileCreate, ProfileUpdate]):
                 else:
                     setattr(db_obj, field, value)
             db.add(db_obj)
+            db.flush()
+            self._on_write(db, db_obj)
+            self._audit(db, "update", db_obj, before=before)
             db.commit()
             db.refresh(db_obj)
         return db_obj
@@ -103,6 +136,9 @@ class CRUDProfile(CRUDBase[Profile, ProfileCreate, ProfileUpdate]):
         db_obj = Experience(**experience_in.model_dump(), profile_id=profile_id) # Pydantic v2
         # db_obj = Experience(**experience_in.dict(), profile_id=profile_id) # Pydantic v1
         db.add(db_obj)
+        db.flush()
+        talent_pool.refresh_profiles(db, profile_ids=[profile_id]) # experience_count changed
+        audit_log.record_object(db, "insert", db_obj)
         db.commit()
         db.refresh(db_obj)
         return db_obj
@@ -1,11 +1,18 @@
-from typing import List, Optional
-from sqlalchemy.orm import Session, joinedload, selectinload
+from typing import List, Optional, Sequence
+from sqlalchemy import Select, select
+from sqlalchemy.orm import Session, joinedload, selectinload, undefer_group
 from .base import CRUDBase
+from app.db.base_class import DETAIL_TEXT
 from app.models.project import Project, ProjectTeamMember, ProjectApplication
 from app.models.user import User # For type hints
 from app.schemas.project import ProjectCreate, ProjectTeamMemberUpdate, ProjectUpdate, ProjectTeamMemberCreate, ProjectApplicationCreate, ProjectApplicationUpdate
+from app.services.response_cache import response_cache
+from .crud_user import user_detail_options
 
 class CRUDProject(CRUDBase[Project, ProjectCreate, ProjectUpdate]):
+    def _on_write(self, db: Session, db_obj: Project) -> None:
+        response_cache.invalidate(db, ("projects", f"project:{db_obj.id}"))
+
     def get_multi_detailed(self, db: Session, *, skip: int = 0, limit: int = 100) -> List[Project]:
         return (
             db.query(self.model)
@@ -13,24 +20,48 @@ class CRUDProject(CRUDBase[Project, ProjectCreate, ProjectUpdate]):
                 joinedload(self.model.creator), # Eager load Creator
                 selectinload(self.model.team_members).joinedload(ProjectTeamMember.user) # Eager load team members and their user details
             )
-            .order_by(self.model.created_at.desc()) # Example ordering
+            .order_by(self.model.created_at.desc(), self.model.id) # Newest first; id breaks ties so page_ids selects the same rows
             .offset(skip)
             .limit(limit)
             .all()
         )
 
+    def page_ids(self, *, skip: int = 0, limit: int = 100) -> Select:
+        """SELECT of the project ids on a `get_multi_detailed` page, for validators."""
+        return select(self.model.id).order_by(self.model.created_at.desc(), self.model.id).offset(skip).limit(limit)
+
+    def _detail_options(self) -> list:
+        creator = joinedload(self.model.creator)
+        member = selectinload(self.model.team_members).joinedload(ProjectTeamMember.user)
+        applications = selectinload(self.model.applications)
+        return [
+            undefer_group(DETAIL_TEXT), # Description; list queries leave it deferred
+            creator, *user_detail_options(creator),
+            member, *user_detail_options(member),
+            applications.undefer_group(DETAIL_TEXT),
+            applications.joinedload(ProjectApplication.applicant) # Also load applications and their applicants
+        ]
+
     def get_detailed(self, db: Session, *, id: int) -> Optional[Project]:
         return (
             db.query(self.model)
-            .options(
-                joinedload(self.model.creator),
-                selectinload(self.model.team_members).joinedload(ProjectTeamMember.user),
-                selectinload(self.model.applications).joinedload(ProjectApplication.applicant) # Also load applications and their applicants
-            )
+            .options(*self._detail_options())
             .filter(self.model.id == id)
             .first()
         )
 
+    def get_many_detailed(self, db: Session, *, ids: Sequence[int]) -> List[Project]:
+        """Fetch projects by id with the same eager loads as `get_detailed`, in the order of `ids`."""
+        if not ids:
+            return []
+        projects = (
+            db.query(self.model)
+            .options(*self._detail_options())
+            .filter(self.model.id.in_(ids))
+            .all()
+        )
+        return self._in_order(projects, ids)
+
     def create_with_creator(self, db: Session, *, obj_in: ProjectCreate, creator_id: int) -> Project:
         db_obj = self.model(**obj_in.model_dump(), created_by_user_id=creator_id) # Pydantic v2
         # db_obj = self.model(**obj_in.dict(), created_by_user_id=creator_id) # Pydantic v1
@@ -40,11 +71,17 @@ class CRUDProject(CRUDBase[Project, ProjectCreate, ProjectUpdate]):
         # db.add(team_member_obj) # Add before adding db_obj if project needs team_member on creation, or handle separately
         
         db.add(db_obj)
+        db.flush()
+        self._on_write(db, db_obj)
+        self._audit(db, "insert", db_obj)
         db.commit()
         db.refresh(db_obj)
         return db_obj
 
 class CRUDProjectTeamMember(CRUDBase[ProjectTeamMember, ProjectTeamMemberCreate, ProjectTeamMemberUpdate]): # Assuming ProjectTeamMemberUpdate schema exists
+    def _on_write(self, db: Session, db_obj: ProjectTeamMember) -> None:
+        response_cache.invalidate(db, ("projects", f"project:{db_obj.project_id}"))
+
     def add_team_member(self, db: Session, *, obj_in: ProjectTeamMemberCreate) -> ProjectTeamMember:
         # Check if user is already a member (optional, can be handled by unique constraint too)
         existing_member = db.query(self.model).filter_by(project_id=obj_in.project_id, user_id=obj_in.user_id).first()
@@ -54,17 +91,26 @@ class CRUDProjectTeamMember(CRUDBase[ProjectTeamMember, ProjectTeamMemberCreate,
         db_obj = self.model(**obj_in.model_dump()) # Pydantic v2
         # db_obj = self.model(**obj_in.dict()) # Pydantic v1
         db.add(db_obj)
+        db.flush()
+        self._on_write(db, db_obj)
+        self._audit(db, "insert", db_obj)
         db.commit()
         db.refresh(db_obj)
         return db_obj
 
 class CRUDProjectApplication(CRUDBase[ProjectApplication, ProjectApplicationCreate, ProjectApplicationUpdate]):
+    def _on_write(self, db: Session, db_obj: ProjectApplication) -> None:
+        response_cache.invalidate(db, ("projects", f"project:{db_obj.project_id}"))
+
     def create_with_applicant(
         self, db: Session, *, obj_in: ProjectApplicationCreate, applicant_id: int
     ) -> ProjectApplication:
         db_obj = self.model(**obj_in.model_dump(), user_id=applicant_id) # Pydantic v2
         # db_obj = self.model(**obj_in.dict(), user_id=applicant_id) # Pydantic v1
         db.add(db_obj)
+        db.flush()
+        self._on_write(db, db_obj)
+        self._audit(db, "insert", db_obj)
         db.commit()
         db.refresh(db_obj)
         return db_obj
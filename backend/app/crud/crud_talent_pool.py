@@ -0,0 +1,122 @@
+# backend/app/crud/crud_talent_pool.py
+from datetime import datetime
+from typing import Iterable, List, Optional, Sequence, Tuple
+
+from sqlalchemy import delete, func, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.orm import Session
+
+from app.models.profile import Profile, Experience, Education, Publication
+from app.models.talent_pool import TalentPoolEntry
+from app.models.user import User
+
+class CRUDTalentPool:
+    """
+    Maintains the denormalized `talent_pool_entries` read model.
+
+    Refreshes are set-based `INSERT ... SELECT ... ON CONFLICT DO UPDATE` statements
+    that run inside the caller's transaction, so the read model commits (or rolls
+    back) together with the profile/user write that triggered it.
+    """
+    model = TalentPoolEntry
+
+    def _source_query(self, *criteria):
+        def _count(child):
+            return (
+                select(func.count(child.id))
+                .where(child.profile_id == Profile.id)
+                .correlate(Profile)
+                .scalar_subquery()
+            )
+
+        return (
+            select(
+                Profile.id.label("profile_id"),
+                Profile.user_id,
+                User.wallet_address,
+                User.full_name,
+                User.role,
+                func.coalesce(User.is_active, True).label("is_active"),
+                User.created_at.label("user_created_at"),
+                Profile.avatar_url,
+                Profile.current_role,
+                Profile.headline,
+                Profile.skills,
+                Profile.research_interests,
+                _count(Experience).label("experience_count"),
+                _count(Education).label("education_count"),
+                _count(Publication).label("publication_count"),
+                # clock_timestamp() rather than now(): now() is frozen at transaction start,
+                # which would make long transactions look older than they are to watermark readers.
+                func.clock_timestamp().label("refreshed_at"),
+            )
+            .join(User, User.id == Profile.user_id)
+            .where(Profile.is_visible_in_talent_pool.is_(True), *criteria)
+        )
+
+    def _refresh(self, db: Session, *criteria) -> None:
+        # Drop rows for profiles that are no longer visible...
+        hidden_ids = select(Profile.id).where(Profile.is_visible_in_talent_pool.is_(False), *criteria)
+        db.execute(delete(self.model).where(self.model.profile_id.in_(hidden_ids)))
+
+        # ...and upsert the visible ones.
+        source = self._source_query(*criteria)
+        columns = [c.name for c in source.selected_columns]
+        stmt = pg_insert(self.model).from_select(columns, source)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[self.model.profile_id],
+            set_={name: stmt.excluded[name] for name in columns if name != "profile_id"},
+        )
+        db.execute(stmt)
+
+    def refresh_profiles(self, db: Session, *, profile_ids: Iterable[int]) -> None:
+        """Re-derive the read-model rows for the given profiles. Does not commit."""
+        ids = list(set(profile_ids))
+        if ids:
+            self._refresh(db, Profile.id.in_(ids))
+
+    def refresh_users(self, db: Session, *, user_ids: Iterable[int]) -> None:
+        """Re-derive the read-model rows for the profiles of the given users. Does not commit."""
+        ids = list(set(user_ids))
+        if ids:
+            self._refresh(db, Profile.user_id.in_(ids))
+
+    def rebuild(self, db: Session) -> None:
+        """Rebuild the whole read model from scratch. Does not commit."""
+        db.execute(delete(self.model))
+        self._refresh(db)
+
+    def get_multi(self, db: Session, *, skip: int = 0, limit: int = 100) -> List[TalentPoolEntry]:
+        return (
+            db.query(self.model)
+            .order_by(self.model.profile_id)
+            .offset(skip)
+            .limit(limit)
+            .all()
+        )
+
+    def get_by_profile_ids(self, db: Session, *, profile_ids: Sequence[int]) -> List[TalentPoolEntry]:
+        """Fetch rows by primary key, returned in the order of `profile_ids`."""
+        if not profile_ids:
+            return []
+        rows = db.query(self.model).filter(self.model.profile_id.in_(profile_ids)).all()
+        by_id = {row.profile_id: row for row in rows}
+        return [by_id[pid] for pid in profile_ids if pid in by_id]
+
+    # --- Change tracking for in-memory indexes built on top of the read model ---
+
+    def get_sync_state(self, db: Session) -> Tuple[Optional[datetime], int]:
+        """Return `(max(refreshed_at), row count)`, the cheap validator indexes poll."""
+        max_refreshed_at, count = db.query(
+            func.max(self.model.refreshed_at), func.count(self.model.profile_id)
+        ).one()
+        return max_refreshed_at, count
+
+    def get_refreshed_since(self, db: Session, *, since: Optional[datetime]) -> List[TalentPoolEntry]:
+        """Rows refreshed at or after `since` (all rows when `since` is None)."""
+        query = db.query(self.model)
+        if since is not None:
+            query = query.filter(self.model.refreshed_at >= since)
+        return query.order_by(self.model.profile_id).all()
+
+talent_pool = CRUDTalentPool()
@@ -1,11 +1,32 @@
-from sqlalchemy.orm import Session
-from typing import Optional, List, Union, Dict, Any
+from sqlalchemy import Select, case, func, literal, or_, select
+from sqlalchemy.orm import Load, Session
+from typing import Optional, List, Sequence, Union, Dict, Any, Tuple
 
 from app.models.user import User, UserRole # Ensure UserRole is imported if used directly
+from app.models.profile import Profile
 from app.schemas.user import UserCreate, UserUpdate
 from app.crud.base import CRUDBase
+from app.db.base_class import DETAIL_TEXT
+from app.crud.crud_talent_pool import talent_pool
+from app.services.audit import object_image
+from app.services.response_cache import response_cache
 # from app.core.security import get_password_hash # Keep local imports if for circular dependency
 
+def user_detail_options(path: Load) -> List[Load]:
+    """
+    Loader options for everything schemas.User nests (profile, experiences, educations,
+    publications) below `path`, a loader option that ends at a User relationship. Each
+    level is one SELECT ... IN for the whole result set instead of a lazy load per user,
+    and the deferred text columns (about, abstracts) are loaded with it.
+    """
+    profile = path.selectinload(User.profile)
+    return [
+        profile.undefer_group(DETAIL_TEXT),
+        profile.selectinload(Profile.experiences),
+        profile.selectinload(Profile.educations),
+        profile.selectinload(Profile.publications).undefer_group(DETAIL_TEXT),
+    ]
+
 class CRUDUser(CRUDBase[User, UserCreate, UserUpdate]):
     def __init__(self):
         """
@@ -21,6 +42,11 @@ class CRUDUser(CRUDBase[User, UserCreate, UserUpdate]):
     CRUD operations for User model.
     Inherits from CRUDBase for common operations.
     """
+    def _on_write(self, db: Session, db_obj: User) -> None:
+        # Name, role and activity are copied into the talent-pool read model.
+        talent_pool.refresh_users(db, user_ids=[db_obj.id])
+        response_cache.invalidate(db, ("users", "talent_pool"))
+
     def get_user(self, db: Session, user_id: int) -> Optional[User]:
         return db.query(User).filter(User.id == user_id).first()
 
@@ -30,8 +56,57 @@ class CRUDUser(CRUDBase[User, UserCreate, UserUpdate]):
     def get_user_by_wallet_address(self, db: Session, wallet_address: str) -> Optional[User]:
         return db.query(User).filter(User.wallet_address == wallet_address).first()
 
+    def get_many_detailed(self, db: Session, *, ids: Sequence[int]) -> List[User]:
+        """Users by id with their nested profile data eager-loaded, in the order of `ids`."""
+        if not ids:
+            return []
+        users = (
+            db.query(User)
+            .options(*user_detail_options(Load(User)))
+            .filter(User.id.in_(ids))
+            .all()
+        )
+        return self._in_order(users, ids)
+
     def get_users(self, db: Session, skip: int = 0, limit: int = 100) -> List[User]:
-        return db.query(User).offset(skip).limit(limit).all()
+        return db.query(User).order_by(User.id).offset(skip).limit(limit).all() # Stable pages
+
+    def page_ids(self, *, skip: int = 0, limit: int = 100) -> Select:
+        """SELECT of the user ids on a `get_users` page, for validators."""
+        return select(User.id).order_by(User.id).offset(skip).limit(limit)
+
+    def search_users(
+        self, db: Session, *, query: str, limit: int = 20, include_email: bool = False
+    ) -> List[Tuple[User, float]]:
+        """
+        Fuzzy lookup by partial full name (and email, if `include_email`) or wallet prefix.
+
+        Every predicate is served by a pg_trgm GIN index (`%` similarity and ILIKE), so the
+        candidates come from a bitmap OR over the indexes instead of a table scan. Results
+        are `(user, score)` pairs ranked by the best trigram similarity; a wallet prefix
+        match scores 1.
+        """
+        pattern = query.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+        wallet_match = User.wallet_address.ilike(f"{pattern}%")
+        criteria = [
+            User.full_name.op("%")(query),
+            User.full_name.ilike(f"%{pattern}%"),
+            wallet_match,
+        ]
+        scores = [func.similarity(func.coalesce(User.full_name, ""), query)]
+        if include_email:
+            criteria += [User.email.op("%")(query), User.email.ilike(f"%{pattern}%")]
+            scores.append(func.similarity(func.coalesce(User.email, ""), query))
+        score = func.greatest(case((wallet_match, literal(1.0)), else_=literal(0.0)), *scores).label("score")
+
+        rows = (
+            db.query(User, score)
+            .filter(or_(*criteria))
+            .order_by(score.desc(), User.id)
+            .limit(limit)
+            .all()
+        )
+        return [(user, float(user_score)) for user, user_score in rows]
 
     def create_user(self, db: Session, user_in: UserCreate) -> User:
         hashed_password = None
@@ -55,6 +130,8 @@ class CRUDUser(CRUDBase[User, UserCreate, UserUpdate]):
         db_user_obj = self.model(**db_user_data) 
         
         db.add(db_user_obj)
+        db.flush()
+        self._audit(db, "insert", db_user_obj)
         db.commit()
         db.refresh(db_user_obj)
         return db_user_obj
@@ -83,10 +160,14 @@ class CRUDUser(CRUDBase[User, UserCreate, UserUpdate]):
             if existing_user_with_email and existing_user_with_email.id != db_user.id:
                 raise ValueError("Email already registered to another user.")
 
+        before = object_image(db_user)
         for field, value in update_data.items():
             setattr(db_user, field, value)
         
         db.add(db_user)
+        db.flush()
+        self._on_write(db, db_user)
+        self._audit(db, "update", db_user, before=before)
         db.commit()
         db.refresh(db_user)
         return db_user
@@ -97,7 +178,11 @@ class CRUDUser(CRUDBase[User, UserCreate, UserUpdate]):
         # For clarity and consistency with other method names, keeping this custom one is okay.
         db_user_obj = db.query(self.model).get(user_id) 
         if db_user_obj:
+            before = object_image(db_user_obj)
             db.delete(db_user_obj)
+            db.flush()
+            self._audit(db, "delete", db_user_obj, before=before)
+            response_cache.invalidate(db, ("users", "talent_pool", "grant:*", "project:*", "grants", "projects"))
             db.commit()
         return db_user_obj
 
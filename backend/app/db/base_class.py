@@ -2,6 +2,10 @@ from sqlalchemy.orm import declarative_base
 from typing import Any
 from sqlalchemy.ext.declarative import as_declarative, declared_attr
 
+# Deferred column group for unbounded Text columns that only detail views render. List
+# queries leave them in storage; detail loaders undefer the group.
+DETAIL_TEXT = "detail_text"
+
 @as_declarative()
 class Base:
     id: Any
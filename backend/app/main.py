@@ -1,5 +1,6 @@
 from fastapi import FastAPI, Depends, HTTPException, status # type: ignore
 from fastapi.middleware.cors import CORSMiddleware # type: ignore
+from fastapi.responses import ORJSONResponse # type: ignore
 
 from app.core.config import settings
 from app.api.v1.api import api_router as api_v1_router
@@ -7,10 +8,14 @@ from app.db.database import engine # If using SQLAlchemy and need to create tabl
 from app.db.base_class import Base # To create tables
 
 from app.api import deps # For admin route protection
+from app.services.autocomplete import autocomplete_index
+from app.services.jobs import job_runner
+from app.services.audit import audit_log
 
 app = FastAPI(
     title=settings.PROJECT_NAME,
-    openapi_url=f"{settings.API_V1_STR}/openapi.json"
+    openapi_url=f"{settings.API_V1_STR}/openapi.json",
+    default_response_class=ORJSONResponse, # orjson instead of the stdlib json encoder
 )
 
 # Set all CORS enabled origins
@@ -29,8 +34,17 @@ async def startup_event():
     # For development/hackathon, you might create tables here if they don't exist.
     # In production, rely solely on Alembic.
     # init_db() # Uncomment if you want to auto-create tables on startup
+    autocomplete_index.start() # Builds the typeahead index in the background, then keeps it fresh
+    job_runner.start() # Fails jobs a previous process left unfinished, then starts the worker pool
+    audit_log.start() # Writes buffered audit entries in batches
     print("Application startup complete.")
 
+@app.on_event("shutdown")
+def shutdown_event():
+    autocomplete_index.stop()
+    job_runner.stop()
+    audit_log.stop() # Flushes what is still queued
+
 app.include_router(api_v1_router, prefix=settings.API_V1_STR)
 
 
@@ -4,6 +4,10 @@ from .profile import Profile, Experience, Education, Publication
 
 from .grant import Grant, GrantStatus, GrantType, GrantMilestone, GrantApplication, GrantApplicationStatus
 from .project import Project, ProjectStatus, ProjectCategory, ProjectStatus, ProjectTeamMember, ProjectApplication, ProjectApplicationStatus 
+from .talent_pool import TalentPoolEntry
+from .change_tombstone import ChangeTombstone
+from .admin_job import AdminJob, AdminJobStatus
+from .audit_log import AuditLogEntry
 
 # You can define __all__ if you want to control `from app.models import *` behavior
 __all__ = [
@@ -13,4 +17,8 @@ __all__ = [
     "Project", "ProjectStatus", "ProjectCategory", "ProjectTeamMember",
     "ProjectApplication", # This is Project's application model
     "ProjectApplicationStatus", # This is Project's application status enum
+    "TalentPoolEntry",
+    "ChangeTombstone",
+    "AdminJob", "AdminJobStatus",
+    "AuditLogEntry",
 ]
\ No newline at end of file
@@ -0,0 +1,37 @@
+import enum
+from sqlalchemy import Boolean, Column, DateTime, Enum as DBEnum, ForeignKey, Integer, JSON, String, Text
+from sqlalchemy.sql import func
+
+from app.db.base_class import Base
+
+class AdminJobStatus(str, enum.Enum):
+    QUEUED = "queued"
+    RUNNING = "running"
+    SUCCEEDED = "succeeded"
+    FAILED = "failed"
+    CANCELLED = "cancelled"
+
+class AdminJob(Base):
+    """
+    A long admin operation (seeding, cascade delete, ...) run by the in-process job runner
+    (app/services/jobs.py). The row is the job's persisted status: clients poll it, the
+    runner writes progress to it, and cancellation is requested through it.
+    """
+    __tablename__ = "admin_jobs"
+
+    id = Column(Integer, primary_key=True, index=True)
+    kind = Column(String(64), nullable=False) # e.g. "seed_all", "delete_row"
+    status = Column(DBEnum(AdminJobStatus), default=AdminJobStatus.QUEUED, nullable=False, index=True)
+    params = Column(JSON, nullable=True)
+    progress_current = Column(Integer, default=0, nullable=False)
+    progress_total = Column(Integer, nullable=True) # None while unknown
+    message = Column(String(255), nullable=True) # Current step
+    result = Column(JSON, nullable=True)
+    error = Column(Text, nullable=True)
+    cancel_requested = Column(Boolean, default=False, nullable=False)
+    created_by_id = Column(Integer, ForeignKey("users.id", ondelete="SET NULL"), nullable=True, index=True)
+
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    started_at = Column(DateTime(timezone=True), nullable=True)
+    finished_at = Column(DateTime(timezone=True), nullable=True)
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
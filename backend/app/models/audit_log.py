@@ -0,0 +1,26 @@
+from sqlalchemy import BigInteger, Column, DateTime, Index, Integer, JSON, String
+
+from app.db.base_class import Base
+
+class AuditLogEntry(Base):
+    """
+    Before/after image of one row changed through the admin table editor or the CRUD
+    layer. Written in batches by the audit log writer (app/services/audit.py) after the
+    change commits, so `occurred_at` is the time of the change, not of the insert.
+    `actor_id` has no foreign key: entries outlive the users they name.
+    """
+    __tablename__ = "audit_log"
+    __table_args__ = (
+        Index("ix_audit_log_table_row", "table_name", "row_id", "id"),
+    )
+
+    id = Column(BigInteger, primary_key=True)
+    occurred_at = Column(DateTime(timezone=True), nullable=False, index=True)
+    actor_id = Column(Integer, nullable=True, index=True) # None for system writes (jobs, scripts)
+    source = Column(String(16), nullable=False) # "admin" or "crud"
+    action = Column(String(16), nullable=False) # "insert", "update" or "delete"
+    table_name = Column(String(64), nullable=False)
+    row_id = Column(String(64), nullable=True) # Primary key, as text
+    before = Column(JSON(none_as_null=True), nullable=True)
+    after = Column(JSON(none_as_null=True), nullable=True)
+    details = Column(JSON(none_as_null=True), nullable=True) # e.g. the statements of a cascade delete
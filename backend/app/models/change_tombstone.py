@@ -0,0 +1,23 @@
+from sqlalchemy import BigInteger, Column, DateTime, Index, Integer, String
+from sqlalchemy.sql import func
+
+from app.db.base_class import Base
+
+class ChangeTombstone(Base):
+    """
+    Record of a deleted row, for the /changes feed.
+
+    Written only by the AFTER DELETE triggers that the change-feed migration installs on
+    the fed tables, so deletes through the ORM, the admin table editor and ON DELETE
+    CASCADE are all captured. `deleted_at` is the deleting transaction's now(), like
+    `updated_at` on live rows.
+    """
+    __tablename__ = "change_tombstones"
+    __table_args__ = (
+        Index("ix_change_tombstones_deleted_at_id", "deleted_at", "id"),
+    )
+
+    id = Column(BigInteger, primary_key=True)
+    entity = Column(String(32), nullable=False) # Feed entity name, e.g. "grant"
+    entity_id = Column(Integer, nullable=False)
+    deleted_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
@@ -1,10 +1,11 @@
 import enum
 import datetime
-from sqlalchemy import Column, Date, Integer, String, Text, Boolean, DateTime, Enum as DBEnum, ForeignKey, Numeric, JSON
-from sqlalchemy.orm import relationship
+from sqlalchemy import Column, Computed, Date, Index, Integer, String, Text, Boolean, DateTime, Enum as DBEnum, ForeignKey, Numeric, JSON
+from sqlalchemy.dialects.postgresql import TSVECTOR
+from sqlalchemy.orm import deferred, relationship
 from sqlalchemy.sql import func
 
-from app.db.base_class import Base
+from app.db.base_class import Base, DETAIL_TEXT
 # from .user import User # Import User later to avoid circularity if needed
 
 class GrantStatus(str, enum.Enum):
@@ -31,8 +32,20 @@ class GrantApplicationStatus(str, enum.Enum): # Added
     REJECTED = "rejected"
     WITHDRAWN = "withdrawn"
 
+# Weighted full-text document for /search; kept by Postgres as a STORED generated column.
+GRANT_SEARCH_VECTOR_SQL = (
+    "setweight(to_tsvector('english', coalesce(title, '')), 'A') || "
+    "setweight(to_tsvector('english', coalesce(description, '')), 'B') || "
+    "setweight(to_tsvector('english', coalesce(eligibility_criteria, '')), 'C')"
+)
+
 class Grant(Base):
     __tablename__ = "grants"
+    __table_args__ = (
+        Index("ix_grants_search_vector", "search_vector", postgresql_using="gin"),
+        # Trigram index for fuzzy title autocomplete
+        Index("ix_grants_title_trgm", "title", postgresql_using="gin", postgresql_ops={"title": "gin_trgm_ops"}),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     title = Column(String, index=True, nullable=False)
@@ -50,17 +63,20 @@ class Grant(Base):
     start_date_expected = Column(Date, nullable=True)
     end_date_expected = Column(Date, nullable=True)
 
-    eligibility_criteria = Column(Text, nullable=True) # Added
+    eligibility_criteria = deferred(Column(Text, nullable=True), group=DETAIL_TEXT) # Added
     website_link = Column(String, nullable=True) # Added
 
-    review_notes = Column(Text, nullable=True)
+    review_notes = deferred(Column(Text, nullable=True), group=DETAIL_TEXT)
     lisk_transaction_hash_funding = Column(String, nullable=True, index=True)
 
     created_at = Column(DateTime(timezone=True), server_default=func.now())
-    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), index=True)
 
     talent_requirements = Column(JSON, nullable=True)
 
+    # Deferred: only the search queries read it, never the ORM.
+    search_vector = deferred(Column(TSVECTOR, Computed(GRANT_SEARCH_VECTOR_SQL, persisted=True)))
+
     proposer = relationship("User", back_populates="grants_proposed")
     milestones = relationship("GrantMilestone", back_populates="grant", cascade="all, delete-orphan", order_by="GrantMilestone.order")
     applications = relationship("GrantApplication", back_populates="grant", cascade="all, delete-orphan")
@@ -84,6 +100,7 @@ class GrantMilestone(Base):
     completion_date = Column(DateTime(timezone=True), nullable=True)
     payment_transaction_hash = Column(String, nullable=True, index=True)
     order = Column(Integer, nullable=False, default=0)
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
     grant = relationship("Grant", back_populates="milestones")
 
 class GrantApplication(Base):
@@ -91,11 +108,12 @@ class GrantApplication(Base):
     id = Column(Integer, primary_key=True, index=True)
     grant_id = Column(Integer, ForeignKey("grants.id", ondelete="CASCADE"), nullable=False, index=True)
     applicant_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True)
-    cover_letter = Column(Text, nullable=True) # Changed from proposal
+    cover_letter = deferred(Column(Text, nullable=True), group=DETAIL_TEXT) # Changed from proposal
     status = Column(DBEnum(GrantApplicationStatus), default=GrantApplicationStatus.SUBMITTED, nullable=False, index=True) # Updated
     submitted_at = Column(DateTime(timezone=True), server_default=func.now())
     reviewed_at = Column(DateTime(timezone=True), nullable=True)
     reviewer_notes = Column(Text, nullable=True)
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), index=True)
     grant = relationship("Grant", back_populates="applications")
     applicant = relationship("User", back_populates="grant_applications")
 
@@ -1,12 +1,25 @@
-from sqlalchemy import Column, Integer, String, Boolean, Text, ForeignKey, JSON, Date
-from sqlalchemy.orm import relationship
-from sqlalchemy.dialects.postgresql import ARRAY
+from sqlalchemy import Column, Computed, Index, Integer, String, Boolean, Text, ForeignKey, JSON, Date, DateTime
+from sqlalchemy.orm import deferred, relationship
+from sqlalchemy.dialects.postgresql import ARRAY, TSVECTOR
+from sqlalchemy.sql import func
 
-from app.db.base_class import Base
+from app.db.base_class import Base, DETAIL_TEXT
 from .user import User # For the relationship
 
+# Weighted full-text document for /search; kept by Postgres as a STORED generated column.
+# array_to_string() is only STABLE, so the immutable wrapper from the search migration is used.
+PROFILE_SEARCH_VECTOR_SQL = (
+    "setweight(to_tsvector('english', coalesce(headline, '')), 'A') || "
+    "setweight(to_tsvector('english', coalesce(immutable_array_to_string(skills::text[], ' '), '')), 'B') || "
+    "setweight(to_tsvector('english', coalesce(immutable_array_to_string(research_interests::text[], ' '), '')), 'B') || "
+    "setweight(to_tsvector('english', coalesce(about, '')), 'C')"
+)
+
 class Profile(Base):
     __tablename__ = "profiles"
+    __table_args__ = (
+        Index("ix_profiles_search_vector", "search_vector", postgresql_using="gin"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), unique=True, nullable=False, index=True)
@@ -20,12 +33,17 @@ class Profile(Base):
     website_url = Column(String, nullable=True)
     orcid_id = Column(String, nullable=True, index=True)
 
-    about = Column(Text, nullable=True)
+    about = deferred(Column(Text, nullable=True), group=DETAIL_TEXT)
 
     skills = Column(ARRAY(String), nullable=True) # Stored as a list of strings
     research_interests = Column(ARRAY(String), nullable=True)
 
     is_visible_in_talent_pool = Column(Boolean, default=False, nullable=False)
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), index=True)
+
+    # Deferred: only the search queries read it, never the ORM.
+    search_vector = deferred(Column(TSVECTOR, Computed(PROFILE_SEARCH_VECTOR_SQL, persisted=True)))
     
     user = relationship("User", back_populates="profile")
 
@@ -38,6 +56,10 @@ class Profile(Base):
 
 class Experience(Base):
     __tablename__ = "experiences"
+    __table_args__ = (
+        # Trigram index for fuzzy institution autocomplete
+        Index("ix_experiences_institution_trgm", "institution", postgresql_using="gin", postgresql_ops={"institution": "gin_trgm_ops"}),
+    )
     id = Column(Integer, primary_key=True, index=True)
     profile_id = Column(Integer, ForeignKey("profiles.id", ondelete="CASCADE"), nullable=False, index=True)
     title = Column(String, nullable=False)
@@ -46,11 +68,16 @@ class Experience(Base):
     start_date = Column(Date, nullable=True)
     end_date = Column(Date, nullable=True)
     description = Column(Text, nullable=True)
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
 
     profile = relationship("Profile", back_populates="experiences")
 
 class Education(Base):
     __tablename__ = "educations"
+    __table_args__ = (
+        # Trigram index for fuzzy institution autocomplete
+        Index("ix_educations_institution_trgm", "institution", postgresql_using="gin", postgresql_ops={"institution": "gin_trgm_ops"}),
+    )
     id = Column(Integer, primary_key=True, index=True)
     profile_id = Column(Integer, ForeignKey("profiles.id", ondelete="CASCADE"), nullable=False, index=True)
     degree = Column(String, nullable=False)
@@ -58,6 +85,7 @@ class Education(Base):
     major = Column(String, nullable=True) # Changed from field_of_study
     graduation_date = Column(Date, nullable=True)
     description = Column(Text, nullable=True)
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
 
     profile = relationship("Profile", back_populates="educations")
 
@@ -70,7 +98,8 @@ class Publication(Base):
     venue = Column(String, nullable=True)
     year = Column(Integer, nullable=True)
     link = Column(String, nullable=True)
-    abstract = Column(Text, nullable=True)
+    abstract = deferred(Column(Text, nullable=True), group=DETAIL_TEXT)
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
 
     profile = relationship("Profile", back_populates="publications")
 
@@ -1,10 +1,11 @@
 import datetime
 import enum
-from sqlalchemy import ARRAY, Column, Integer, String, Text, Boolean, DateTime, Enum as DBEnum, ForeignKey, JSON, Date, Numeric
-from sqlalchemy.orm import relationship
+from sqlalchemy import ARRAY, Column, Computed, Index, Integer, String, Text, Boolean, DateTime, Enum as DBEnum, ForeignKey, JSON, Date, Numeric
+from sqlalchemy.dialects.postgresql import TSVECTOR
+from sqlalchemy.orm import deferred, relationship
 from sqlalchemy.sql import func
 
-from app.db.base_class import Base
+from app.db.base_class import Base, DETAIL_TEXT
 # from .user import User # Import later
 # from .grant import Grant # Import later
 
@@ -34,12 +35,23 @@ class ProjectCategory(str, enum.Enum): # Added
     ENVIRONMENT = "environment"
     OTHER = "other"
 
+# Weighted full-text document for /search; kept by Postgres as a STORED generated column.
+# array_to_string() is only STABLE, so the immutable wrapper from the search migration is used.
+PROJECT_SEARCH_VECTOR_SQL = (
+    "setweight(to_tsvector('english', coalesce(title, '')), 'A') || "
+    "setweight(to_tsvector('english', coalesce(immutable_array_to_string(required_skills::text[], ' '), '')), 'B') || "
+    "setweight(to_tsvector('english', coalesce(description, '')), 'C')"
+)
+
 class Project(Base):
     __tablename__ = "projects"
+    __table_args__ = (
+        Index("ix_projects_search_vector", "search_vector", postgresql_using="gin"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     title = Column(String, index=True, nullable=False)
-    description = Column(Text, nullable=False)
+    description = deferred(Column(Text, nullable=False), group=DETAIL_TEXT)
     creator_id = Column(Integer, ForeignKey("users.id"), nullable=False, index=True)
     status = Column(DBEnum(ProjectStatus), default=ProjectStatus.OPEN, nullable=False, index=True)
     category = Column(DBEnum(ProjectCategory), default=ProjectCategory.OTHER, nullable=True) # Added
@@ -49,7 +61,10 @@ class Project(Base):
     budget = Column(Numeric(18,2), nullable=True) # Added
     grant_id = Column(Integer, ForeignKey("grants.id"), nullable=True, index=True)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
-    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), index=True)
+
+    # Deferred: only the search queries read it, never the ORM.
+    search_vector = deferred(Column(TSVECTOR, Computed(PROJECT_SEARCH_VECTOR_SQL, persisted=True)))
 
     creator = relationship("User", back_populates="projects_created")
     grant = relationship("Grant", back_populates="projects")
@@ -66,6 +81,7 @@ class ProjectTeamMember(Base):
     project_id = Column(Integer, ForeignKey("projects.id", ondelete="CASCADE"), nullable=False, index=True)
     user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True)
     role_in_project = Column(String, nullable=False, default="Member") # e.g., "Lead", "Developer", "Researcher"
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
 
     project = relationship("Project", back_populates="team_members")
     user = relationship("User", back_populates="member_of_projects") # In User model add: member_of_projects = relationship("ProjectTeamMember", back_populates="user")
@@ -75,9 +91,11 @@ class ProjectApplication(Base):
     id = Column(Integer, primary_key=True, index=True)
     project_id = Column(Integer, ForeignKey("projects.id", ondelete="CASCADE"), nullable=False, index=True)
     user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True)
-    cover_letter = Column(Text, nullable=True)
+    cover_letter = deferred(Column(Text, nullable=True), group=DETAIL_TEXT)
     status = Column(DBEnum(ProjectApplicationStatus), default=ProjectApplicationStatus.SUBMITTED, nullable=False) 
     application_date = Column(Date, default=datetime.date.today, nullable=False)
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), index=True)
     project = relationship("Project", back_populates="project_applications_received") # Renamed back_populates for clarity
     applicant = relationship("User", back_populates="project_applications") # Renamed back_populates for clarity
 
@@ -0,0 +1,44 @@
+from sqlalchemy import Column, Integer, String, Boolean, DateTime, Enum as DBEnum, ForeignKey
+from sqlalchemy.dialects.postgresql import ARRAY
+from sqlalchemy.sql import func
+
+from app.db.base_class import Base
+from .user import UserRole
+
+class TalentPoolEntry(Base):
+    """
+    Denormalized read model for the public talent pool.
+
+    One row per profile with `is_visible_in_talent_pool = True`, holding the user
+    fields, skills, research interests and child-collection counts the talent-pool
+    page renders. Rows are maintained by `crud.talent_pool` whenever `crud.profile`
+    or `crud.user` writes, so the page is served by a single scan of this table.
+    """
+    __tablename__ = "talent_pool_entries"
+
+    profile_id = Column(Integer, ForeignKey("profiles.id", ondelete="CASCADE"), primary_key=True)
+    user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), unique=True, nullable=False, index=True)
+
+    # Copied from users
+    wallet_address = Column(String(42), nullable=False)
+    full_name = Column(String, nullable=True)
+    role = Column(DBEnum(UserRole), nullable=False)
+    is_active = Column(Boolean(), nullable=False, default=True)
+    user_created_at = Column(DateTime(timezone=True), nullable=True)
+
+    # Copied from profiles
+    avatar_url = Column(String, nullable=True)
+    current_role = Column(String, nullable=True)
+    headline = Column(String, nullable=True)
+    skills = Column(ARRAY(String), nullable=True)
+    research_interests = Column(ARRAY(String), nullable=True)
+
+    # Precomputed summary counts
+    experience_count = Column(Integer, nullable=False, default=0)
+    education_count = Column(Integer, nullable=False, default=0)
+    publication_count = Column(Integer, nullable=False, default=0)
+
+    refreshed_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False, index=True)
+
+    def __repr__(self):
+        return f"<TalentPoolEntry(profile_id={self.profile_id}, user_id={self.user_id})>"
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Boolean, DateTime, Enum as DBEnum
+from sqlalchemy import Column, Index, Integer, String, Boolean, DateTime, Enum as DBEnum
 from sqlalchemy.sql import func # For default timestamps
 from sqlalchemy.orm import relationship
 
@@ -13,6 +13,12 @@ class UserRole(str, enum.Enum):
 
 class User(Base):
     __tablename__ = "users"
+    __table_args__ = (
+        # Trigram indexes for fuzzy user search (similarity and ILIKE)
+        Index("ix_users_full_name_trgm", "full_name", postgresql_using="gin", postgresql_ops={"full_name": "gin_trgm_ops"}),
+        Index("ix_users_email_trgm", "email", postgresql_using="gin", postgresql_ops={"email": "gin_trgm_ops"}),
+        Index("ix_users_wallet_address_trgm", "wallet_address", postgresql_using="gin", postgresql_ops={"wallet_address": "gin_trgm_ops"}),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     wallet_address = Column(String(42), unique=True, index=True, nullable=False) # Wallet address is required
@@ -27,7 +33,7 @@ class User(Base):
     is_superuser = Column(Boolean(), default=False)
 
     created_at = Column(DateTime(timezone=True), server_default=func.now())
-    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), index=True)
 
     profile = relationship("Profile", uselist=False, back_populates="user", cascade="all, delete-orphan")
 
@@ -6,6 +6,7 @@ from .user import ( # Adjust based on the final names in your user.py
     UserCreateWallet, # if you added this
     UserRole,
     UserList,
+    UserSearchResult,
     UserInDB # if you need to export the DB representation schema
 )
 from .token import Token, TokenPayload, NonceResponse, SIWELoginData # Keep existing
@@ -21,6 +22,7 @@ from .grant import (
     Grant, GrantCreate, GrantUpdate,
     GrantApplication, GrantApplicationCreate, GrantApplicationUpdate,
     GrantMilestoneSchema, GrantMilestoneCreate, GrantMilestoneUpdate,
+    GrantRecommendation,
 )
 # Add Project schemas
 from .project import (
@@ -28,10 +30,27 @@ from .project import (
     ProjectTeamMember, ProjectTeamMemberCreate, ProjectTeamMemberUpdate,
     ProjectApplication, ProjectApplicationCreate, ProjectApplicationUpdate
 )
+# Talent pool read model
+from .talent_pool import TalentPoolUser, TalentPoolProfile, TalentPoolSearchResult, ProjectCandidate
+
+# Search
+from .search import SearchEntityType, SearchHit, SearchResults
+
+# Autocomplete
+from .autocomplete import AutocompleteField, AutocompleteSuggestion
+
+# Change feed
+from .changes import ChangeEntityType, Change, ChangeFeed
+
+# Background admin jobs
+from .admin_job import AdminJob, AdminJobAccepted
+
+# Audit log of admin and CRUD writes
+from .audit_log import AuditLogEntry
 
 
 __all__ = [
-    "User", "UserCreate", "UserUpdate", "UserPasswordUpdate", "UserCreateWallet", "UserRole", "UserList", "UserInDB",
+    "User", "UserCreate", "UserUpdate", "UserPasswordUpdate", "UserCreateWallet", "UserRole", "UserList", "UserSearchResult", "UserInDB",
     "Token", "TokenPayload",
 
     "ProfileSchema", "ProfileCreate", "ProfileUpdate",
@@ -42,10 +61,19 @@ __all__ = [
     "Grant", "GrantCreate", "GrantUpdate",
     "GrantApplication", "GrantApplicationCreate", "GrantApplicationUpdate",
     "GrantMilestoneSchema", "GrantMilestoneCreate", "GrantMilestoneUpdate",
+    "GrantRecommendation",
     
     "Project", "ProjectCreate", "ProjectUpdate",
     "ProjectTeamMember", "ProjectTeamMemberCreate", "ProjectTeamMemberUpdate",
     "ProjectApplication", "ProjectApplicationCreate", "ProjectApplicationUpdate",
 
+    "TalentPoolUser", "TalentPoolProfile", "TalentPoolSearchResult", "ProjectCandidate",
+
+    "SearchEntityType", "SearchHit", "SearchResults",
+    "AutocompleteField", "AutocompleteSuggestion",
+    "ChangeEntityType", "Change", "ChangeFeed",
+    "AdminJob", "AdminJobAccepted",
+    "AuditLogEntry",
+
     "Token", "TokenPayload", "NonceResponse", "SIWELoginData"
 ]
\ No newline at end of file
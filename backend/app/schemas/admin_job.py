@@ -0,0 +1,30 @@
+# backend/app/schemas/admin_job.py
+import datetime
+from typing import Any, Dict, Optional
+from pydantic import BaseModel, ConfigDict
+
+from app.models.admin_job import AdminJobStatus
+
+class AdminJob(BaseModel):
+    id: int
+    kind: str
+    status: AdminJobStatus
+    params: Optional[Dict[str, Any]] = None
+    progress_current: int
+    progress_total: Optional[int] = None # None while unknown
+    message: Optional[str] = None
+    result: Optional[Any] = None
+    error: Optional[str] = None
+    cancel_requested: bool
+    created_by_id: Optional[int] = None
+    created_at: Optional[datetime.datetime] = None
+    started_at: Optional[datetime.datetime] = None
+    finished_at: Optional[datetime.datetime] = None
+
+    model_config = ConfigDict(from_attributes=True)
+
+class AdminJobAccepted(BaseModel):
+    """202 body of an endpoint that queued a job; poll `status_url` (GET /jobs/{id})."""
+    job_id: int
+    status: AdminJobStatus
+    status_url: str
@@ -0,0 +1,18 @@
+# backend/app/schemas/audit_log.py
+import datetime
+from typing import Any, Dict, Optional
+from pydantic import BaseModel, ConfigDict
+
+class AuditLogEntry(BaseModel):
+    id: int
+    occurred_at: datetime.datetime
+    actor_id: Optional[int] = None
+    source: str
+    action: str
+    table_name: str
+    row_id: Optional[str] = None
+    before: Optional[Dict[str, Any]] = None
+    after: Optional[Dict[str, Any]] = None
+    details: Optional[Any] = None
+
+    model_config = ConfigDict(from_attributes=True)
@@ -0,0 +1,12 @@
+# backend/app/schemas/autocomplete.py
+from typing import Literal
+from pydantic import BaseModel, ConfigDict
+
+AutocompleteField = Literal["skill", "institution", "grant_title"]
+
+class AutocompleteSuggestion(BaseModel):
+    value: str
+    count: int # How many records use this value
+    fuzzy: bool = False # True for trigram (typo-tolerant) matches rather than prefix matches
+
+    model_config = ConfigDict(from_attributes=True)
@@ -0,0 +1,17 @@
+# backend/app/schemas/changes.py
+import datetime
+from typing import List, Literal
+from pydantic import BaseModel
+
+ChangeEntityType = Literal["grant", "grant_application", "profile", "project", "project_application"]
+
+class Change(BaseModel):
+    entity: ChangeEntityType
+    id: int
+    op: Literal["created", "updated", "deleted"] # "created" if the row was created after the cursor
+    changed_at: datetime.datetime
+
+class ChangeFeed(BaseModel):
+    items: List[Change]
+    next_cursor: str # Pass back as ?since= for the next page, or to poll once caught up
+    has_more: bool
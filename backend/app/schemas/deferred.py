@@ -0,0 +1,45 @@
+# backend/app/schemas/deferred.py
+from typing import Any, FrozenSet
+
+from pydantic import BaseModel, ValidationInfo, model_validator
+from sqlalchemy import inspect as sa_inspect
+from sqlalchemy.orm import InstanceState
+
+# Validation context flag for list responses: {LIST_VIEW: True}
+LIST_VIEW = "list_view"
+
+class _UnloadedAsNone:
+    """Attribute view of an ORM instance in which the given attributes read as None."""
+
+    __slots__ = ("_obj", "_hidden")
+
+    def __init__(self, obj: Any, hidden: FrozenSet[str]):
+        self._obj = obj
+        self._hidden = hidden
+
+    def __getattr__(self, name: str) -> Any:
+        if name in self._hidden:
+            return None
+        return getattr(self._obj, name)
+
+
+class DeferredTextSchema(BaseModel):
+    """
+    Base for read schemas whose models have deferred text columns (`DETAIL_TEXT`).
+
+    Validated with the `LIST_VIEW` context, deferred columns the query didn't load are
+    serialized as null instead of being lazy-loaded one row at a time. Otherwise (detail
+    endpoints, write responses) they load as usual.
+    """
+
+    @model_validator(mode="before")
+    @classmethod
+    def _unloaded_deferred_as_none(cls, data: Any, info: ValidationInfo) -> Any:
+        if not (info.context and info.context.get(LIST_VIEW)):
+            return data
+        state = sa_inspect(data, raiseerr=False)
+        if not isinstance(state, InstanceState):
+            return data
+        column_attrs = state.mapper.column_attrs
+        hidden = frozenset(key for key in state.unloaded if key in column_attrs and column_attrs[key].deferred)
+        return _UnloadedAsNone(data, hidden) if hidden else data
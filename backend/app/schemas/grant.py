@@ -6,6 +6,7 @@ import datetime
 # Import the specific enums from your models.grant
 from app.models.grant import GrantType, GrantStatus, GrantApplicationStatus
 from .user import User # Assuming User is your client-safe user schema
+from .deferred import DeferredTextSchema
 
 # --- Grant Schemas ---
 class GrantBase(BaseModel):
@@ -42,7 +43,7 @@ class GrantUpdate(BaseModel): # More flexible update
     talent_requirements: Optional[dict] = None
     review_notes: Optional[str] = None
 
-class GrantInDBBase(GrantBase):
+class GrantInDBBase(GrantBase, DeferredTextSchema):
     id: int
     proposer_id: int # Matches model
     status: GrantStatus # Matches model
@@ -109,7 +110,7 @@ class GrantApplicationUpdate(BaseModel):
     reviewer_notes: Optional[str] = None
 
 
-class GrantApplicationInDBBase(GrantApplicationBase):
+class GrantApplicationInDBBase(GrantApplicationBase, DeferredTextSchema):
     id: int
     grant_id: int
     applicant_id: int # Matches your model
@@ -124,6 +125,11 @@ class GrantApplication(GrantApplicationInDBBase):
     applicant: Optional[User] = None
     grant: Optional[GrantInDBBase] = None # Simplified Grant to avoid deep recursion
 
+# --- Recommendations ---
+class GrantRecommendation(BaseModel):
+    score: float # Cosine similarity between the grant's and the researcher's TF-IDF vectors
+    grant: Grant
+
 # Update forward references if you have nested schemas referencing each other
 Grant.model_rebuild()
 # GrantApplication.model_rebuild() # If GrantApplication also had forward refs to Grant
\ No newline at end of file
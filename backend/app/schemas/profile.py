@@ -1,6 +1,8 @@
 # backend/app/schemas/profile.py
 from typing import Optional, List
 from pydantic import BaseModel, HttpUrl
+
+from .deferred import DeferredTextSchema
 import datetime
 
 # --- Experience Schemas ---
@@ -70,7 +72,7 @@ class PublicationUpdate(PublicationBase):
     title: Optional[str] = None # All fields optional
     # Make other fields optional
 
-class Publication(PublicationBase): # For reading from DB
+class Publication(PublicationBase, DeferredTextSchema): # For reading from DB
     id: int
     profile_id: int
 
@@ -101,7 +103,7 @@ class ProfileUpdate(ProfileBase):
 
 # Schema for reading a profile, including its nested items
 # This is the main schema that will be nested in UserSchema
-class ProfileSchema(ProfileBase):
+class ProfileSchema(ProfileBase, DeferredTextSchema):
     id: int
     user_id: int # To know which user this profile belongs to
     experiences: List[Experience] = []
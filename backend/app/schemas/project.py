@@ -3,6 +3,7 @@ from pydantic import BaseModel
 import datetime
 from app.models.project import ProjectCategory, ProjectStatus, ProjectApplicationStatus # Assuming enum is in models.project
 from .user import User # For creator and team members
+from .deferred import DeferredTextSchema
 
 # --- Project Team Member Schemas ---
 class ProjectTeamMemberBase(BaseModel):
@@ -55,7 +56,8 @@ class ProjectUpdate(ProjectBase):
     required_skills: Optional[List[str]] = None # CHANGED
 
 
-class ProjectInDBBase(ProjectBase):
+class ProjectInDBBase(ProjectBase, DeferredTextSchema):
+    description: Optional[str] = None # Deferred; null in list responses
     id: int
     creator_id: int
     created_at: datetime.datetime
@@ -81,7 +83,7 @@ class ProjectApplicationUpdate(BaseModel):
     cover_letter: Optional[str] = None
     status: Optional[ProjectApplicationStatus] = None
 
-class ProjectApplicationInDBBase(ProjectApplicationBase):
+class ProjectApplicationInDBBase(ProjectApplicationBase, DeferredTextSchema):
     id: int
     project_id: int
     user_id: int
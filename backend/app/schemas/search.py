@@ -0,0 +1,16 @@
+# backend/app/schemas/search.py
+from typing import List, Literal, Optional
+from pydantic import BaseModel
+
+SearchEntityType = Literal["grant", "project", "profile"]
+
+class SearchHit(BaseModel):
+    type: SearchEntityType
+    id: int # Grant/project id, or the profile's user id for profiles
+    title: Optional[str] = None
+    snippet: Optional[str] = None # Matching fragment with <mark>...</mark> around matched terms
+    rank: float
+
+class SearchResults(BaseModel):
+    items: List[SearchHit]
+    next_cursor: Optional[str] = None # Pass back as ?cursor= to fetch the next page
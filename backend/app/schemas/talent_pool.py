@@ -0,0 +1,69 @@
+# backend/app/schemas/talent_pool.py
+from typing import Any, Dict, List, Optional
+from pydantic import BaseModel, model_validator
+from datetime import datetime
+
+from app.models.user import UserRole
+
+# Response shape mirrors schemas.User -> profile for the fields the talent-pool page reads,
+# but is built from a single flat `talent_pool_entries` row instead of walking relationships.
+
+class TalentPoolProfile(BaseModel):
+    id: int
+    user_id: int
+    avatar_url: Optional[str] = None
+    current_role: Optional[str] = None
+    headline: Optional[str] = None
+    skills: Optional[List[str]] = None
+    research_interests: Optional[List[str]] = None
+    experience_count: int = 0
+    education_count: int = 0
+    publication_count: int = 0
+
+class TalentPoolUser(BaseModel):
+    id: int # User ID
+    wallet_address: Optional[str] = None
+    full_name: Optional[str] = None
+    role: UserRole
+    is_active: bool = True
+    created_at: Optional[datetime] = None
+    profile: TalentPoolProfile
+
+    @model_validator(mode="before")
+    @classmethod
+    def _from_entry(cls, data: Any) -> Any:
+        if isinstance(data, dict):
+            return data
+        # A models.TalentPoolEntry row: nest the profile columns under `profile`.
+        return {
+            "id": data.user_id,
+            "wallet_address": data.wallet_address,
+            "full_name": data.full_name,
+            "role": data.role,
+            "is_active": data.is_active,
+            "created_at": data.user_created_at,
+            "profile": {
+                "id": data.profile_id,
+                "user_id": data.user_id,
+                "avatar_url": data.avatar_url,
+                "current_role": data.current_role,
+                "headline": data.headline,
+                "skills": data.skills,
+                "research_interests": data.research_interests,
+                "experience_count": data.experience_count,
+                "education_count": data.education_count,
+                "publication_count": data.publication_count,
+            },
+        }
+
+class TalentPoolSearchResult(BaseModel):
+    total: int
+    items: List[TalentPoolUser]
+    facets: Dict[str, Dict[str, int]] # facet -> {value: matching profiles}
+
+class ProjectCandidate(BaseModel):
+    score: float
+    overlap: float # Share of the project's IDF-weighted skills the candidate covers
+    similarity: float # IDF-weighted cosine similarity of skill vectors
+    matched_skills: List[str]
+    candidate: TalentPoolUser
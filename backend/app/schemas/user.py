@@ -64,6 +64,15 @@ class UserInDB(UserBase):
     class Config:
         from_attributes = True
 
+# Lean search hit: no nested profile, so results need no extra loading
+class UserSearchResult(BaseModel):
+    id: int
+    wallet_address: str
+    full_name: Optional[str] = None
+    email: Optional[str] = None # Only filled in for admins
+    role: UserRole
+    score: float # Best trigram similarity across the searched columns (1.0 for a wallet prefix match)
+
 # For lists of users - ensure this uses the User schema that's safe for client output
 class UserList(BaseModel):
     users: List[User] # Use the client-safe User schema
@@ -0,0 +1,187 @@
+# backend/app/services/audit.py
+import logging
+import threading
+from collections import deque
+from datetime import datetime, timezone
+from typing import Any, Deque, Dict, Iterable, List, Mapping, Optional
+
+from fastapi.encoders import jsonable_encoder
+from sqlalchemy import Table, event, insert, inspect
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.db.database import SessionLocal
+from app.models.audit_log import AuditLogEntry
+
+logger = logging.getLogger(__name__)
+
+# Column values never copied into a row image.
+REDACTED_COLUMNS = frozenset({"hashed_password"})
+REDACTED = "[redacted]"
+
+def row_image(values: Mapping[str, Any], table: Table) -> Dict[str, Any]:
+    """JSON-ready copy of a row's column values; computed columns are left out."""
+    image = {}
+    for column in table.columns:
+        if column.computed is not None or column.name not in values:
+            continue
+        image[column.name] = REDACTED if column.name in REDACTED_COLUMNS else values[column.name]
+    return jsonable_encoder(image)
+
+
+def object_image(obj: Any) -> Dict[str, Any]:
+    """`row_image` of an ORM instance, from its loaded attributes only (never lazy-loads)."""
+    state = inspect(obj)
+    values = {
+        attr.columns[0].name: state.dict[attr.key]
+        for attr in state.mapper.column_attrs
+        if attr.key in state.dict
+    }
+    return row_image(values, state.mapper.local_table)
+
+
+class AuditLog:
+    """
+    Buffered writer for `audit_log`. `record()` only stages an entry on the session; the
+    after_commit hook below moves the session's entries to an in-memory queue (rolled-back
+    writes are never logged), and a daemon thread writes the queue every
+    AUDIT_LOG_FLUSH_INTERVAL_MS in multi-row INSERTs of up to AUDIT_LOG_BATCH_SIZE rows.
+    The write path never waits on the audit table.
+
+    The queue holds at most AUDIT_LOG_MAX_QUEUED entries; beyond that new entries are
+    dropped, and batches the database rejects are discarded. Both are counted in
+    `stats()`. Entries still queued when the process dies are lost.
+    """
+
+    def __init__(self, flush_interval_ms: int, batch_size: int, max_queued: int):
+        self.flush_interval = flush_interval_ms / 1000
+        self.batch_size = batch_size
+        self.max_queued = max_queued
+        self._queue: Deque[Dict[str, Any]] = deque()
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+        self._stop = threading.Event()
+        self.recorded = 0
+        self.written = 0
+        self.dropped = 0
+        self.failed = 0
+
+    # --- Recording ---
+
+    @staticmethod
+    def set_actor(db: Session, user_id: Optional[int]) -> None:
+        """Attribute the audited writes of `db` (one request's session) to `user_id`."""
+        db.info["audit_actor_id"] = user_id
+
+    def record(
+        self, db: Session, *, source: str, action: str, table_name: str, row_id: Any,
+        before: Optional[Dict[str, Any]] = None, after: Optional[Dict[str, Any]] = None,
+        details: Any = None, actor_id: Optional[int] = None,
+    ) -> None:
+        """Log a change to one row when `db`'s current transaction commits (dropped on rollback)."""
+        db.info.setdefault("audit_entries", []).append({
+            "occurred_at": datetime.now(timezone.utc),
+            "actor_id": actor_id if actor_id is not None else db.info.get("audit_actor_id"),
+            "source": source,
+            "action": action,
+            "table_name": table_name,
+            "row_id": None if row_id is None else str(row_id)[:64],
+            "before": before,
+            "after": after,
+            "details": jsonable_encoder(details) if details is not None else None,
+        })
+
+    def record_object(self, db: Session, action: str, obj: Any, *, before: Optional[Dict[str, Any]] = None) -> None:
+        """`record` a CRUD-layer write to an ORM instance, after it was flushed."""
+        state = inspect(obj)
+        self.record(
+            db, source="crud", action=action, table_name=state.mapper.local_table.name,
+            row_id=",".join(str(v) for v in state.identity) if state.identity else None,
+            before=before, after=None if action == "delete" else object_image(obj),
+        )
+
+    def enqueue(self, entries: Iterable[Dict[str, Any]]) -> None:
+        entries = list(entries)
+        with self._lock:
+            accepted = entries[:max(self.max_queued - len(self._queue), 0)]
+            self._queue.extend(accepted)
+            self.recorded += len(accepted)
+            self.dropped += len(entries) - len(accepted)
+        if len(accepted) < len(entries):
+            logger.warning("Audit log queue full; dropped %d entries", len(entries) - len(accepted))
+
+    # --- Writing ---
+
+    def _take_batch(self) -> List[Dict[str, Any]]:
+        with self._lock:
+            return [self._queue.popleft() for _ in range(min(self.batch_size, len(self._queue)))]
+
+    def flush(self) -> int:
+        """Write everything queued so far; returns the number of entries written."""
+        written = 0
+        with self._flush_lock:
+            while True:
+                batch = self._take_batch()
+                if not batch:
+                    return written
+                try:
+                    with SessionLocal() as db:
+                        # executemany: sent as multi-row INSERT ... VALUES pages
+                        db.execute(insert(AuditLogEntry.__table__), batch)
+                        db.commit()
+                except Exception:
+                    logger.exception("Audit log flush failed; discarded %d entries", len(batch))
+                    with self._lock:
+                        self.failed += len(batch)
+                    return written
+                written += len(batch)
+                with self._lock:
+                    self.written += len(batch)
+
+    def start(self) -> None:
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="audit-log-writer", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop the writer thread after a last flush of the queue."""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=10)
+            self._thread = None
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.flush_interval):
+            self.flush()
+        self.flush()
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                "queued": len(self._queue),
+                "recorded": self.recorded,
+                "written": self.written,
+                "dropped": self.dropped,
+                "failed": self.failed,
+            }
+
+
+audit_log = AuditLog(
+    flush_interval_ms=settings.AUDIT_LOG_FLUSH_INTERVAL_MS,
+    batch_size=settings.AUDIT_LOG_BATCH_SIZE,
+    max_queued=settings.AUDIT_LOG_MAX_QUEUED,
+)
+
+
+@event.listens_for(Session, "after_commit")
+def _enqueue_committed_entries(session: Session) -> None:
+    entries = session.info.pop("audit_entries", None)
+    if entries:
+        audit_log.enqueue(entries)
+
+@event.listens_for(Session, "after_rollback")
+def _drop_pending_entries(session: Session) -> None:
+    session.info.pop("audit_entries", None)
@@ -0,0 +1,213 @@
+# backend/app/services/autocomplete.py
+import heapq
+import logging
+import threading
+import time
+from bisect import bisect_left
+from collections import Counter, defaultdict
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple
+
+from sqlalchemy import func, select, union_all
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.db.database import SessionLocal
+from app.models.grant import Grant
+from app.models.profile import Education, Experience, Profile
+from app.models.project import Project
+
+logger = logging.getLogger(__name__)
+
+AUTOCOMPLETE_FIELDS = ("skill", "institution", "grant_title")
+# Fields with a pg_trgm GIN index behind them; only these support the fuzzy fallback.
+FUZZY_FIELDS = ("institution", "grant_title")
+FUZZY_MIN_QUERY_LENGTH = 3
+
+def normalize(value: str) -> str:
+    return " ".join(value.casefold().split())
+
+
+@dataclass
+class Suggestion:
+    value: str
+    count: int
+    fuzzy: bool = False
+
+
+class _FieldIndex:
+    """
+    Immutable prefix index over one field's distinct values.
+
+    `keys` is a sorted array of (normalized suffix starting at a word boundary, value id),
+    so "tok" finds "University of Tokyo" as well as "Tokyo Tech" with one bisect. Values
+    that differ only in case/spacing share one entry displayed with their most common spelling.
+    """
+
+    def __init__(self, raw_counts: Counter):
+        spellings: Dict[str, Counter] = defaultdict(Counter)
+        for value, count in raw_counts.items():
+            if value and value.strip():
+                spellings[normalize(value)][value.strip()] += count
+
+        self.values: List[str] = []
+        self.counts: List[int] = []
+        keys: List[Tuple[str, int]] = []
+        for key, variants in spellings.items():
+            value_id = len(self.values)
+            self.values.append(variants.most_common(1)[0][0])
+            self.counts.append(sum(variants.values()))
+            words = key.split(" ")
+            for i in range(len(words)):
+                keys.append((" ".join(words[i:]), value_id))
+        keys.sort()
+        self.keys = [k for k, _ in keys]
+        self.value_ids = [v for _, v in keys]
+
+    def lookup(self, prefix: str, limit: int) -> List[Suggestion]:
+        prefix = normalize(prefix)
+        if not prefix:
+            return []
+        start = bisect_left(self.keys, prefix)
+        end = bisect_left(self.keys, prefix + "\U0010ffff", lo=start)
+        matches = set(self.value_ids[start:end])
+        best = heapq.nsmallest(limit, matches, key=lambda v: (-self.counts[v], self.values[v]))
+        return [Suggestion(self.values[v], self.counts[v]) for v in best]
+
+
+class AutocompleteIndex:
+    """
+    In-memory typeahead over skills, institutions and grant titles, ranked by frequency.
+
+    Lookups only read an immutable snapshot (swapped atomically on rebuild), so they never
+    touch the database or take a lock. A daemon thread polls a cheap change signature every
+    `AUTOCOMPLETE_REFRESH_INTERVAL_SECONDS` and rebuilds the snapshot when it changes, or
+    unconditionally once it is older than `AUTOCOMPLETE_MAX_AGE_SECONDS`.
+    """
+
+    def __init__(self):
+        self._fields: Dict[str, _FieldIndex] = {}
+        self._signature: Optional[tuple] = None
+        self._built_at = 0.0
+        self._thread: Optional[threading.Thread] = None
+        self._stop = threading.Event()
+        self._build_lock = threading.Lock()
+
+    @property
+    def ready(self) -> bool:
+        return bool(self._fields)
+
+    # --- Queries ---
+
+    def suggest(self, field: str, prefix: str, *, limit: int = 10) -> List[Suggestion]:
+        index = self._fields.get(field)
+        return index.lookup(prefix, limit) if index is not None else []
+
+    def fuzzy(self, db: Session, field: str, text: str, *, limit: int = 10) -> List[Suggestion]:
+        """pg_trgm similarity search for near-misses the prefix index cannot find (typos)."""
+        if field == "institution":
+            # Filter each branch so both trigram indexes are used.
+            source = union_all(
+                select(Experience.institution.label("value")).where(Experience.institution.op("%")(text)),
+                select(Education.institution.label("value")).where(Education.institution.op("%")(text)),
+            ).subquery()
+            value = source.c.value
+            stmt = select(value, func.count()).group_by(value)
+        elif field == "grant_title":
+            value = Grant.title
+            stmt = select(value, func.count()).where(value.op("%")(text)).group_by(value)
+        else:
+            return []
+        stmt = stmt.order_by(func.similarity(value, text).desc(), func.count().desc()).limit(limit)
+        return [Suggestion(v, n, fuzzy=True) for v, n in db.execute(stmt)]
+
+    # --- Building ---
+
+    def _fetch_signature(self, db: Session) -> tuple:
+        return tuple(db.execute(select(
+            # Profile.updated_at also moves when a profile is hidden from the talent pool
+            select(func.max(Profile.updated_at)).scalar_subquery(),
+            select(func.count(Profile.id)).scalar_subquery(),
+            select(func.max(Project.updated_at)).scalar_subquery(),
+            select(func.count(Project.id)).scalar_subquery(),
+            select(func.max(Grant.updated_at)).scalar_subquery(),
+            select(func.count(Grant.id)).scalar_subquery(),
+            # updated_at catches edits to existing rows (e.g. a corrected institution), count deletes
+            select(func.max(Experience.updated_at)).scalar_subquery(),
+            select(func.count(Experience.id)).scalar_subquery(),
+            select(func.max(Education.updated_at)).scalar_subquery(),
+            select(func.count(Education.id)).scalar_subquery(),
+        )).one())
+
+    @staticmethod
+    def _value_counts(db: Session, *sources) -> Counter:
+        """Usage counts of the values selected by each single-column `sources` select."""
+        counts: Counter = Counter()
+        for stmt in sources:
+            source = stmt.subquery()
+            value = source.c[0]
+            for v, n in db.execute(select(value, func.count()).group_by(value)):
+                if v is not None:
+                    counts[v] += n
+        return counts
+
+    def rebuild(self, db: Session) -> None:
+        with self._build_lock:
+            self._build(db)
+
+    def ensure_ready(self, db: Session) -> None:
+        """Build the index now unless it is built; concurrent callers wait for one build."""
+        if self.ready:
+            return
+        with self._build_lock:
+            if not self.ready: # Built by another caller while we waited for the lock
+                self._build(db)
+
+    def _build(self, db: Session) -> None:
+        signature = self._fetch_signature(db)
+        fields = {
+            "skill": _FieldIndex(self._value_counts(
+                db,
+                # Hidden profiles must not leak their skills through suggestions
+                select(func.unnest(Profile.skills)).where(Profile.is_visible_in_talent_pool.is_(True)),
+                select(func.unnest(Project.required_skills)),
+            )),
+            "institution": _FieldIndex(self._value_counts(
+                db, select(Experience.institution), select(Education.institution),
+            )),
+            "grant_title": _FieldIndex(self._value_counts(db, select(Grant.title))),
+        }
+        self._fields = fields # Atomic swap; readers see the old or the new snapshot
+        self._signature = signature
+        self._built_at = time.monotonic()
+
+    def refresh_if_changed(self, db: Session) -> bool:
+        stale = time.monotonic() - self._built_at > settings.AUTOCOMPLETE_MAX_AGE_SECONDS
+        if self.ready and not stale and self._fetch_signature(db) == self._signature:
+            return False
+        self.rebuild(db)
+        return True
+
+    # --- Background refresh ---
+
+    def start(self) -> None:
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="autocomplete-refresh", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            try:
+                with SessionLocal() as db:
+                    self.refresh_if_changed(db)
+            except Exception:
+                logger.exception("Autocomplete index refresh failed")
+            self._stop.wait(settings.AUTOCOMPLETE_REFRESH_INTERVAL_SECONDS)
+
+
+autocomplete_index = AutocompleteIndex()
@@ -0,0 +1,64 @@
+# backend/app/services/export.py
+import csv
+import datetime
+import decimal
+import enum
+import io
+import json
+from typing import Any, Iterator, Literal
+
+import orjson
+from sqlalchemy import Select
+
+from app.core.config import settings
+from app.db.database import SessionLocal
+
+ExportFormat = Literal["ndjson", "csv"]
+
+MEDIA_TYPES = {"ndjson": "application/x-ndjson", "csv": "text/csv; charset=utf-8"}
+
+def _json_default(value: Any) -> Any:
+    if isinstance(value, decimal.Decimal):
+        return str(value) # Keep the exact amount
+    raise TypeError(f"Cannot export {type(value).__name__}")
+
+def _csv_value(value: Any) -> Any:
+    if value is None:
+        return ""
+    if isinstance(value, enum.Enum):
+        return value.value
+    if isinstance(value, (datetime.date, datetime.datetime)):
+        return value.isoformat()
+    if isinstance(value, (list, dict)):
+        return json.dumps(value, default=str)
+    return value
+
+
+def iter_export(stmt: Select, fmt: ExportFormat) -> Iterator[bytes]:
+    """
+    Stream the rows of a Core SELECT as NDJSON lines or CSV (with a header row).
+
+    Runs in its own session: the request's session is closed before a streamed body is
+    sent. Rows are fetched through a server-side cursor `EXPORT_BATCH_SIZE` at a time and
+    one encoded chunk is yielded per batch, so memory stays flat and the first bytes go
+    out as soon as the first batch arrives.
+    """
+    with SessionLocal() as db:
+        result = db.execute(stmt.execution_options(yield_per=settings.EXPORT_BATCH_SIZE))
+        columns = [str(key) for key in result.keys()] # orjson wants plain str keys
+        if fmt == "csv":
+            buffer = io.StringIO()
+            writer = csv.writer(buffer)
+            writer.writerow(columns)
+            for batch in result.partitions():
+                writer.writerows([_csv_value(v) for v in row] for row in batch)
+                yield buffer.getvalue().encode()
+                buffer.seek(0)
+                buffer.truncate()
+            if buffer.tell(): # Header of an empty export
+                yield buffer.getvalue().encode()
+        else:
+            for batch in result.partitions():
+                yield b"".join(
+                    orjson.dumps(dict(zip(columns, row)), default=_json_default) + b"\n" for row in batch
+                )
@@ -0,0 +1,172 @@
+# backend/app/services/grant_recommender.py
+from collections import Counter
+from datetime import datetime, timezone
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+from scipy import sparse
+from sqlalchemy.orm import Session
+
+from app import crud
+from app.core.config import settings
+from app.models.grant import GrantStatus
+from app.models.profile import Profile
+from app.utils.text import tokenize
+from .incremental_index import IncrementalIndex
+
+# Field weights: a term in the title says more about a grant than one in the fine print.
+GRANT_FIELD_WEIGHTS = {"title": 3.0, "description": 1.0, "eligibility_criteria": 0.5}
+PROFILE_FIELD_WEIGHTS = {"research_interests": 3.0, "skills": 1.0, "publication_title": 2.0, "publication_abstract": 1.0}
+
+def _weighted_terms(fields: Iterable[Tuple[Optional[str], float]]) -> Counter:
+    counts: Counter = Counter()
+    for text, weight in fields:
+        for token in tokenize(text):
+            counts[token] += weight
+    return counts
+
+def profile_terms(profile: Profile) -> Counter:
+    """Weighted term counts describing a researcher: interests, skills and publications."""
+    fields: List[Tuple[Optional[str], float]] = []
+    for interest in profile.research_interests or []:
+        fields.append((interest, PROFILE_FIELD_WEIGHTS["research_interests"]))
+    for skill in profile.skills or []:
+        fields.append((skill, PROFILE_FIELD_WEIGHTS["skills"]))
+    for publication in profile.publications or []:
+        fields.append((publication.title, PROFILE_FIELD_WEIGHTS["publication_title"]))
+        fields.append((publication.abstract, PROFILE_FIELD_WEIGHTS["publication_abstract"]))
+    return _weighted_terms(fields)
+
+
+class GrantRecommender(IncrementalIndex):
+    """
+    TF-IDF index over grant text (title, description, eligibility criteria).
+
+    Each grant's weighted term counts are kept per row; grant creates/updates (tracked
+    through `grants.updated_at`) only replace that grant's counts. The L2-normalised
+    TF-IDF matrix is rebuilt lazily from memory on the next query, and scoring a
+    profile is a single sparse matrix-vector product over all grants.
+    """
+
+    def __init__(self, sync_interval: Optional[float] = None):
+        super().__init__(
+            settings.GRANT_INDEX_SYNC_INTERVAL_SECONDS if sync_interval is None else sync_interval
+        )
+        self._reset()
+
+    # --- IncrementalIndex interface ---
+
+    def _fetch_state(self, db: Session):
+        return crud.grant.get_sync_state(db)
+
+    def _fetch_since(self, db: Session, since):
+        return crud.grant.get_text_rows_since(db, since=since)
+
+    def _reset(self) -> None:
+        self._vocab: Dict[str, int] = {}
+        self._row_by_grant: Dict[int, int] = {}
+        self._grant_ids: List[int] = []
+        self._row_terms: List[np.ndarray] = []
+        self._row_counts: List[np.ndarray] = []
+        self._is_active: List[bool] = []
+        self._deadlines: List[float] = []
+        self._dirty = True
+
+    def __len__(self) -> int:
+        return len(self._row_by_grant)
+
+    def _upsert(self, rows) -> None:
+        for grant_id, title, description, eligibility, status, deadline in rows:
+            counts = _weighted_terms([
+                (title, GRANT_FIELD_WEIGHTS["title"]),
+                (description, GRANT_FIELD_WEIGHTS["description"]),
+                (eligibility, GRANT_FIELD_WEIGHTS["eligibility_criteria"]),
+            ])
+            term_ids = np.fromiter((self._term_id(t) for t in counts), dtype=np.int32, count=len(counts))
+            term_counts = np.fromiter(counts.values(), dtype=np.float32, count=len(counts))
+            is_active = status == GrantStatus.ACTIVE
+            deadline_ts = deadline.timestamp() if deadline is not None else np.inf
+
+            index = self._row_by_grant.get(grant_id)
+            if index is None:
+                self._row_by_grant[grant_id] = len(self._grant_ids)
+                self._grant_ids.append(grant_id)
+                self._row_terms.append(term_ids)
+                self._row_counts.append(term_counts)
+                self._is_active.append(is_active)
+                self._deadlines.append(deadline_ts)
+            else:
+                self._row_terms[index] = term_ids
+                self._row_counts[index] = term_counts
+                self._is_active[index] = is_active
+                self._deadlines[index] = deadline_ts
+        self._dirty = True
+
+    def _term_id(self, term: str) -> int:
+        term_id = self._vocab.get(term)
+        if term_id is None:
+            term_id = self._vocab[term] = len(self._vocab)
+        return term_id
+
+    # --- Matrix ---
+
+    def _build_matrix(self) -> None:
+        n_rows, n_terms = len(self._grant_ids), len(self._vocab)
+        lengths = np.fromiter((len(t) for t in self._row_terms), dtype=np.int64, count=n_rows)
+        indptr = np.zeros(n_rows + 1, dtype=np.int64)
+        np.cumsum(lengths, out=indptr[1:])
+        indices = np.concatenate(self._row_terms) if n_rows else np.zeros(0, dtype=np.int32)
+        counts = np.concatenate(self._row_counts) if n_rows else np.zeros(0, dtype=np.float32)
+
+        doc_freq = np.bincount(indices, minlength=n_terms).astype(np.float32)
+        self._idf = (np.log((1.0 + n_rows) / (1.0 + doc_freq)) + 1.0).astype(np.float32)
+        data = (1.0 + np.log(counts, where=counts > 0, out=np.zeros_like(counts))) * self._idf[indices] # Sublinear TF
+        matrix = sparse.csr_matrix((data, indices, indptr), shape=(n_rows, n_terms))
+        norms = np.sqrt(np.asarray(matrix.multiply(matrix).sum(axis=1)).ravel())
+        norms[norms == 0] = 1.0
+        self._matrix = sparse.diags(1.0 / norms).dot(matrix).tocsr()
+
+        self._grant_id_array = np.asarray(self._grant_ids, dtype=np.int64)
+        self._active_array = np.asarray(self._is_active, dtype=bool)
+        self._deadline_array = np.asarray(self._deadlines, dtype=np.float64)
+        self._dirty = False
+
+    def _query_vector(self, terms: Counter) -> Optional[np.ndarray]:
+        vector = np.zeros(len(self._vocab), dtype=np.float32)
+        for term, count in terms.items():
+            term_id = self._vocab.get(term)
+            if term_id is not None and count > 0:
+                vector[term_id] = (1.0 + np.log(count)) * self._idf[term_id]
+        norm = float(np.linalg.norm(vector))
+        return vector / norm if norm > 0 else None
+
+    # --- Queries ---
+
+    def recommend(self, terms: Counter, *, limit: int = 10, open_only: bool = True) -> List[Tuple[int, float]]:
+        """
+        Return `[(grant_id, cosine score), ...]` for the best-matching grants, best first.
+        With `open_only`, only ACTIVE grants whose deadline has not passed are considered.
+        Call `sync()` first.
+        """
+        with self._lock:
+            if self._dirty:
+                self._build_matrix()
+            if self._matrix.shape[0] == 0:
+                return []
+            query = self._query_vector(terms)
+            if query is None:
+                return []
+
+            scores = self._matrix @ query
+            eligible = scores > 0
+            if open_only:
+                now = datetime.now(timezone.utc).timestamp()
+                eligible &= self._active_array & (self._deadline_array > now)
+            candidates = np.flatnonzero(eligible)
+            if candidates.size > limit:
+                candidates = candidates[np.argpartition(-scores[candidates], limit - 1)[:limit]]
+            candidates = candidates[np.argsort(-scores[candidates], kind="stable")]
+            return [(int(self._grant_id_array[i]), float(scores[i])) for i in candidates]
+
+
+grant_recommender = GrantRecommender()
@@ -0,0 +1,91 @@
+# backend/app/services/incremental_index.py
+import threading
+import time
+from abc import ABC, abstractmethod
+from datetime import datetime, timedelta
+from typing import Any, Iterable, List, Optional, Tuple
+
+from sqlalchemy.orm import Session
+
+class IncrementalIndex(ABC):
+    """
+    Base class for in-memory indexes kept in step with a table through a watermark.
+
+    `sync()` polls a cheap `(max(<timestamp>), count)` validator and pulls only the rows
+    stamped since the last sync, so writes are applied incrementally. Rows deleted from the
+    source are detected by the row count no longer matching, which triggers a full rebuild.
+    Every worker process keeps its own copy and converges through the same polling, so no
+    cross-process signalling is needed.
+
+    Subclasses implement `_fetch_state`, `_fetch_since`, `_reset`, `_upsert` and `__len__`;
+    the last three are always called with `self._lock` held.
+    """
+
+    # Rows written by transactions that committed late can carry a slightly older
+    # timestamp than our watermark; re-reading a short window makes those visible.
+    WATERMARK_OVERLAP = timedelta(seconds=5)
+
+    def __init__(self, sync_interval: float):
+        self._lock = threading.RLock()
+        self._watermark: Optional[datetime] = None
+        self._built = False
+        self._last_checked = 0.0
+        self._sync_interval = sync_interval
+
+    # --- Subclass interface ---
+
+    @abstractmethod
+    def _fetch_state(self, db: Session) -> Tuple[Optional[datetime], int]:
+        ...
+
+    @abstractmethod
+    def _fetch_since(self, db: Session, since: Optional[datetime]) -> List[Any]:
+        ...
+
+    @abstractmethod
+    def _reset(self) -> None:
+        ...
+
+    @abstractmethod
+    def _upsert(self, rows: Iterable[Any]) -> None:
+        ...
+
+    @abstractmethod
+    def __len__(self) -> int:
+        ...
+
+    # --- Synchronisation ---
+
+    def invalidate(self) -> None:
+        """Force the next `sync()` to check the database regardless of the poll interval."""
+        self._last_checked = 0.0
+
+    def sync(self, db: Session) -> None:
+        now = time.monotonic()
+        if self._built and now - self._last_checked < self._sync_interval:
+            return
+
+        with self._lock:
+            if self._built and now - self._last_checked < self._sync_interval:
+                return # Another thread synced while we waited for the lock
+
+            watermark, count = self._fetch_state(db)
+            if self._built and watermark == self._watermark and count == len(self):
+                self._last_checked = now
+                return
+
+            if not self._built or self._watermark is None:
+                self._rebuild(db)
+            else:
+                self._upsert(self._fetch_since(db, self._watermark - self.WATERMARK_OVERLAP))
+                if len(self) != count:
+                    # Deltas only carry inserts/updates; a size mismatch means rows were removed.
+                    self._rebuild(db)
+
+            self._watermark = watermark
+            self._built = True
+            self._last_checked = now
+
+    def _rebuild(self, db: Session) -> None:
+        self._reset()
+        self._upsert(self._fetch_since(db, None))
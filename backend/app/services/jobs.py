@@ -0,0 +1,189 @@
+# backend/app/services/jobs.py
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, Optional
+
+from sqlalchemy import update
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.db.database import SessionLocal
+from app.models.admin_job import AdminJob, AdminJobStatus
+
+logger = logging.getLogger(__name__)
+
+ACTIVE_STATUSES = (AdminJobStatus.QUEUED, AdminJobStatus.RUNNING)
+PROGRESS_WRITE_INTERVAL_SECONDS = 0.5
+
+class JobCancelled(Exception):
+    """Raised inside a job (by `JobContext.progress`) once cancellation was requested."""
+
+
+class JobQueueFull(Exception):
+    """Raised by `submit` when ADMIN_JOB_MAX_QUEUED jobs are already waiting or running."""
+
+
+def _now() -> datetime:
+    return datetime.now(timezone.utc)
+
+
+class JobContext:
+    """
+    What a job function gets: its own session `db` for the work (committed by the runner
+    when the function returns, rolled back if it raises) and `progress()` for reporting.
+    Status writes go through a separate short session, so they never commit the work.
+    """
+
+    def __init__(self, job_id: int, db: Session):
+        self.job_id = job_id
+        self.db = db
+        self._last_write = 0.0
+
+    def _update(self, **values: Any) -> Optional[bool]:
+        with SessionLocal() as status_db:
+            cancel_requested = status_db.execute(
+                update(AdminJob).where(AdminJob.id == self.job_id).values(**values).returning(AdminJob.cancel_requested)
+            ).scalar()
+            status_db.commit()
+        return cancel_requested
+
+    def progress(self, current: int, total: Optional[int] = None, message: Optional[str] = None) -> None:
+        """
+        Record progress and act on cancellation; call between units of work. Writes are
+        throttled to one per PROGRESS_WRITE_INTERVAL_SECONDS. Raises JobCancelled.
+        """
+        now = time.monotonic()
+        if now - self._last_write < PROGRESS_WRITE_INTERVAL_SECONDS and (total is None or current < total):
+            return
+        self._last_write = now
+        values: Dict[str, Any] = {"progress_current": current}
+        if total is not None:
+            values["progress_total"] = total
+        if message is not None:
+            values["message"] = message[:255]
+        if self._update(**values):
+            raise JobCancelled()
+
+
+class JobRunner:
+    """
+    Runs long admin operations off the request path on a bounded thread pool
+    (ADMIN_JOB_WORKERS threads, at most ADMIN_JOB_MAX_QUEUED jobs waiting or running).
+
+    Each job is an `admin_jobs` row: `submit` inserts it (queued) and returns at once, so
+    the endpoint answers 202 with the id; the worker moves it to running and then to
+    succeeded (with the function's result), failed (with the error) or cancelled. Jobs are
+    in-process: at startup, rows left queued/running by a previous process are failed.
+    """
+
+    def __init__(self, max_workers: int, max_queued: int):
+        self.max_workers = max_workers
+        self.max_queued = max_queued
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._lock = threading.Lock()
+        self._pending = 0
+
+    def start(self) -> None:
+        with SessionLocal() as db:
+            db.execute(
+                update(AdminJob)
+                .where(AdminJob.status.in_(ACTIVE_STATUSES))
+                .values(status=AdminJobStatus.FAILED, error="Interrupted by a server restart.", finished_at=_now())
+            )
+            db.commit()
+        self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="admin-job")
+
+    def stop(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+    def submit(
+        self, db: Session, kind: str, fn: Callable[[JobContext], Any], *, params: Optional[Dict[str, Any]] = None, created_by_id: Optional[int] = None
+    ) -> AdminJob:
+        """Queue `fn(ctx)` as a job and return its (committed) row. Raises JobQueueFull."""
+        with self._lock:
+            if self._pending >= self.max_queued:
+                raise JobQueueFull(f"{self._pending} admin jobs are already queued or running.")
+            self._pending += 1
+        try:
+            job = AdminJob(kind=kind, params=params, created_by_id=created_by_id)
+            db.add(job)
+            db.commit()
+            db.refresh(job)
+            if self._executor is None: # Not started (scripts, tests): run without the startup recovery
+                self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="admin-job")
+            self._executor.submit(self._run, job.id, fn)
+        except BaseException:
+            with self._lock:
+                self._pending -= 1
+            raise
+        return job
+
+    def cancel(self, db: Session, job: AdminJob) -> AdminJob:
+        """
+        Request cancellation. A queued job is cancelled at once; a running one at its next
+        progress(). Both writes are conditional on the current status, so a worker starting
+        or finishing the job concurrently is never overridden.
+        """
+        cancelled = db.execute(
+            update(AdminJob)
+            .where(AdminJob.id == job.id, AdminJob.status == AdminJobStatus.QUEUED)
+            .values(status=AdminJobStatus.CANCELLED, cancel_requested=True, finished_at=_now())
+        ).rowcount
+        if not cancelled:
+            # _run only starts a job that has no cancel request, so a job that just left
+            # QUEUED either sees this flag at its next progress() or has already finished.
+            db.execute(
+                update(AdminJob)
+                .where(AdminJob.id == job.id, AdminJob.status == AdminJobStatus.RUNNING)
+                .values(cancel_requested=True)
+            )
+        db.commit()
+        db.refresh(job)
+        return job
+
+    def _finish(self, job_id: int, status: AdminJobStatus, **values: Any) -> None:
+        with SessionLocal() as status_db:
+            status_db.execute(
+                update(AdminJob).where(AdminJob.id == job_id).values(status=status, finished_at=_now(), **values)
+            )
+            status_db.commit()
+
+    def _run(self, job_id: int, fn: Callable[[JobContext], Any]) -> None:
+        try:
+            with SessionLocal() as status_db:
+                started = status_db.execute(
+                    update(AdminJob)
+                    .where(AdminJob.id == job_id, AdminJob.status == AdminJobStatus.QUEUED, AdminJob.cancel_requested.is_(False))
+                    .values(status=AdminJobStatus.RUNNING, started_at=_now())
+                ).rowcount
+                status_db.commit()
+            if not started: # Cancelled while queued
+                return
+            with SessionLocal() as db:
+                ctx = JobContext(job_id, db)
+                try:
+                    result = fn(ctx)
+                    db.commit()
+                except JobCancelled:
+                    db.rollback()
+                    self._finish(job_id, AdminJobStatus.CANCELLED)
+                    return
+                except Exception as e:
+                    db.rollback()
+                    logger.exception("Admin job %s failed", job_id)
+                    self._finish(job_id, AdminJobStatus.FAILED, error=str(getattr(e, "orig", None) or e))
+                    return
+            self._finish(job_id, AdminJobStatus.SUCCEEDED, result=result)
+        except Exception:
+            logger.exception("Admin job %s: could not record its status", job_id)
+        finally:
+            with self._lock:
+                self._pending -= 1
+
+
+job_runner = JobRunner(max_workers=settings.ADMIN_JOB_WORKERS, max_queued=settings.ADMIN_JOB_MAX_QUEUED)
@@ -0,0 +1,203 @@
+# backend/app/services/response_cache.py
+import json
+import logging
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, Iterable, List, NamedTuple, Optional, Sequence, Tuple
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+
+try: # Optional shared backend
+    import redis
+except ImportError: # pragma: no cover - only needed for RESPONSE_CACHE_BACKEND=redis
+    redis = None
+
+logger = logging.getLogger(__name__)
+
+# Every entry carries this tag, so bumping it drops the whole cache (e.g. after seeding).
+ALL = "*"
+
+# Tags to bump for writes that bypass the CRUD layer (admin table editor).
+TABLE_TAGS: Dict[str, Tuple[str, ...]] = {
+    "grants": ("grants", "grant:*"),
+    "grant_milestones": ("grants", "grant:*"),
+    "grant_applications": ("grants", "grant:*"),
+    "projects": ("projects", "project:*"),
+    "project_team_members": ("projects", "project:*"),
+    "project_applications": ("projects", "project:*"),
+    "users": ("users", "talent_pool"),
+    "profiles": ("users", "talent_pool"),
+    "experiences": ("users", "talent_pool"),
+    "educations": ("users", "talent_pool"),
+    "publications": ("users", "talent_pool"),
+    "talent_pool_entries": ("talent_pool",),
+}
+
+class CachedResponse(NamedTuple):
+    body: bytes
+    headers: Dict[str, str]
+    versions: Tuple[int, ...] # Tag versions the body was computed under
+
+
+class MemoryBackend:
+    """In-process LRU with a TTL. Tag versions are per process; use Redis with several workers."""
+
+    def __init__(self, max_entries: int, ttl: float):
+        self._entries: "OrderedDict[str, Tuple[float, CachedResponse]]" = OrderedDict()
+        self._versions: Dict[str, int] = {}
+        self._lock = threading.Lock()
+        self._max_entries = max_entries
+        self._ttl = ttl
+
+    def get(self, key: str) -> Optional[CachedResponse]:
+        with self._lock:
+            item = self._entries.get(key)
+            if item is None:
+                return None
+            expires_at, entry = item
+            if expires_at < time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return entry
+
+    def set(self, key: str, entry: CachedResponse) -> None:
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self._ttl, entry)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+
+    def versions(self, tags: Sequence[str]) -> Tuple[int, ...]:
+        return tuple(self._versions.get(tag, 0) for tag in tags)
+
+    def bump(self, tags: Iterable[str]) -> None:
+        with self._lock:
+            for tag in tags:
+                self._versions[tag] = self._versions.get(tag, 0) + 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+class RedisBackend:
+    """Shared backend: entries are SETEX'd blobs, tag versions are INCR counters."""
+
+    def __init__(self, url: str, ttl: float, prefix: str = "respcache:"):
+        if redis is None:
+            raise RuntimeError("RESPONSE_CACHE_BACKEND=redis requires the 'redis' package.")
+        self._client = redis.Redis.from_url(url)
+        self._ttl = max(1, int(ttl))
+        self._prefix = prefix
+
+    def get(self, key: str) -> Optional[CachedResponse]:
+        raw = self._client.get(self._prefix + "entry:" + key)
+        if raw is None:
+            return None
+        meta, _, body = raw.partition(b"\n")
+        meta = json.loads(meta)
+        return CachedResponse(body, meta["h"], tuple(meta["v"]))
+
+    def set(self, key: str, entry: CachedResponse) -> None:
+        meta = json.dumps({"h": entry.headers, "v": list(entry.versions)}).encode()
+        self._client.setex(self._prefix + "entry:" + key, self._ttl, meta + b"\n" + entry.body)
+
+    def versions(self, tags: Sequence[str]) -> Tuple[int, ...]:
+        values = self._client.mget([self._prefix + "tag:" + tag for tag in tags])
+        return tuple(int(v) if v is not None else 0 for v in values)
+
+    def bump(self, tags: Iterable[str]) -> None:
+        pipe = self._client.pipeline(transaction=False)
+        for tag in tags:
+            pipe.incr(self._prefix + "tag:" + tag)
+        pipe.execute()
+
+    def clear(self) -> None:
+        self.bump([ALL])
+
+
+class ResponseCache:
+    """
+    Cache of serialized GET response bodies with tag-based invalidation.
+
+    Each entry is stored with the versions of its tags as read *before* the response was
+    computed; a lookup is a hit only while all of those versions are unchanged. Writes bump
+    their tags once the transaction commits, so a response computed concurrently with a
+    write is never served after it. Backend failures degrade to cache misses.
+    """
+
+    def __init__(self, backend):
+        self.backend = backend
+        self.hits = 0
+        self.misses = 0
+
+    def lookup(self, key: str, tags: Sequence[str]) -> Tuple[Optional[CachedResponse], Tuple[int, ...]]:
+        """Return `(entry or None, current tag versions)`; pass the versions on to `store`."""
+        tags = (*tags, ALL)
+        try:
+            versions = self.backend.versions(tags)
+            entry = self.backend.get(key)
+        except Exception:
+            logger.exception("Response cache lookup failed")
+            return None, ()
+        if entry is not None and entry.versions == versions:
+            self.hits += 1
+            return entry, versions
+        self.misses += 1
+        return None, versions
+
+    def store(self, key: str, versions: Tuple[int, ...], body: bytes, headers: Dict[str, str]) -> None:
+        if not versions:
+            return # Lookup failed; don't cache a body we can't validate
+        try:
+            self.backend.set(key, CachedResponse(body, headers, versions))
+        except Exception:
+            logger.exception("Response cache store failed")
+
+    def invalidate(self, db: Session, tags: Iterable[str]) -> None:
+        """Bump `tags` when `db`'s current transaction commits (dropped on rollback)."""
+        db.info.setdefault("response_cache_tags", set()).update(tags)
+
+    def invalidate_table(self, db: Session, table_name: str) -> None:
+        self.invalidate(db, TABLE_TAGS.get(table_name, ()))
+
+    def invalidate_now(self, tags: Iterable[str]) -> None:
+        try:
+            self.backend.bump(list(tags))
+        except Exception:
+            logger.exception("Response cache invalidation failed")
+
+    def stats(self) -> Dict[str, int]:
+        return {"hits": self.hits, "misses": self.misses}
+
+
+def _create_backend():
+    if settings.RESPONSE_CACHE_BACKEND == "redis":
+        return RedisBackend(settings.RESPONSE_CACHE_REDIS_URL, settings.RESPONSE_CACHE_TTL_SECONDS)
+    return MemoryBackend(settings.RESPONSE_CACHE_MAX_ENTRIES, settings.RESPONSE_CACHE_TTL_SECONDS)
+
+response_cache = ResponseCache(_create_backend())
+
+
+@event.listens_for(Session, "after_commit")
+def _bump_committed_tags(session: Session) -> None:
+    tags = session.info.pop("response_cache_tags", None)
+    if tags:
+        response_cache.invalidate_now(tags)
+
+@event.listens_for(Session, "after_rollback")
+def _drop_pending_tags(session: Session) -> None:
+    session.info.pop("response_cache_tags", None)
+
+
+def cache_key(method: str, path: str, query: List[Tuple[str, str]]) -> str:
+    """
+    Route + normalised query string. Parameters are sorted by name only; repeated values
+    (e.g. `?ids=3&ids=1`) keep their order, since it can determine the response's order.
+    """
+    return method + " " + path + "?" + "&".join(f"{k}={v}" for k, v in sorted(query, key=lambda kv: kv[0]))
@@ -0,0 +1,122 @@
+# backend/app/services/search.py
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from sqlalchemy import Float, and_, cast, func, literal, or_, select, tuple_, union_all
+from sqlalchemy.orm import Session
+
+from app.models.grant import Grant
+from app.models.profile import Profile
+from app.models.project import Project
+from app.models.user import User
+from app.utils.cursor import decode_cursor, encode_cursor
+
+SEARCH_TYPES = ("grant", "project", "profile")
+TS_CONFIG = "english"
+HEADLINE_OPTIONS = "StartSel=<mark>, StopSel=</mark>, MaxWords=25, MinWords=8, MaxFragments=2, FragmentDelimiter= … "
+
+Hit = Dict[str, Any]
+
+def search(
+    db: Session,
+    q: str,
+    *,
+    types: Sequence[str] = SEARCH_TYPES,
+    limit: int = 20,
+    cursor: Optional[str] = None,
+) -> Tuple[List[Hit], Optional[str]]:
+    """
+    Ranked full-text search over grants, projects and talent-pool profiles.
+
+    Results are ordered by (rank desc, type, id) and paged with an opaque keyset cursor
+    over that key, so deep pages cost the same as the first one. Matching uses the
+    `search_vector` GIN indexes. Raises ValueError for a malformed cursor.
+    """
+    after = _decode_after(cursor) if cursor else None
+    hits = _ranked_page(db, q, types, limit + 1, after)
+
+    next_cursor = None
+    if len(hits) > limit:
+        hits = hits[:limit]
+        last = hits[-1]
+        next_cursor = encode_cursor([last["rank"], last["type"], last["id"]])
+    return hits, next_cursor
+
+def _decode_after(cursor: str) -> tuple:
+    rank, entity_type, entity_id = decode_cursor(cursor, length=3)
+    # bool is an int subclass; reject it along with strings, objects and null
+    if (
+        not isinstance(rank, (int, float)) or isinstance(rank, bool)
+        or entity_type not in SEARCH_TYPES
+        or not isinstance(entity_id, int) or isinstance(entity_id, bool)
+    ):
+        raise ValueError("Malformed cursor.")
+    return float(rank), entity_type, entity_id
+
+def _ranked_page(db: Session, q: str, types: Sequence[str], limit: int, after: Optional[tuple]) -> List[Hit]:
+    query = func.websearch_to_tsquery(TS_CONFIG, q)
+
+    def ranked(entity_type: str, id_column, vector, *criteria):
+        return (
+            select(
+                literal(entity_type).label("type"),
+                id_column.label("id"),
+                cast(func.ts_rank_cd(vector, query), Float).label("rank"),
+            )
+            .where(vector.op("@@")(query), *criteria)
+        )
+
+    selects = []
+    if "grant" in types:
+        selects.append(ranked("grant", Grant.id, Grant.search_vector))
+    if "project" in types:
+        selects.append(ranked("project", Project.id, Project.search_vector))
+    if "profile" in types:
+        selects.append(ranked("profile", Profile.user_id, Profile.search_vector, Profile.is_visible_in_talent_pool.is_(True)))
+    if not selects:
+        return []
+
+    hits_sq = union_all(*selects).subquery("hits")
+    stmt = select(hits_sq.c.type, hits_sq.c.id, hits_sq.c.rank)
+    if after is not None:
+        rank, entity_type, entity_id = after
+        stmt = stmt.where(or_(
+            hits_sq.c.rank < rank,
+            and_(hits_sq.c.rank == rank, tuple_(hits_sq.c.type, hits_sq.c.id) > tuple_(entity_type, entity_id)),
+        ))
+    stmt = stmt.order_by(hits_sq.c.rank.desc(), hits_sq.c.type, hits_sq.c.id).limit(limit)
+    page = [{"type": t, "id": i, "rank": r} for t, i, r in db.execute(stmt)]
+
+    # ts_headline re-parses the document, so only run it for the rows on this page.
+    _attach_headlines(db, page, query)
+    return page
+
+def _attach_headlines(db: Session, page: List[Hit], query) -> None:
+    ids_by_type: Dict[str, List[int]] = {}
+    for hit in page:
+        ids_by_type.setdefault(hit["type"], []).append(hit["id"])
+
+    def headline(document):
+        return func.ts_headline(TS_CONFIG, func.coalesce(document, ""), query, HEADLINE_OPTIONS)
+
+    details: Dict[Tuple[str, int], Tuple[Optional[str], Optional[str]]] = {}
+    if "grant" in ids_by_type:
+        rows = db.execute(
+            select(Grant.id, Grant.title, headline(Grant.description)).where(Grant.id.in_(ids_by_type["grant"]))
+        )
+        details.update({("grant", i): (t, s) for i, t, s in rows})
+    if "project" in ids_by_type:
+        rows = db.execute(
+            select(Project.id, Project.title, headline(Project.description)).where(Project.id.in_(ids_by_type["project"]))
+        )
+        details.update({("project", i): (t, s) for i, t, s in rows})
+    if "profile" in ids_by_type:
+        rows = db.execute(
+            select(Profile.user_id, User.full_name, headline(func.concat_ws(" — ", Profile.headline, Profile.about)))
+            .join(User, User.id == Profile.user_id)
+            .where(Profile.user_id.in_(ids_by_type["profile"]))
+        )
+        details.update({("profile", i): (t, s) for i, t, s in rows})
+
+    for hit in page:
+        hit["title"], hit["snippet"] = details.get((hit["type"], hit["id"]), (None, None))
+
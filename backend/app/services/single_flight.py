@@ -0,0 +1,83 @@
+# backend/app/services/single_flight.py
+import threading
+from typing import Callable, Dict, Hashable, Optional, Tuple, TypeVar
+
+from app.core.config import settings
+
+T = TypeVar("T")
+
+class _Call:
+    __slots__ = ("done", "result", "error", "waiters")
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error: Optional[BaseException] = None
+        self.waiters = 0
+
+
+class SingleFlight:
+    """
+    Collapse concurrent calls for the same key into one.
+
+    The first caller for a key (the leader) runs `fn`; callers arriving while it is in
+    flight block until it finishes and share its result, or re-raise its exception. A
+    follower that waits longer than `timeout` gives up and runs `fn` itself. Endpoints run
+    in the threadpool, so this is thread-based.
+    """
+
+    def __init__(self, timeout: float):
+        self._timeout = timeout
+        self._lock = threading.Lock()
+        self._calls: Dict[Hashable, _Call] = {}
+        self.leaders = 0
+        self.collapsed = 0 # Followers served by a leader's result
+        self.timeouts = 0
+        self.max_waiters = 0
+
+    def do(self, key: Hashable, fn: Callable[[], T]) -> Tuple[T, bool]:
+        """Return `(result, shared)`; `shared` is True when another caller computed it."""
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+                self.leaders += 1
+            else:
+                call.waiters += 1
+                self.max_waiters = max(self.max_waiters, call.waiters)
+
+        if leader:
+            try:
+                call.result = fn()
+                return call.result, False
+            except BaseException as exc:
+                call.error = exc
+                raise
+            finally:
+                with self._lock:
+                    del self._calls[key]
+                call.done.set()
+
+        if not call.done.wait(self._timeout):
+            with self._lock:
+                self.timeouts += 1
+            return fn(), False
+        with self._lock:
+            self.collapsed += 1
+        if call.error is not None:
+            raise call.error
+        return call.result, True
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                "leaders": self.leaders,
+                "collapsed": self.collapsed,
+                "timeouts": self.timeouts,
+                "max_waiters": self.max_waiters,
+                "in_flight": len(self._calls),
+            }
+
+
+single_flight = SingleFlight(settings.SINGLE_FLIGHT_TIMEOUT_SECONDS)
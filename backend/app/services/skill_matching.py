@@ -0,0 +1,212 @@
+# backend/app/services/skill_matching.py
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Set
+
+import numpy as np
+from scipy import sparse
+
+from app.models.talent_pool import TalentPoolEntry
+from .talent_index import TalentPoolIndex
+
+# Relative weight of skills listed under a project's roles_available vs. its required_skills
+ROLE_SKILL_WEIGHT = 0.5
+# Final score = OVERLAP_WEIGHT * weighted overlap + (1 - OVERLAP_WEIGHT) * IDF cosine
+OVERLAP_WEIGHT = 0.6
+
+def _normalize(skill: str) -> str:
+    return " ".join(skill.strip().lower().split())
+
+def project_skill_weights(required_skills: Optional[Sequence[str]], roles_available: Any) -> Dict[str, float]:
+    """
+    Turn a project's `required_skills` and `roles_available` into {skill: weight}.
+
+    `roles_available` is free-form JSON; skills are picked up from a `skills` key on the
+    object itself or on any role object in a list/dict of roles (lists or comma-separated strings).
+    """
+    weights: Dict[str, float] = {}
+
+    def add(skills: Any, weight: float) -> None:
+        if isinstance(skills, str):
+            skills = skills.split(",")
+        if not isinstance(skills, (list, tuple)):
+            return
+        for skill in skills:
+            if isinstance(skill, str) and skill.strip():
+                key = _normalize(skill)
+                weights[key] = max(weights.get(key, 0.0), weight)
+
+    add(required_skills or [], 1.0)
+
+    role_objects: List[Any] = []
+    if isinstance(roles_available, dict):
+        role_objects = [roles_available, *roles_available.values()]
+    elif isinstance(roles_available, list):
+        role_objects = roles_available
+    for role in role_objects:
+        if isinstance(role, dict):
+            add(role.get("skills"), ROLE_SKILL_WEIGHT)
+    return weights
+
+
+@dataclass
+class CandidateMatch:
+    profile_id: int
+    user_id: int
+    score: float
+    overlap: float
+    similarity: float
+    matched_skills: List[str] = field(default_factory=list)
+
+
+class SkillMatcher(TalentPoolIndex):
+    """
+    Ranks talent-pool profiles against a project's skills in one vectorized pass.
+
+    Keeps a skill vocabulary and a sparse binary profile x skill matrix (CSR). Profile
+    updates only touch the per-profile term lists; the matrix, IDF weights and row norms are
+    rebuilt lazily from those lists (O(nnz), no DB access) on the next query.
+    """
+
+    def __init__(self, sync_interval: Optional[float] = None):
+        super().__init__(sync_interval=sync_interval)
+        self._reset()
+
+    # --- TalentPoolIndex interface ---
+
+    def _reset(self) -> None:
+        self._vocab: Dict[str, int] = {}
+        self._terms: List[str] = []
+        self._row_by_profile: Dict[int, int] = {}
+        self._profile_ids: List[int] = []
+        self._user_ids: List[int] = []
+        self._row_terms: List[np.ndarray] = []
+        self._dirty = True
+
+    def __len__(self) -> int:
+        return len(self._row_by_profile)
+
+    def _upsert(self, rows: Iterable[TalentPoolEntry]) -> None:
+        for row in rows:
+            term_ids: Set[int] = set()
+            for skill in row.skills or []:
+                if not skill or not skill.strip():
+                    continue
+                key = _normalize(skill)
+                term_id = self._vocab.get(key)
+                if term_id is None:
+                    term_id = self._vocab[key] = len(self._terms)
+                    self._terms.append(key)
+                term_ids.add(term_id)
+            terms = np.fromiter(sorted(term_ids), dtype=np.int32, count=len(term_ids))
+
+            index = self._row_by_profile.get(row.profile_id)
+            if index is None:
+                self._row_by_profile[row.profile_id] = len(self._profile_ids)
+                self._profile_ids.append(row.profile_id)
+                self._user_ids.append(row.user_id)
+                self._row_terms.append(terms)
+            else:
+                self._user_ids[index] = row.user_id
+                self._row_terms[index] = terms
+        self._dirty = True
+
+    # --- Matrix ---
+
+    def _build_matrix(self) -> None:
+        n_rows, n_terms = len(self._row_terms), len(self._terms)
+        lengths = np.fromiter((len(t) for t in self._row_terms), dtype=np.int64, count=n_rows)
+        indptr = np.zeros(n_rows + 1, dtype=np.int64)
+        np.cumsum(lengths, out=indptr[1:])
+        indices = np.concatenate(self._row_terms) if n_rows else np.zeros(0, dtype=np.int32)
+        data = np.ones(len(indices), dtype=np.float32)
+        self._matrix = sparse.csr_matrix((data, indices, indptr), shape=(n_rows, n_terms))
+
+        # Smoothed IDF: rare skills count for more than ubiquitous ones.
+        doc_freq = np.bincount(indices, minlength=n_terms).astype(np.float32)
+        self._idf = np.log((1.0 + n_rows) / (1.0 + doc_freq)) + 1.0
+        # Rows are binary, so |row . idf|^2 is just the sum of the row's squared IDFs.
+        self._row_norms = np.sqrt(self._matrix @ (self._idf ** 2))
+        self._profile_id_array = np.asarray(self._profile_ids, dtype=np.int64)
+        self._user_id_array = np.asarray(self._user_ids, dtype=np.int64)
+        self._dirty = False
+
+    # --- Queries ---
+
+    def rank(
+        self,
+        skill_weights: Dict[str, float],
+        *,
+        top_k: int = 20,
+        exclude_user_ids: Iterable[int] = (),
+        min_score: float = 0.0,
+    ) -> List[CandidateMatch]:
+        """
+        Score every indexed profile against `skill_weights` and return the best `top_k`.
+
+        - overlap: share of the project's (IDF x weight) skill mass the profile covers
+        - similarity: cosine between the IDF-weighted project and profile skill vectors
+        Call `sync()` first.
+        """
+        if not skill_weights:
+            return []
+        with self._lock:
+            if self._dirty:
+                self._build_matrix()
+            if self._matrix.shape[0] == 0:
+                return []
+
+            n_terms = len(self._terms)
+            # Skills nobody has still count against coverage, with the maximum IDF.
+            unknown_idf = float(np.log(1.0 + self._matrix.shape[0])) + 1.0
+            query = np.zeros(n_terms, dtype=np.float32)
+            unknown_mass = 0.0
+            unknown_sq = 0.0
+            for skill, weight in skill_weights.items():
+                term_id = self._vocab.get(skill)
+                if term_id is None:
+                    unknown_mass += weight * unknown_idf
+                    unknown_sq += (weight * unknown_idf) ** 2
+                else:
+                    query[term_id] = weight * self._idf[term_id]
+
+            total_mass = float(query.sum()) + unknown_mass
+            query_norm = float(np.sqrt(np.dot(query, query) + unknown_sq))
+            if total_mass == 0.0 or query_norm == 0.0:
+                return []
+
+            # X is binary, so X @ query is the covered (IDF x weight) mass and
+            # X @ (query * idf) is the dot product of the IDF-weighted vectors.
+            covered = self._matrix @ query
+            dots = self._matrix @ (query * self._idf)
+            overlap = covered / total_mass
+            with np.errstate(divide="ignore", invalid="ignore"):
+                similarity = np.where(self._row_norms > 0, dots / (self._row_norms * query_norm), 0.0)
+            scores = OVERLAP_WEIGHT * overlap + (1.0 - OVERLAP_WEIGHT) * similarity
+
+            excluded = np.fromiter(exclude_user_ids, dtype=np.int64)
+            if excluded.size:
+                scores[np.isin(self._user_id_array, excluded)] = -1.0
+            candidates = np.flatnonzero((scores > min_score) & (covered > 0))
+            if candidates.size == 0:
+                return []
+            if candidates.size > top_k:
+                best = np.argpartition(-scores[candidates], top_k - 1)[:top_k]
+                candidates = candidates[best]
+            candidates = candidates[np.argsort(-scores[candidates], kind="stable")]
+
+            query_terms = {term_id for term_id in np.flatnonzero(query)}
+            results = []
+            for row in candidates:
+                matched = [self._terms[t] for t in self._row_terms[row] if t in query_terms]
+                results.append(CandidateMatch(
+                    profile_id=int(self._profile_id_array[row]),
+                    user_id=int(self._user_id_array[row]),
+                    score=float(scores[row]),
+                    overlap=float(overlap[row]),
+                    similarity=float(similarity[row]),
+                    matched_skills=matched,
+                ))
+            return results
+
+
+skill_matcher = SkillMatcher()
@@ -0,0 +1,173 @@
+# backend/app/services/sql_console.py
+import re
+import time
+from typing import Any, Dict, Iterator, Tuple
+
+import orjson
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.db.database import SessionLocal
+from app.utils.query_plan import summarize_plan
+
+# Statements the console runs; anything else is rejected before reaching the database.
+READ_STATEMENTS = frozenset({"select", "with", "values", "table", "show", "explain"})
+# Row-returning statements that can be read through a server-side cursor.
+CURSOR_STATEMENTS = frozenset({"select", "with", "values", "table"})
+
+_DOLLAR_TAG_RE = re.compile(r"\$([A-Za-z_][A-Za-z0-9_]*)?\$")
+
+def _blank_literals(sql: str) -> str:
+    """`sql` with string literals, quoted identifiers and comments replaced by spaces."""
+    out = list(sql)
+    i, n = 0, len(sql)
+
+    def blank(start: int, end: int) -> None:
+        out[start:end] = " " * (end - start)
+
+    while i < n:
+        c = sql[i]
+        if c in "'\"":
+            # E'...' strings take backslash escapes
+            escapes = c == "'" and i > 0 and sql[i - 1] in "eE" and not (i > 1 and (sql[i - 2].isalnum() or sql[i - 2] == "_"))
+            j = i + 1
+            while j < n:
+                if escapes and sql[j] == "\\":
+                    j += 2
+                    continue
+                if sql[j] == c:
+                    if j + 1 < n and sql[j + 1] == c: # Doubled quote
+                        j += 2
+                        continue
+                    break
+                j += 1
+            if j >= n:
+                raise ValueError("Unterminated quoted string.")
+            blank(i, j + 1)
+            i = j + 1
+        elif sql.startswith("--", i):
+            j = sql.find("\n", i)
+            j = n if j < 0 else j
+            blank(i, j)
+            i = j
+        elif sql.startswith("/*", i):
+            depth, j = 1, i + 2 # Block comments nest in PostgreSQL
+            while j < n and depth:
+                if sql.startswith("/*", j):
+                    depth, j = depth + 1, j + 2
+                elif sql.startswith("*/", j):
+                    depth, j = depth - 1, j + 2
+                else:
+                    j += 1
+            if depth:
+                raise ValueError("Unterminated comment.")
+            blank(i, j)
+            i = j
+        elif c == "$" and not (i > 0 and (sql[i - 1].isalnum() or sql[i - 1] == "_")) and _DOLLAR_TAG_RE.match(sql, i):
+            tag = _DOLLAR_TAG_RE.match(sql, i).group(0)
+            j = sql.find(tag, i + len(tag))
+            if j < 0:
+                raise ValueError("Unterminated dollar-quoted string.")
+            blank(i, j + len(tag))
+            i = j + len(tag)
+        else:
+            i += 1
+    return "".join(out)
+
+
+def check_statement(sql: str) -> Tuple[str, str]:
+    """
+    Validate a console statement: exactly one statement, starting with a read keyword.
+    Returns `(statement without trailing semicolon, keyword)`. Raises ValueError.
+
+    A second statement could COMMIT its way out of the read-only transaction, so it is
+    rejected here rather than left to the database.
+    """
+    code = _blank_literals(sql)
+    end = code.find(";")
+    if end >= 0:
+        if code[end:].replace(";", "").strip(): # Only trailing semicolons are allowed
+            raise ValueError("Only a single statement is allowed.")
+        code, sql = code[:end], sql[:end]
+    if not code.strip():
+        raise ValueError("The query is empty.")
+    keyword = code.split(None, 1)[0].lower().lstrip("(")
+    if keyword not in READ_STATEMENTS:
+        raise ValueError(f"Only {', '.join(sorted(READ_STATEMENTS)).upper()} statements are allowed.")
+    return sql, keyword
+
+
+def _begin_read_only(db: Session, timeout_ms: int) -> None:
+    # SET TRANSACTION must be the first statement of the transaction.
+    db.execute(text("SET TRANSACTION READ ONLY"))
+    db.execute(text("SELECT set_config('statement_timeout', :timeout, true)"), {"timeout": str(timeout_ms)})
+    db.execute(text("SELECT set_config('lock_timeout', :timeout, true)"), {"timeout": str(timeout_ms)})
+
+
+def _line(obj: Any) -> bytes:
+    return orjson.dumps(obj, default=str) + b"\n"
+
+
+def iter_query(sql: str, max_rows: int) -> Iterator[bytes]:
+    """
+    Run a read-only statement and stream NDJSON: {"columns": [...]}, one JSON array per
+    row, then {"row_count", "truncated", "elapsed_ms"} (or {"error"} if it fails midway).
+
+    Runs in its own READ ONLY transaction with statement_timeout, which is rolled back at
+    the end. SELECT-like statements are read through a server-side cursor and stop after
+    `max_rows`, so a huge result never sits in memory. Raises ValueError / DBAPIError on
+    the first iteration (before the header line) for a rejected or failing statement.
+    """
+    statement, keyword = check_statement(sql)
+    timeout_ms = settings.SQL_CONSOLE_STATEMENT_TIMEOUT_MS
+    with SessionLocal() as db:
+        _begin_read_only(db, timeout_ms)
+        started = time.monotonic()
+        # no_parameters: hand the text to the driver as-is, without %-placeholder formatting.
+        connection = db.connection().execution_options(no_parameters=True)
+        if keyword in CURSOR_STATEMENTS:
+            connection = connection.execution_options(yield_per=min(max_rows, 1000))
+        result = connection.exec_driver_sql(statement)
+        if not result.returns_rows:
+            raise ValueError("The statement returns no rows.")
+        yield _line({"columns": [str(key) for key in result.keys()]})
+
+        count, truncated = 0, False
+        try:
+            for row in result:
+                if count == max_rows:
+                    truncated = True
+                    break
+                count += 1
+                yield _line(list(row))
+                if time.monotonic() - started > timeout_ms / 1000:
+                    raise TimeoutError(f"Stopped after {timeout_ms} ms.")
+        except Exception as e:
+            yield _line({"error": str(getattr(e, "orig", None) or e).strip(), "row_count": count})
+            return
+        finally:
+            result.close()
+            db.rollback()
+        yield _line({"row_count": count, "truncated": truncated, "elapsed_ms": round((time.monotonic() - started) * 1000, 1)})
+
+
+def explain(sql: str, *, analyze: bool = True) -> Dict[str, Any]:
+    """
+    EXPLAIN a statement (with ANALYZE, BUFFERS by default, which executes it) in a READ ONLY
+    transaction with statement_timeout, and summarize the plan. Raises ValueError /
+    DBAPIError.
+    """
+    statement, keyword = check_statement(sql)
+    if keyword not in CURSOR_STATEMENTS:
+        raise ValueError("Only SELECT, WITH, VALUES and TABLE statements can be explained.")
+    options = "ANALYZE, BUFFERS, FORMAT JSON" if analyze else "FORMAT JSON"
+    with SessionLocal() as db:
+        try:
+            _begin_read_only(db, settings.SQL_CONSOLE_STATEMENT_TIMEOUT_MS)
+            explained = db.connection().execution_options(no_parameters=True).exec_driver_sql(
+                f"EXPLAIN ({options}) {statement}"
+            ).scalar_one()[0]
+        finally:
+            db.rollback()
+    return {"summary": summarize_plan(explained), "plan": explained}
@@ -0,0 +1,208 @@
+# backend/app/services/table_import.py
+import csv
+import json
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeout
+from typing import Any, BinaryIO, Iterator, List, Literal, Optional
+
+import orjson
+from sqlalchemy import Boolean, Table, column, func, literal_column, select, table as table_clause, text
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+
+from app.db.database import SessionLocal
+from app.services.audit import audit_log
+from app.services.response_cache import response_cache
+
+ImportFormat = Literal["csv", "ndjson"]
+ImportMode = Literal["insert", "upsert"] # upsert: update rows whose primary key already exists
+
+STAGE_TABLE = "_import_stage"
+PROGRESS_INTERVAL_SECONDS = 1.0
+
+def _importable(table: Table) -> List[str]:
+    return [col.name for col in table.columns if col.computed is None]
+
+
+def read_import_columns(table: Table, source: BinaryIO, fmt: ImportFormat, mode: ImportMode) -> List[str]:
+    """
+    The columns named by the upload (the CSV header, or the keys of the first NDJSON
+    object), checked against the table. Leaves `source` at the start. Raises ValueError.
+    """
+    first_line = source.readline().decode("utf-8-sig")
+    source.seek(0)
+    if fmt == "csv":
+        columns = next(csv.reader([first_line]), [])
+    else:
+        try:
+            first = json.loads(first_line)
+        except ValueError:
+            raise ValueError("The first line is not a JSON object.") from None
+        if not isinstance(first, dict):
+            raise ValueError("The first line is not a JSON object.")
+        columns = list(first)
+    if not columns:
+        raise ValueError("The upload names no columns.")
+    if len(set(columns)) != len(columns):
+        raise ValueError("The upload names a column more than once.")
+    unknown = [name for name in columns if name not in _importable(table)]
+    if unknown:
+        raise ValueError(f"Invalid columns for '{table.name}': {unknown}")
+    if mode == "upsert":
+        missing = [col.name for col in table.primary_key.columns if col.name not in columns]
+        if missing or not table.primary_key.columns:
+            raise ValueError(f"upsert needs the primary key columns: {missing}")
+    return columns
+
+
+def _csv_field(value: Any) -> str:
+    # COPY's CSV NULL is an unquoted empty field; everything else is quoted.
+    if value is None:
+        return ""
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    if isinstance(value, (int, float)):
+        return str(value)
+    if isinstance(value, (dict, list)):
+        value = json.dumps(value)
+    return '"' + str(value).replace('"', '""') + '"'
+
+
+class _CountingReader:
+    """File wrapper that counts the bytes COPY has consumed."""
+
+    def __init__(self, source: BinaryIO):
+        self.source = source
+        self.bytes_read = 0
+
+    def read(self, size: int = -1) -> bytes:
+        chunk = self.source.read(size)
+        self.bytes_read += len(chunk)
+        return chunk
+
+    def readline(self, size: int = -1) -> bytes:
+        line = self.source.readline(size)
+        self.bytes_read += len(line)
+        return line
+
+
+class _NdjsonAsCsv:
+    """Read-only file that re-encodes NDJSON objects as headerless CSV rows for COPY."""
+
+    def __init__(self, source: _CountingReader, columns: List[str]):
+        self.source = source
+        self.columns = columns
+        self.allowed = set(columns)
+        self.line_number = 0
+        self.buffer = b""
+
+    def _row(self, line: bytes) -> bytes:
+        self.line_number += 1
+        try:
+            obj = orjson.loads(line)
+        except orjson.JSONDecodeError:
+            raise ValueError(f"Line {self.line_number} is not valid JSON.") from None
+        if not isinstance(obj, dict) or not obj.keys() <= self.allowed:
+            raise ValueError(f"Line {self.line_number} is not an object with the first line's columns.")
+        return (",".join(_csv_field(obj.get(name)) for name in self.columns) + "\n").encode()
+
+    def read(self, size: int = -1) -> bytes:
+        size = size if size > 0 else 1 << 16
+        while len(self.buffer) < size:
+            line = self.source.readline()
+            if not line:
+                break
+            if line.strip():
+                self.buffer += self._row(line)
+        chunk, self.buffer = self.buffer[:size], self.buffer[size:]
+        return chunk
+
+
+def _merge_statement(table: Table, columns: List[str], mode: ImportMode):
+    stage = table_clause(STAGE_TABLE, *(column(name) for name in columns))
+    stmt = pg_insert(table).from_select(columns, select(*stage.c))
+    if mode == "upsert":
+        keys = [col.name for col in table.primary_key.columns]
+        updates = {name: stmt.excluded[name] for name in columns if name not in keys}
+        # ON CONFLICT DO UPDATE skips Column.onupdate (e.g. updated_at); apply it here.
+        updates.update({
+            col.name: col.onupdate.arg for col in table.columns
+            if col.name not in updates and col.onupdate is not None and col.onupdate.is_clause_element
+        })
+        stmt = stmt.on_conflict_do_update(index_elements=keys, set_=updates) if updates else stmt.on_conflict_do_nothing(index_elements=keys)
+    # xmax is 0 for a freshly inserted row and set for one updated by ON CONFLICT.
+    merged = stmt.returning(literal_column(f"{table.name}.xmax = 0", Boolean).label("inserted")).cte("merged")
+    return select(
+        func.count().filter(merged.c.inserted).label("inserted"),
+        func.count().filter(~merged.c.inserted).label("updated"),
+    )
+
+
+def iter_import(
+    table: Table, source: BinaryIO, size: int, columns: List[str], fmt: ImportFormat, mode: ImportMode,
+    *, actor_id: Optional[int] = None,
+) -> Iterator[bytes]:
+    """
+    Load an upload into `table` and stream progress as NDJSON lines.
+
+    The file is COPYed FROM STDIN into a temporary staging table with the target's column
+    types, then merged with one INSERT ... SELECT (ON CONFLICT DO UPDATE for upsert), all
+    in one transaction: either every row lands or none does. Parsing and type checks are
+    done by COPY, so a bad value fails the import with PostgreSQL's message (including
+    the line). Progress lines report the bytes consumed every PROGRESS_INTERVAL_SECONDS;
+    the last line is {"stage": "done", ...} or {"stage": "error", "detail": ...}.
+    Closes `source`. Runs in its own session, like the exports, so the audit log entry
+    (one per import, with the row counts) is attributed to `actor_id`.
+    """
+    reader = _CountingReader(source)
+    with source, SessionLocal() as db:
+        try:
+            quote = db.get_bind().dialect.identifier_preparer.quote
+            column_list = ", ".join(quote(name) for name in columns)
+            db.execute(text(
+                f"CREATE TEMP TABLE {STAGE_TABLE} ON COMMIT DROP AS "
+                f"SELECT {column_list} FROM {quote(table.name)} WITH NO DATA"
+            ))
+            if fmt == "csv": # The header line (and any BOM on it) is skipped by COPY
+                copy_sql = f"COPY {STAGE_TABLE} ({column_list}) FROM STDIN WITH (FORMAT csv, HEADER true)"
+                stream: Any = reader
+            else:
+                copy_sql = f"COPY {STAGE_TABLE} ({column_list}) FROM STDIN WITH (FORMAT csv)"
+                stream = _NdjsonAsCsv(reader, columns)
+            cursor = db.connection().connection.cursor()
+
+            def copy() -> int:
+                cursor.copy_expert(copy_sql, stream)
+                return cursor.rowcount
+
+            with ThreadPoolExecutor(max_workers=1) as executor:
+                future = executor.submit(copy)
+                while True:
+                    try:
+                        copied = future.result(timeout=PROGRESS_INTERVAL_SECONDS)
+                        break
+                    except FutureTimeout:
+                        yield orjson.dumps({"stage": "copy", "bytes": reader.bytes_read, "total_bytes": size}) + b"\n"
+            yield orjson.dumps({"stage": "copied", "rows": copied, "total_bytes": size}) + b"\n"
+
+            counts = db.execute(_merge_statement(table, columns, mode)).one()
+            pk_columns = list(table.primary_key.columns)
+            if len(pk_columns) == 1 and pk_columns[0].name in columns:
+                # Explicit ids bypass the id sequence; move it past them.
+                db.execute(
+                    text(
+                        f"SELECT setval(seq, (SELECT coalesce(max({quote(pk_columns[0].name)}), 0) + 1 FROM {quote(table.name)}), false) "
+                        "FROM (SELECT pg_get_serial_sequence(:table, :column) AS seq) s WHERE seq IS NOT NULL"
+                    ),
+                    {"table": table.name, "column": pk_columns[0].name},
+                )
+            audit_log.record(
+                db, source="admin", action="import", table_name=table.name, row_id=None,
+                details={"mode": mode, "format": fmt, "rows": copied, "inserted": counts.inserted, "updated": counts.updated},
+                actor_id=actor_id,
+            )
+            response_cache.invalidate_table(db, table.name)
+            db.commit()
+            yield orjson.dumps({"stage": "done", "rows": copied, "inserted": counts.inserted, "updated": counts.updated}) + b"\n"
+        except Exception as e:
+            db.rollback()
+            detail = getattr(e, "orig", None) or e
+            yield orjson.dumps({"stage": "error", "detail": str(detail).strip()}) + b"\n"
@@ -0,0 +1,89 @@
+# backend/app/services/table_registry.py
+from typing import Any, Callable, Dict, List, Optional
+
+import orjson
+from sqlalchemy import Column, MetaData, Table
+
+import app.models # noqa: F401 - registers every table on Base.metadata
+from app.api.conditional import body_etag
+from app.db.base_class import Base
+
+def _pk_parser(column: Optional[Column]) -> Callable[[str], Any]:
+    """Converter from a path segment to the primary key's Python type; raises ValueError."""
+    if column is None:
+        return lambda raw: raw
+    try:
+        python_type = column.type.python_type
+    except NotImplementedError:
+        return lambda raw: raw
+    if python_type in (int, str):
+        return python_type
+    return lambda raw: raw
+
+
+class TableInfo:
+    """Precomputed admin description of one table."""
+
+    __slots__ = ("name", "table", "primary_key", "parse_pk", "schema", "schema_body", "schema_etag")
+
+    def __init__(self, table: Table, referenced_by: List[Dict[str, Any]]):
+        self.name = table.name
+        self.table = table
+        pk_columns = list(table.primary_key.columns)
+        self.primary_key: Optional[Column] = pk_columns[0] if pk_columns else None # First PK column
+        self.parse_pk = _pk_parser(self.primary_key)
+        self.schema = {
+            "name": table.name,
+            "columns": [
+                {
+                    "name": col.name,
+                    "type": str(col.type),
+                    "nullable": col.nullable,
+                    "primary_key": col.primary_key,
+                    "computed": col.computed is not None,
+                }
+                for col in table.columns
+            ],
+            "primary_keys": [pk.name for pk in table.primary_key],
+            "foreign_keys": [
+                {
+                    "columns": [col.name for col in fk.columns],
+                    "referred_table": fk.referred_table.name,
+                    "referred_columns": [element.column.name for element in fk.elements],
+                    "ondelete": fk.ondelete,
+                }
+                for fk in sorted(table.foreign_key_constraints, key=lambda fk: [col.name for col in fk.columns])
+            ],
+            "referenced_by": referenced_by,
+        }
+        self.schema_body = orjson.dumps(self.schema)
+        self.schema_etag = body_etag(self.schema_body)
+
+
+class TableRegistry:
+    """
+    Admin view of `Base.metadata`, built once at import (app startup): table names,
+    column/key/foreign-key descriptions, primary-key parsers, and the schema responses
+    pre-serialized with their ETags. The metadata doesn't change while the app runs, so
+    admin navigation is served from memory.
+    """
+
+    def __init__(self, metadata: MetaData):
+        referenced_by: Dict[str, List[Dict[str, Any]]] = {name: [] for name in metadata.tables}
+        for table in metadata.sorted_tables:
+            for fk in table.foreign_key_constraints:
+                referenced_by[fk.referred_table.name].append(
+                    {"table": table.name, "columns": [col.name for col in fk.columns], "ondelete": fk.ondelete}
+                )
+        self.tables: Dict[str, TableInfo] = {
+            name: TableInfo(table, referenced_by[name]) for name, table in metadata.tables.items()
+        }
+        self.names: List[str] = sorted(self.tables)
+        self.names_body = orjson.dumps(self.names)
+        self.names_etag = body_etag(self.names_body)
+
+    def get(self, table_name: str) -> Optional[TableInfo]:
+        return self.tables.get(table_name)
+
+
+table_registry = TableRegistry(Base.metadata)
@@ -0,0 +1,106 @@
+# backend/app/services/table_stats.py
+import threading
+import time
+from datetime import datetime, timezone
+from typing import Any, Dict, Optional, Tuple
+
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.db.base_class import Base
+
+_TABLES_SQL = text("""
+SELECT s.relname AS table_name,
+       c.reltuples::bigint AS row_estimate,
+       s.n_live_tup AS live_tuples,
+       s.n_dead_tup AS dead_tuples,
+       pg_total_relation_size(s.relid) AS total_bytes,
+       pg_table_size(s.relid) AS table_bytes,
+       pg_indexes_size(s.relid) AS index_bytes,
+       s.seq_scan, s.seq_tup_read, s.idx_scan, s.idx_tup_fetch,
+       s.n_tup_ins AS inserted, s.n_tup_upd AS updated, s.n_tup_del AS deleted, s.n_tup_hot_upd AS hot_updated,
+       s.last_vacuum, s.last_autovacuum, s.last_analyze, s.last_autoanalyze,
+       io.heap_blks_read, io.heap_blks_hit, io.idx_blks_read, io.idx_blks_hit
+FROM pg_stat_user_tables s
+JOIN pg_class c ON c.oid = s.relid
+JOIN pg_statio_user_tables io ON io.relid = s.relid
+WHERE s.schemaname = current_schema()
+""")
+
+_INDEXES_SQL = text("""
+SELECT s.relname AS table_name,
+       s.indexrelname AS index_name,
+       s.idx_scan AS scans,
+       s.idx_tup_read AS tuples_read,
+       pg_relation_size(s.indexrelid) AS bytes,
+       i.indisunique AS is_unique,
+       i.indisprimary AS is_primary,
+       io.idx_blks_read AS blocks_read,
+       io.idx_blks_hit AS blocks_hit
+FROM pg_stat_user_indexes s
+JOIN pg_index i ON i.indexrelid = s.indexrelid
+JOIN pg_statio_user_indexes io ON io.indexrelid = s.indexrelid
+WHERE s.schemaname = current_schema()
+ORDER BY s.relname, s.indexrelname
+""")
+
+_STATS_RESET_SQL = text("SELECT stats_reset FROM pg_stat_database WHERE datname = current_database()")
+
+def _ratio(part: Optional[int], whole: Optional[int]) -> Optional[float]:
+    return round(part / whole, 4) if part is not None and whole else None
+
+
+class TableStats:
+    """
+    Per-table storage and access statistics from the cumulative statistics views
+    (pg_stat_user_tables/indexes, pg_statio_user_tables/indexes), for the tables in
+    `Base.metadata`. Counters are cumulative since `stats_reset`. The snapshot is cached
+    for ADMIN_TABLE_STATS_TTL_SECONDS per process; the size functions stat every
+    relation file, which adds up on every dashboard refresh.
+    """
+
+    def __init__(self, ttl: float):
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._snapshot: Optional[Tuple[float, Dict[str, Any]]] = None
+
+    def _collect(self, db: Session) -> Dict[str, Any]:
+        tables: Dict[str, Dict[str, Any]] = {}
+        for row in db.execute(_TABLES_SQL).mappings():
+            if row["table_name"] not in Base.metadata.tables:
+                continue
+            stats = dict(row)
+            reads = (row["heap_blks_read"] or 0) + (row["heap_blks_hit"] or 0)
+            stats.update(
+                row_estimate=row["row_estimate"] if row["row_estimate"] >= 0 else None, # -1: never analyzed
+                dead_tuple_ratio=_ratio(row["dead_tuples"], row["live_tuples"] + row["dead_tuples"]),
+                seq_scan_ratio=_ratio(row["seq_scan"], (row["seq_scan"] or 0) + (row["idx_scan"] or 0)),
+                heap_cache_hit_ratio=_ratio(row["heap_blks_hit"], reads),
+                indexes=[],
+            )
+            tables[row["table_name"]] = stats
+        for row in db.execute(_INDEXES_SQL).mappings():
+            if row["table_name"] not in tables:
+                continue
+            index = dict(row)
+            del index["table_name"]
+            # Unique indexes enforce constraints even when no query scans them.
+            index["unused"] = row["scans"] == 0 and not row["is_unique"]
+            tables[row["table_name"]]["indexes"].append(index)
+        return {
+            "generated_at": datetime.now(timezone.utc),
+            "stats_since": db.execute(_STATS_RESET_SQL).scalar(),
+            "tables": tables,
+        }
+
+    def get(self, db: Session) -> Dict[str, Any]:
+        with self._lock:
+            if self._snapshot is not None and self._snapshot[0] > time.monotonic():
+                return self._snapshot[1]
+            snapshot = self._collect(db)
+            self._snapshot = (time.monotonic() + self.ttl, snapshot)
+            return snapshot
+
+
+table_stats = TableStats(ttl=settings.ADMIN_TABLE_STATS_TTL_SECONDS)
@@ -0,0 +1,164 @@
+# backend/app/services/talent_facets.py
+from typing import Dict, Iterable, List, Mapping, Optional, Sequence, Set, Tuple
+
+from bitarray import bitarray
+from bitarray.util import count_and
+
+from app.models.talent_pool import TalentPoolEntry
+from .talent_index import TalentPoolIndex
+
+# Facets the talent pool can be filtered and counted by
+FACETS = ("skills", "research_interests", "current_role", "role")
+
+def _normalize(value: str) -> str:
+    return value.strip().lower()
+
+def _facet_values(row: TalentPoolEntry) -> Dict[str, Set[str]]:
+    role = row.role.value if hasattr(row.role, "value") else row.role
+    values = {
+        "skills": row.skills or [],
+        "research_interests": row.research_interests or [],
+        "current_role": [row.current_role] if row.current_role else [],
+        "role": [role] if role else [],
+    }
+    return {facet: {_normalize(v) for v in vals if v and v.strip()} for facet, vals in values.items()}
+
+
+class TalentFacetIndex(TalentPoolIndex):
+    """
+    Bitmap index over the talent pool: one bitset per (facet, value), one bit per profile.
+
+    Each profile occupies a slot (bit position). Filters are evaluated as bitset OR within a
+    facet and AND across facets, and facet counts are popcounts of `bitmap & result`, so a
+    multi-facet query touches `n/8` bytes per bitmap instead of scanning array columns.
+    """
+
+    def __init__(self, sync_interval: Optional[float] = None):
+        super().__init__(sync_interval=sync_interval)
+        self._reset()
+
+    # --- TalentPoolIndex interface ---
+
+    def _reset(self) -> None:
+        self._capacity = 0
+        self._slot_by_profile: Dict[int, int] = {}
+        self._profile_by_slot: List[Optional[int]] = []
+        self._live = bitarray(0)
+        self._bitmaps: Dict[str, Dict[str, bitarray]] = {facet: {} for facet in FACETS}
+        self._values_by_slot: Dict[int, Dict[str, Set[str]]] = {}
+
+    def __len__(self) -> int:
+        return len(self._slot_by_profile)
+
+    def _upsert(self, rows: Iterable[TalentPoolEntry]) -> None:
+        for row in rows:
+            slot = self._slot_by_profile.get(row.profile_id)
+            if slot is None:
+                slot = self._allocate_slot(row.profile_id)
+            else:
+                self._clear_slot_values(slot)
+            values = _facet_values(row)
+            for facet, facet_values in values.items():
+                bitmaps = self._bitmaps[facet]
+                for value in facet_values:
+                    bitmap = bitmaps.get(value)
+                    if bitmap is None:
+                        bitmap = bitmaps[value] = self._empty()
+                    bitmap[slot] = 1
+            self._values_by_slot[slot] = values
+
+    # --- Slot management ---
+
+    def _empty(self) -> bitarray:
+        bits = bitarray(self._capacity)
+        bits.setall(0)
+        return bits
+
+    def _grow(self) -> None:
+        extra = max(64, self._capacity) # Double, so growth is amortised O(1) per profile
+        padding = bitarray(extra)
+        padding.setall(0)
+        self._live.extend(padding)
+        for bitmaps in self._bitmaps.values():
+            for bitmap in bitmaps.values():
+                bitmap.extend(padding)
+        self._profile_by_slot.extend([None] * extra)
+        self._capacity += extra
+
+    def _allocate_slot(self, profile_id: int) -> int:
+        # Profiles are only removed by a full rebuild, so occupied slots are always 0..n-1.
+        slot = len(self._slot_by_profile)
+        if slot >= self._capacity:
+            self._grow()
+        self._slot_by_profile[profile_id] = slot
+        self._profile_by_slot[slot] = profile_id
+        self._live[slot] = 1
+        return slot
+
+    def _clear_slot_values(self, slot: int) -> None:
+        for facet, facet_values in self._values_by_slot.pop(slot, {}).items():
+            bitmaps = self._bitmaps[facet]
+            for value in facet_values:
+                bitmap = bitmaps.get(value)
+                if bitmap is None:
+                    continue
+                bitmap[slot] = 0
+                if not bitmap.any():
+                    del bitmaps[value]
+
+    # --- Queries ---
+
+    def query(
+        self,
+        filters: Mapping[str, Sequence[str]],
+        *,
+        match_all: Sequence[str] = (),
+        facet_limit: int = 20,
+    ) -> Tuple[List[int], Dict[str, Dict[str, int]]]:
+        """
+        Evaluate `filters` ({facet: [values]}) and return `(profile_ids, facet_counts)`.
+
+        Values within a facet are ORed unless the facet is listed in `match_all`, in which
+        case they are ANDed; facets are always ANDed together. `facet_counts` holds, per
+        facet, the `facet_limit` most frequent values among the matching profiles.
+        Call `sync()` first.
+        """
+        with self._lock:
+            result = self._live.copy()
+            for facet, values in filters.items():
+                if facet not in self._bitmaps:
+                    raise ValueError(f"Unknown facet '{facet}'.")
+                values = [_normalize(v) for v in values if v and v.strip()]
+                if not values:
+                    continue
+                bitmaps = self._bitmaps[facet]
+                if facet in match_all:
+                    for value in values:
+                        bitmap = bitmaps.get(value)
+                        if bitmap is None:
+                            result.setall(0)
+                            break
+                        result &= bitmap
+                else:
+                    selected = self._empty()
+                    for value in values:
+                        bitmap = bitmaps.get(value)
+                        if bitmap is not None:
+                            selected |= bitmap
+                    result &= selected
+
+            counts: Dict[str, Dict[str, int]] = {}
+            for facet, bitmaps in self._bitmaps.items():
+                facet_counts: Dict[str, int] = {}
+                for value, bitmap in bitmaps.items():
+                    n = count_and(bitmap, result)
+                    if n:
+                        facet_counts[value] = n
+                top = sorted(facet_counts.items(), key=lambda kv: (-kv[1], kv[0]))[:facet_limit]
+                counts[facet] = dict(top)
+
+            profile_ids = sorted(self._profile_by_slot[slot] for slot in result.search(1))
+            return profile_ids, counts
+
+
+talent_facet_index = TalentFacetIndex()
@@ -0,0 +1,27 @@
+# backend/app/services/talent_index.py
+from datetime import datetime
+from typing import List, Optional, Tuple
+
+from sqlalchemy.orm import Session
+
+from app import crud
+from app.core.config import settings
+from app.models.talent_pool import TalentPoolEntry
+from .incremental_index import IncrementalIndex
+
+class TalentPoolIndex(IncrementalIndex):
+    """
+    Base class for in-memory indexes derived from the `talent_pool_entries` read model,
+    synchronised on its `refreshed_at` column.
+    """
+
+    def __init__(self, sync_interval: Optional[float] = None):
+        super().__init__(
+            settings.TALENT_INDEX_SYNC_INTERVAL_SECONDS if sync_interval is None else sync_interval
+        )
+
+    def _fetch_state(self, db: Session) -> Tuple[Optional[datetime], int]:
+        return crud.talent_pool.get_sync_state(db)
+
+    def _fetch_since(self, db: Session, since: Optional[datetime]) -> List[TalentPoolEntry]:
+        return crud.talent_pool.get_refreshed_since(db, since=since)
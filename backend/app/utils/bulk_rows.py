@@ -0,0 +1,189 @@
+# backend/app/utils/bulk_rows.py
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+from sqlalchemy import Table, cast, column, values
+from sqlalchemy.exc import DBAPIError, SQLAlchemyError
+from sqlalchemy.orm import Session
+
+# Bulk writes for the admin table editor. Every operation returns one result per input
+# item, in input order: {"index", "ok": True, "row"} ({"index", "ok": True, "id"} for
+# deletes) or {"index", "ok": False, "error"}.
+# The whole batch is first tried as one multi-row statement per group of rows with the
+# same columns, inside a savepoint. If that fails (one bad row fails the statement), the
+# savepoint is rolled back and the batch is replayed one row per savepoint, so the good
+# rows are kept and each bad row reports its own error. Runs in the caller's transaction.
+
+def _error(e: Exception) -> str:
+    if isinstance(e, DBAPIError) and e.orig is not None:
+        return str(e.orig).strip().splitlines()[0]
+    return str(e)
+
+
+def _single_pk(table: Table):
+    pk_columns = list(table.primary_key.columns)
+    if len(pk_columns) != 1:
+        raise ValueError(f"Table '{table.name}' needs a single-column primary key for bulk writes.")
+    return pk_columns[0]
+
+
+def _coerce_key(pk, value: Any) -> Any:
+    """A primary key from JSON as the column's Python type (e.g. "5" for an integer key); raises ValueError."""
+    try:
+        python_type = pk.type.python_type
+    except NotImplementedError:
+        return value
+    if python_type is int:
+        if isinstance(value, bool) or (isinstance(value, float) and not value.is_integer()):
+            raise ValueError(value)
+        return int(value)
+    if python_type is str:
+        return str(value)
+    return value
+
+
+def _validate(table: Table, rows: Sequence[Any], results: List[Optional[Dict[str, Any]]]) -> None:
+    for index, row in enumerate(rows):
+        if not isinstance(row, dict) or not row:
+            results[index] = {"index": index, "ok": False, "error": "Expected a non-empty object."}
+            continue
+        unknown = [key for key in row if key not in table.columns]
+        if unknown:
+            results[index] = {"index": index, "ok": False, "error": f"Invalid columns: {unknown}"}
+
+
+def _groups(rows: Sequence[Dict[str, Any]], indexes: Sequence[int]) -> Dict[Tuple[str, ...], List[int]]:
+    """Input indexes grouped by column set, for one multi-row statement per group."""
+    groups: Dict[Tuple[str, ...], List[int]] = {}
+    for index in indexes:
+        groups.setdefault(tuple(sorted(rows[index])), []).append(index)
+    return groups
+
+
+def _apply(
+    db: Session,
+    pending: List[int],
+    results: List[Optional[Dict[str, Any]]],
+    batch: Callable[[List[int]], None],
+    single: Callable[[int], Dict[str, Any]],
+) -> List[Dict[str, Any]]:
+    if pending:
+        try:
+            with db.begin_nested():
+                batch(pending)
+        except SQLAlchemyError:
+            # Replay row by row to keep the good rows and pin the failures.
+            for index in pending:
+                try:
+                    with db.begin_nested():
+                        results[index] = single(index)
+                except SQLAlchemyError as e:
+                    results[index] = {"index": index, "ok": False, "error": _error(e)}
+    return results # type: ignore[return-value]
+
+
+def bulk_insert(db: Session, table: Table, rows: Sequence[Any]) -> List[Dict[str, Any]]:
+    """INSERT ... RETURNING the rows, batched through executemany (insertmanyvalues)."""
+    results: List[Optional[Dict[str, Any]]] = [None] * len(rows)
+    _validate(table, rows, results)
+    pending = [i for i, result in enumerate(results) if result is None]
+
+    def batch(indexes: List[int]) -> None:
+        for group in _groups(rows, indexes).values():
+            stmt = table.insert().returning(*table.columns, sort_by_parameter_order=True)
+            inserted = db.execute(stmt, [rows[i] for i in group]).all()
+            for index, row in zip(group, inserted):
+                results[index] = {"index": index, "ok": True, "row": dict(row._mapping)}
+
+    def single(index: int) -> Dict[str, Any]:
+        row = db.execute(table.insert().values(rows[index]).returning(*table.columns)).one()
+        return {"index": index, "ok": True, "row": dict(row._mapping)}
+
+    return _apply(db, pending, results, batch, single)
+
+
+def bulk_update(db: Session, table: Table, rows: Sequence[Any]) -> List[Dict[str, Any]]:
+    """
+    UPDATE ... FROM (VALUES ...) RETURNING; each row carries its primary key plus the
+    columns to set. Rows whose key matches nothing report "Row not found".
+    """
+    pk = _single_pk(table)
+    results: List[Optional[Dict[str, Any]]] = [None] * len(rows)
+    _validate(table, rows, results)
+    rows = list(rows)
+    seen = set()
+    for index, row in enumerate(rows):
+        if results[index] is not None:
+            continue
+        if row.get(pk.name) is None or len(row) < 2:
+            results[index] = {"index": index, "ok": False, "error": f"Expected '{pk.name}' and at least one column to set."}
+            continue
+        try:
+            key = _coerce_key(pk, row[pk.name])
+        except (TypeError, ValueError):
+            results[index] = {"index": index, "ok": False, "error": f"Invalid '{pk.name}': {row[pk.name]!r}"}
+            continue
+        if key in seen:
+            results[index] = {"index": index, "ok": False, "error": f"Duplicate '{pk.name}' in batch."}
+        else:
+            seen.add(key)
+            rows[index] = {**row, pk.name: key} # Matched against the RETURNING keys below
+    pending = [i for i, result in enumerate(results) if result is None]
+    not_found = "Row not found."
+
+    def batch(indexes: List[int]) -> None:
+        for names, group in _groups(rows, indexes).items():
+            data = values(*(column(name, table.c[name].type) for name in names), name="bulk_rows").data(
+                [tuple(rows[i][name] for name in names) for i in group]
+            )
+            # VALUES columns are untyped in SQL; cast them back to the target column types.
+            source = {name: cast(data.c[name], table.c[name].type) for name in names}
+            stmt = (
+                table.update()
+                .where(pk == source[pk.name])
+                .values({name: source[name] for name in names if name != pk.name})
+                .returning(*table.columns)
+            )
+            updated = {row._mapping[pk.name]: dict(row._mapping) for row in db.execute(stmt)}
+            for index in group:
+                row = updated.get(rows[index][pk.name])
+                results[index] = {"index": index, "ok": True, "row": row} if row else {"index": index, "ok": False, "error": not_found}
+
+    def single(index: int) -> Dict[str, Any]:
+        changes = {name: value for name, value in rows[index].items() if name != pk.name}
+        stmt = table.update().where(pk == rows[index][pk.name]).values(changes).returning(*table.columns)
+        row = db.execute(stmt).first()
+        return {"index": index, "ok": True, "row": dict(row._mapping)} if row else {"index": index, "ok": False, "error": not_found}
+
+    return _apply(db, pending, results, batch, single)
+
+
+def bulk_delete(db: Session, table: Table, ids: Sequence[Any]) -> List[Dict[str, Any]]:
+    """DELETE ... WHERE pk IN (...) RETURNING pk. Dependent rows are not cascaded."""
+    pk = _single_pk(table)
+    results: List[Optional[Dict[str, Any]]] = [None] * len(ids)
+    ids = list(ids)
+    seen = set()
+    for index, raw in enumerate(ids):
+        try:
+            ids[index] = _coerce_key(pk, raw)
+        except (TypeError, ValueError):
+            results[index] = {"index": index, "ok": False, "error": f"Invalid '{pk.name}': {raw!r}"}
+            continue
+        if ids[index] in seen:
+            results[index] = {"index": index, "ok": False, "error": f"Duplicate '{pk.name}' in batch."}
+        else:
+            seen.add(ids[index])
+    pending = [i for i, result in enumerate(results) if result is None]
+    not_found = "Row not found."
+
+    def batch(indexes: List[int]) -> None:
+        stmt = table.delete().where(pk.in_([ids[i] for i in indexes])).returning(pk)
+        deleted = set(db.execute(stmt).scalars())
+        for index in indexes:
+            results[index] = {"index": index, "ok": True, "id": ids[index]} if ids[index] in deleted else {"index": index, "ok": False, "error": not_found}
+
+    def single(index: int) -> Dict[str, Any]:
+        deleted = db.execute(table.delete().where(pk == ids[index]).returning(pk)).first()
+        return {"index": index, "ok": True, "id": ids[index]} if deleted else {"index": index, "ok": False, "error": not_found}
+
+    return _apply(db, pending, results, batch, single)
@@ -0,0 +1,130 @@
+# backend/app/utils/cascade.py
+from functools import lru_cache
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Tuple
+
+from sqlalchemy import Table, bindparam, func, null, or_, select, tuple_
+from sqlalchemy.orm import Session
+from sqlalchemy.sql.elements import ColumnElement
+
+from app.db.base_class import Base
+
+class CascadeStep(NamedTuple):
+    table: Table
+    action: str # "delete" or "set_null"
+    where: ColumnElement # Rows affected, in terms of the :root_id parameter
+    columns: Tuple[str, ...] = () # Foreign-key columns cleared by a set_null step
+
+
+def _fk_predicate(fk, parent_where: ColumnElement) -> ColumnElement:
+    """Rows of the referencing table pointing at a parent row matched by `parent_where`."""
+    referred = [element.column for element in fk.elements]
+    parents = select(*referred).where(parent_where)
+    if len(fk.columns) == 1:
+        return list(fk.columns)[0].in_(parents.scalar_subquery())
+    return tuple_(*fk.columns).in_(parents)
+
+
+def _detaches(fk) -> bool:
+    """A reference that should be cleared rather than have its row deleted."""
+    ondelete = (fk.ondelete or "").upper()
+    return ondelete == "SET NULL" or (ondelete in ("", "NO ACTION", "RESTRICT") and all(c.nullable for c in fk.columns))
+
+
+@lru_cache(maxsize=None)
+def plan_delete(table: Table, cascade: bool = True) -> Tuple[CascadeStep, ...]:
+    """
+    Statements that delete one row of `table` (by its single-column primary key, bound as
+    :root_id) together with everything that references it, in execution order.
+
+    Walks the foreign keys of `Base.metadata` from `table`. Referencing rows are deleted,
+    except that nullable references without an ON DELETE action (and ON DELETE SET NULL
+    ones) are cleared instead; ON DELETE SET DEFAULT is left to the database. Each
+    affected table gets one set-based statement whose WHERE is an IN-subquery chain back
+    to the root row, OR-ed over every path that reaches it. Clearing runs first, then
+    deletes go leaves-first (a topological order of the reachable tables), so every
+    subquery still sees the parent rows it selects from. Raises ValueError for a table
+    without a single-column primary key or a foreign-key cycle.
+    """
+    pk_columns = list(table.primary_key.columns)
+    if len(pk_columns) != 1:
+        raise ValueError(f"Table '{table.name}' needs a single-column primary key for deletion.")
+    root_where = pk_columns[0] == bindparam("root_id", type_=pk_columns[0].type)
+    if not cascade:
+        return (CascadeStep(table, "delete", root_where),)
+
+    referencing: Dict[Table, List[Any]] = {}
+    for other in Base.metadata.tables.values():
+        for fk in other.foreign_key_constraints:
+            referencing.setdefault(fk.referred_table, []).append(fk)
+
+    # Depth-first from the root: post-order gives children before parents.
+    order: List[Table] = []
+    incoming: Dict[Table, List[Any]] = {table: []}
+    detach: List[Any] = []
+    visiting: set = set()
+
+    def visit(current: Table) -> None:
+        visiting.add(current)
+        for fk in referencing.get(current, []):
+            if _detaches(fk):
+                detach.append(fk)
+                continue
+            if (fk.ondelete or "").upper() == "SET DEFAULT":
+                continue
+            child = fk.table
+            if child in visiting:
+                raise ValueError(f"Foreign-key cycle through '{child.name}'; cannot plan a cascade.")
+            first_visit = child not in incoming
+            incoming.setdefault(child, []).append(fk)
+            if first_visit:
+                visit(child)
+        visiting.discard(current)
+        order.append(current)
+
+    visit(table)
+
+    where: Dict[Table, ColumnElement] = {}
+
+    def references(fk) -> ColumnElement:
+        if fk.referred_table is table and [e.column for e in fk.elements] == pk_columns:
+            return list(fk.columns)[0] == root_where.right # Direct reference: no subquery
+        return _fk_predicate(fk, doomed(fk.referred_table))
+
+    def doomed(current: Table) -> ColumnElement:
+        if current not in where:
+            if current is table:
+                where[current] = root_where
+            else:
+                where[current] = or_(*(references(fk) for fk in incoming[current]))
+        return where[current]
+
+    steps = [CascadeStep(fk.table, "set_null", references(fk), tuple(c.name for c in fk.columns)) for fk in detach]
+    steps.extend(CascadeStep(current, "delete", doomed(current)) for current in order)
+    return tuple(steps)
+
+
+def run_delete(
+    db: Session, table: Table, root_id: Any, *, cascade: bool = True, dry_run: bool = False,
+    progress: Optional[Callable[[int, int, str], None]] = None,
+) -> List[Dict[str, Any]]:
+    """
+    Execute (or, with `dry_run`, only count) the `plan_delete` statements for one row, in
+    the caller's transaction. Returns one `{"table", "action", "columns", "rows"}` entry
+    per statement, the root row's delete last. `progress(done, total, next step)` is called
+    before each statement (e.g. a job's progress report).
+    """
+    params = {"root_id": root_id}
+    report = []
+    steps = plan_delete(table, cascade)
+    for number, step in enumerate(steps):
+        if progress is not None:
+            progress(number, len(steps), f"{step.action} {step.table.name}")
+        if dry_run:
+            rows = db.execute(select(func.count()).select_from(step.table).where(step.where), params).scalar_one()
+        elif step.action == "set_null":
+            stmt = step.table.update().where(step.where).values({name: null() for name in step.columns})
+            rows = db.execute(stmt, params).rowcount
+        else:
+            rows = db.execute(step.table.delete().where(step.where), params).rowcount
+        report.append({"table": step.table.name, "action": step.action, "columns": list(step.columns), "rows": rows})
+    return report
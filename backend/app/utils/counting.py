@@ -0,0 +1,63 @@
+# backend/app/utils/counting.py
+from typing import Literal, Optional, Tuple
+
+from sqlalchemy import Select, Table, func, select, text
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.orm import Session
+from sqlalchemy.sql.base import Executable
+from sqlalchemy.sql.elements import ClauseElement
+from sqlalchemy.sql.visitors import InternalTraversal
+
+from app.core.config import settings
+
+# exact: count(*). estimated: planner statistics. none: skip the count.
+# auto: exact when the estimate is at most ADMIN_EXACT_COUNT_THRESHOLD, else the estimate.
+CountMode = Literal["auto", "exact", "estimated", "none"]
+
+_RELTUPLES_SQL = text("SELECT reltuples::bigint FROM pg_class WHERE oid = to_regclass(:name)")
+
+class _Explain(Executable, ClauseElement):
+    """EXPLAIN (FORMAT JSON) of a statement, with its parameters bound as usual."""
+
+    inherit_cache = True
+    _traverse_internals = [("statement", InternalTraversal.dp_clauseelement)]
+
+    def __init__(self, statement: Select):
+        self.statement = statement
+
+
+@compiles(_Explain, "postgresql")
+def _compile_explain(element: _Explain, compiler, **kw) -> str:
+    return "EXPLAIN (FORMAT JSON) " + compiler.process(element.statement, **kw)
+
+
+def table_row_estimate(db: Session, table: Table) -> Optional[int]:
+    """Row count from the last ANALYZE / autovacuum; None if the table was never analyzed."""
+    estimate = db.execute(_RELTUPLES_SQL, {"name": table.fullname}).scalar()
+    return estimate if estimate is not None and estimate >= 0 else None
+
+
+def query_row_estimate(db: Session, stmt: Select) -> int:
+    """The planner's row estimate for a statement, without running it."""
+    plan = db.execute(_Explain(stmt.order_by(None))).scalar_one()
+    return int(plan[0]["Plan"]["Plan Rows"])
+
+
+def count_rows(db: Session, stmt: Select, table: Table, *, mode: CountMode, filtered: bool) -> Tuple[Optional[int], bool]:
+    """
+    Count the rows of `stmt`, a SELECT over `table` (filtered or not), according to `mode`.
+
+    Returns `(count, exact)`; count is None for mode "none". Estimates come from
+    `pg_class.reltuples` for a whole table and from the EXPLAIN row estimate for a filtered
+    one, so they cost a catalog lookup or a planner call instead of a scan.
+    """
+    if mode == "none":
+        return None, False
+    if mode != "exact":
+        estimate = None if filtered else table_row_estimate(db, table)
+        if estimate is None:
+            estimate = query_row_estimate(db, stmt)
+        if mode == "estimated" or estimate > settings.ADMIN_EXACT_COUNT_THRESHOLD:
+            return estimate, False
+    count_stmt = select(func.count()).select_from(stmt.order_by(None).subquery())
+    return db.execute(count_stmt).scalar_one(), True
@@ -0,0 +1,21 @@
+# backend/app/utils/cursor.py
+import base64
+import json
+from typing import Any, List
+
+# Opaque keyset-pagination cursors: URL-safe base64 of a JSON array of sort-key values.
+
+def encode_cursor(values: List[Any]) -> str:
+    raw = json.dumps(values, separators=(",", ":"), default=str).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+def decode_cursor(cursor: str, *, length: int) -> List[Any]:
+    """Decode a cursor produced by `encode_cursor`. Raises ValueError if it is malformed."""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        values = json.loads(base64.urlsafe_b64decode(padded.encode()))
+    except (ValueError, TypeError) as e:
+        raise ValueError("Malformed cursor.") from e
+    if not isinstance(values, list) or len(values) != length:
+        raise ValueError("Malformed cursor.")
+    return values
@@ -0,0 +1,207 @@
+# backend/app/utils/filters.py
+import datetime
+import decimal
+from functools import lru_cache
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from sqlalchemy import Enum, Table, and_, bindparam, or_
+from sqlalchemy.sql.elements import ColumnElement
+
+# Filter language for the admin table browser. A filter is a JSON object, either a
+# condition on one column or an and/or group of filters:
+#   {"column": "status", "op": "eq", "value": "OPEN"}
+#   {"column": "amount", "op": "range", "value": [1000, null]}   (inclusive, null = open end)
+#   {"column": "id", "op": "in", "value": [1, 2, 3]}
+#   {"column": "title", "op": "ilike", "value": "%ai%"}
+#   {"column": "deadline", "op": "is_null", "value": false}
+#   {"and": [...]} / {"or": [...]}
+COMPARISONS = {
+    "eq": lambda c, p: c == p,
+    "ne": lambda c, p: c != p,
+    "lt": lambda c, p: c < p,
+    "lte": lambda c, p: c <= p,
+    "gt": lambda c, p: c > p,
+    "gte": lambda c, p: c >= p,
+}
+OPERATORS = frozenset(COMPARISONS) | {"range", "in", "ilike", "is_null"}
+ORDERED_OPERATORS = frozenset({"lt", "lte", "gt", "gte", "range"})
+
+MAX_FILTER_CONDITIONS = 50
+MAX_FILTER_DEPTH = 8
+MAX_IN_VALUES = 1000
+
+_ORDERED_TYPES = (int, float, decimal.Decimal, str, datetime.date, datetime.datetime)
+
+def _coercer(column) -> Optional[Callable[[Any], Any]]:
+    """Value converter for the column's type; None for types that only support is_null."""
+    if isinstance(column.type, Enum): # Before str: Enum is a String
+        enum_class = column.type.enum_class
+        if enum_class is None:
+            choices = set(column.type.enums)
+            def to_choice(value: Any) -> str:
+                if value not in choices:
+                    raise ValueError(f"must be one of {sorted(choices)}")
+                return value
+            return to_choice
+        by_key = {**{m.value: m for m in enum_class}, **{m.name: m for m in enum_class}}
+        def to_member(value: Any):
+            if not isinstance(value, str) or value not in by_key:
+                raise ValueError(f"must be one of {sorted(m.name for m in enum_class)}")
+            return by_key[value]
+        return to_member
+    try:
+        python_type = column.type.python_type
+    except NotImplementedError:
+        return None
+    if python_type is bool:
+        def to_bool(value: Any) -> bool:
+            if not isinstance(value, bool):
+                raise ValueError("must be true or false")
+            return value
+        return to_bool
+    if python_type is int:
+        def to_int(value: Any) -> int:
+            if isinstance(value, bool) or not isinstance(value, int):
+                raise ValueError("must be an integer")
+            return value
+        return to_int
+    if python_type in (float, decimal.Decimal):
+        def to_number(value: Any):
+            if isinstance(value, bool) or not isinstance(value, (int, float, str)):
+                raise ValueError("must be a number")
+            try:
+                number = decimal.Decimal(str(value))
+            except decimal.InvalidOperation:
+                raise ValueError("must be a number") from None
+            if not number.is_finite():
+                raise ValueError("must be a finite number")
+            return float(number) if python_type is float else number
+        return to_number
+    if python_type is str:
+        def to_str(value: Any) -> str:
+            if not isinstance(value, str):
+                raise ValueError("must be a string")
+            return value
+        return to_str
+    if python_type in (datetime.date, datetime.datetime):
+        def to_temporal(value: Any):
+            if not isinstance(value, str):
+                raise ValueError("must be an ISO 8601 string")
+            return python_type.fromisoformat(value)
+        return to_temporal
+    return None
+
+
+def _leaf(table: Table, node: Dict[str, Any], values: List[Any]) -> Tuple:
+    unknown = set(node) - {"column", "op", "value"}
+    if unknown:
+        raise ValueError(f"Unknown filter keys: {sorted(unknown)}")
+    name, op, value = node.get("column"), node.get("op"), node.get("value")
+    if not isinstance(name, str) or name not in table.columns:
+        raise ValueError(f"Invalid filter column: {name}")
+    if op not in OPERATORS:
+        raise ValueError(f"Invalid filter operator for '{name}': {op}. Use one of {sorted(OPERATORS)}.")
+    column = table.columns[name]
+
+    if op == "is_null":
+        if not isinstance(value, bool):
+            raise ValueError(f"'{name}' is_null takes true or false.")
+        return ("is_null", name, value)
+
+    coerce = _coercer(column)
+    if coerce is None:
+        raise ValueError(f"Column '{name}' ({column.type}) only supports is_null.")
+    if op in ORDERED_OPERATORS and (isinstance(column.type, Enum) or column.type.python_type not in _ORDERED_TYPES):
+        raise ValueError(f"Column '{name}' ({column.type}) does not support {op}.")
+    if op == "ilike" and (isinstance(column.type, Enum) or column.type.python_type is not str):
+        raise ValueError(f"Column '{name}' ({column.type}) does not support ilike.")
+
+    def convert(item: Any) -> Any:
+        try:
+            return coerce(item)
+        except (TypeError, ValueError) as e:
+            raise ValueError(f"Invalid value for '{name}': {e}") from None
+
+    if op == "in":
+        if not isinstance(value, list) or not 0 < len(value) <= MAX_IN_VALUES:
+            raise ValueError(f"'{name}' in takes a list of 1 to {MAX_IN_VALUES} values.")
+        values.append([convert(item) for item in value])
+        return ("in", name)
+    if op == "range":
+        if not isinstance(value, list) or len(value) != 2 or value == [None, None]:
+            raise ValueError(f"'{name}' range takes [low, high]; one end may be null.")
+        bounds = tuple(item is not None for item in value)
+        values.extend(convert(item) for item in value if item is not None)
+        return ("range", name, bounds)
+    if value is None:
+        raise ValueError(f"'{name}' {op} needs a value; use is_null for NULL.")
+    values.append(convert(value))
+    return (op, name)
+
+
+def _parse(table: Table, node: Any, values: List[Any], depth: int, budget: List[int]) -> Tuple:
+    if not isinstance(node, dict):
+        raise ValueError("A filter must be a JSON object.")
+    if depth > MAX_FILTER_DEPTH:
+        raise ValueError(f"Filters nest at most {MAX_FILTER_DEPTH} levels deep.")
+    group = [key for key in ("and", "or") if key in node]
+    if group:
+        if len(node) != 1:
+            raise ValueError("An and/or group takes no other keys.")
+        children = node[group[0]]
+        if not isinstance(children, list) or not children:
+            raise ValueError(f"'{group[0]}' takes a non-empty list of filters.")
+        return (group[0], tuple(_parse(table, child, values, depth + 1, budget) for child in children))
+    budget[0] -= 1
+    if budget[0] < 0:
+        raise ValueError(f"Filters take at most {MAX_FILTER_CONDITIONS} conditions.")
+    return _leaf(table, node, values)
+
+
+def _build(table: Table, shape: Tuple, names: List[str]) -> ColumnElement:
+    kind = shape[0]
+    if kind in ("and", "or"):
+        combine = and_ if kind == "and" else or_
+        return combine(*(_build(table, child, names) for child in shape[1]))
+    column = table.columns[shape[1]]
+
+    def param(**kw):
+        name = f"filter_{len(names)}"
+        names.append(name)
+        return bindparam(name, type_=column.type, **kw)
+
+    if kind == "is_null":
+        return column.is_(None) if shape[2] else column.is_not(None)
+    if kind == "in":
+        return column.in_(param(expanding=True))
+    if kind == "ilike":
+        return column.ilike(param())
+    if kind == "range":
+        low, high = shape[2]
+        conditions = ([column >= param()] if low else []) + ([column <= param()] if high else [])
+        return and_(*conditions)
+    return COMPARISONS[kind](column, param())
+
+
+@lru_cache(maxsize=256)
+def _compile(table: Table, shape: Tuple) -> Tuple[ColumnElement, Tuple[str, ...]]:
+    names: List[str] = []
+    predicate = _build(table, shape, names)
+    return predicate, tuple(names)
+
+
+def compile_filter(table: Table, spec: Any) -> ColumnElement:
+    """
+    Validate a filter (see the grammar above) against `table`'s columns and return it as a
+    WHERE predicate with every value bound as a typed parameter.
+
+    Values are checked and converted for their column's type (enums accept a member's name
+    or value, dates and timestamps ISO 8601 strings). Predicates are compiled once per
+    filter shape - the structure with the values left out - so a table browsed with the
+    same filter and different values reuses both the predicate and SQLAlchemy's cached SQL.
+    Raises ValueError for an invalid filter.
+    """
+    values: List[Any] = []
+    shape = _parse(table, spec, values, 0, [MAX_FILTER_CONDITIONS])
+    predicate, names = _compile(table, shape)
+    return predicate.params(dict(zip(names, values)))
@@ -0,0 +1,91 @@
+# backend/app/utils/query_plan.py
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+# Summary of an `EXPLAIN (FORMAT JSON)` plan, with or without ANALYZE.
+
+ESTIMATE_MISS_FACTOR = 10 # Actual vs estimated rows off by at least this much
+TOP_NODES = 5
+
+def _walk(node: Dict[str, Any], depth: int = 0) -> Iterator[Tuple[Dict[str, Any], int]]:
+    yield node, depth
+    for child in node.get("Plans", []):
+        yield from _walk(child, depth + 1)
+
+
+def _label(node: Dict[str, Any]) -> str:
+    label = node["Node Type"]
+    if node.get("Relation Name"):
+        label += f" on {node['Relation Name']}"
+        if node.get("Alias") and node["Alias"] != node["Relation Name"]:
+            label += f" {node['Alias']}"
+    if node.get("Index Name"):
+        label += f" using {node['Index Name']}"
+    return label
+
+
+def _inclusive_ms(node: Dict[str, Any]) -> Optional[float]:
+    if "Actual Total Time" not in node:
+        return None
+    return node["Actual Total Time"] * node.get("Actual Loops", 1)
+
+
+def summarize_plan(explained: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Digest one EXPLAIN JSON document (the first element of its result array):
+
+    - `slowest_nodes`: nodes by exclusive time (their own time, children excluded), or by
+      exclusive cost without ANALYZE
+    - `seq_scans`: sequential scans with their filter and rows read/removed
+    - `estimate_misses`: nodes whose actual row count is ESTIMATE_MISS_FACTOR times off the
+      planner's estimate (ANALYZE only), the usual sign of stale or missing statistics
+    """
+    root = explained["Plan"]
+    analyzed = "Actual Total Time" in root
+    time_key = "exclusive_ms" if analyzed else "exclusive_cost"
+    nodes: List[Dict[str, Any]] = []
+    seq_scans: List[Dict[str, Any]] = []
+    misses: List[Dict[str, Any]] = []
+
+    for node, depth in _walk(root):
+        children = node.get("Plans", [])
+        if analyzed:
+            own = (_inclusive_ms(node) or 0.0) - sum(_inclusive_ms(child) or 0.0 for child in children)
+        else:
+            own = node["Total Cost"] - sum(child["Total Cost"] for child in children)
+        loops = node.get("Actual Loops", 1)
+        entry = {"node": _label(node), "depth": depth, time_key: round(max(own, 0.0), 3)}
+        if analyzed:
+            entry["rows"] = node.get("Actual Rows", 0) * loops
+        nodes.append(entry)
+
+        if node["Node Type"] == "Seq Scan":
+            scan = {"relation": node.get("Relation Name"), "filter": node.get("Filter")}
+            if analyzed:
+                scan["rows"] = node.get("Actual Rows", 0) * loops
+                scan["rows_removed_by_filter"] = node.get("Rows Removed by Filter", 0) * loops
+            else:
+                scan["estimated_rows"] = node.get("Plan Rows")
+            seq_scans.append(scan)
+
+        if analyzed and loops:
+            estimated = node.get("Plan Rows", 0) * loops
+            actual = node.get("Actual Rows", 0) * loops
+            low, high = sorted((max(estimated, 1), max(actual, 1)))
+            if high >= low * ESTIMATE_MISS_FACTOR:
+                misses.append({"node": _label(node), "depth": depth, "estimated_rows": estimated, "actual_rows": actual})
+
+    summary: Dict[str, Any] = {
+        "analyzed": analyzed,
+        "total_cost": root["Total Cost"],
+        "slowest_nodes": sorted(nodes, key=lambda entry: entry[time_key], reverse=True)[:TOP_NODES],
+        "seq_scans": seq_scans,
+        "estimate_misses": sorted(misses, key=lambda m: max(m["estimated_rows"], m["actual_rows"]), reverse=True)[:TOP_NODES],
+    }
+    if analyzed:
+        summary.update(
+            planning_ms=explained.get("Planning Time"),
+            execution_ms=explained.get("Execution Time"),
+            shared_hit_blocks=root.get("Shared Hit Blocks"),
+            shared_read_blocks=root.get("Shared Read Blocks"),
+        )
+    return summary
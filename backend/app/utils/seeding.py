@@ -1,6 +1,6 @@
 import random
 import datetime
-from typing import List, Optional, Dict, Any
+from typing import Any, Callable, Dict, List, Optional
 from faker import Faker # type: ignore
 from sqlalchemy.orm import Session
 from sqlalchemy import func
@@ -100,6 +100,8 @@ def create_dummy_profiles_with_details(db: Session, users: List[models.User]) ->
             # Removed: field_of_study, end_date, start_date as they are not in the current Education model
             db.add(models.Education(**education_data))
         created_profiles.append(profile)
+    db.flush()
+    crud.talent_pool.refresh_profiles(db, profile_ids=[p.id for p in created_profiles])
     db.commit()
     return created_profiles
 
@@ -123,6 +125,8 @@ def create_dummy_publications(db: Session, profiles: List[models.Profile], pubs_
             publication_obj = models.Publication(**pub_data) # MODIFIED
             db.add(publication_obj) # MODIFIED
             created_publications.append(publication_obj) # MODIFIED
+    db.flush()
+    crud.talent_pool.refresh_profiles(db, profile_ids=[p.id for p in researcher_profiles])
     db.commit()
     return created_publications
 
@@ -245,10 +249,13 @@ def seed_all_sample_data(db: Session,
                         num_projects: int = 12,
                         pubs_per_profile_avg: int = 2,
                         apps_per_grant_avg: int = 3,
-                        apps_per_project_avg: int = 2
+                        apps_per_project_avg: int = 2,
+                        progress: Optional[Callable[[int, int, str], None]] = None # (step, steps, step name), e.g. a job's
                         ) -> Dict[str, Any]:
     print("Starting comprehensive data seeding...")
+    report = progress or (lambda step, steps, name: None)
 
+    report(0, 7, "users")
     users = create_dummy_users(db, count=num_users)
     if not users: return {"message": "Failed to create users, seeding aborted."}
     
@@ -267,13 +274,20 @@ def seed_all_sample_data(db: Session,
     ]
     if not potential_proposers_creators: potential_proposers_creators = users # fallback
 
+    report(1, 7, "profiles")
     profiles = create_dummy_profiles_with_details(db, users=users)
+    report(2, 7, "publications")
     publications = create_dummy_publications(db, profiles=profiles, pubs_per_profile_avg=pubs_per_profile_avg)
+    report(3, 7, "grants")
     grants = create_dummy_grants(db, proposer_users=potential_proposers_creators, count=num_grants)
+    report(4, 7, "projects")
     projects = create_dummy_projects(db, creator_users=potential_proposers_creators, grants=grants, count=num_projects)
     
+    report(5, 7, "grant applications")
     grant_applications = create_dummy_grant_applications(db, grants=grants, applicant_users=researcher_student_users, apps_per_grant_avg=apps_per_grant_avg)
+    report(6, 7, "project applications")
     project_applications = create_dummy_project_applications(db, projects=projects, applicant_users=researcher_student_users, apps_per_project_avg=apps_per_project_avg)
+    report(7, 7, "done")
 
     print("Comprehensive data seeding completed.")
     return {
@@ -0,0 +1,28 @@
+# backend/app/utils/text.py
+import re
+from typing import Iterable, List, Optional
+
+# Small English stop-word list; enough to keep function words out of TF-IDF / search vocabularies.
+STOP_WORDS = frozenset("""
+a about above after again against all also am an and any are as at be because been before being
+below between both but by can could did do does doing down during each few for from further had
+has have having he her here hers herself him himself his how i if in into is it its itself just
+me more most my myself no nor not now of off on once only or other our ours ourselves out over
+own same she should so some such than that the their theirs them themselves then there these they
+this those through to too under until up very was we were what when where which while who whom
+why will with would you your yours yourself yourselves
+""".split())
+
+_TOKEN_RE = re.compile(r"[a-z0-9][a-z0-9+#]*")
+
+def tokenize(text: Optional[str]) -> List[str]:
+    """Lower-case word tokens with stop words and single characters removed."""
+    if not text:
+        return []
+    return [t for t in _TOKEN_RE.findall(text.lower()) if len(t) > 1 and t not in STOP_WORDS]
+
+def tokenize_all(texts: Iterable[Optional[str]]) -> List[str]:
+    tokens: List[str] = []
+    for text in texts:
+        tokens.extend(tokenize(text))
+    return tokens